@@ -1,90 +1,425 @@
 from database import db
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
+from chart_rendering import render_bar_chart, render_bar_grid, render_line_grid
+from datetime import datetime, date, timedelta
 import calendar
+import numpy as np
+from dimension_cache import get_dimension
+from statements import DIMENSIONS
+
+# Reports fetch their results as columns (fetchnumpy) and build tables and
+# charts from the arrays directly instead of per-row Python tuples. Text
+# columns are COALESCEd in SQL so the arrays never need masking.
+
+def text_column(values, width):
+    # Fixed-width text for a whole column, truncating long values with '..'
+    text = np.asarray(values).astype(str)
+    too_long = np.char.str_len(text) > width
+    return np.where(too_long, np.char.add(text.astype(f'<U{width - 2}'), '..'), text)
+
+def print_columns(columns, spec):
+    # Numbered table from result columns; spec is [(header, column, width)]
+    header_str = " | ".join([f"{'#':<3}"] + [f"{header:<{width}}" for header, _, width in spec])
+    print(header_str)
+    print("-" * len(header_str))
+    
+    cells = [text_column(columns[name], width) for _, name, width in spec]
+    widths = [width for _, _, width in spec]
+    for i, row in enumerate(zip(*cells), 1):
+        print(" | ".join([f"{i:<3}"] + [f"{val:<{width}}" for val, width in zip(row, widths)]))
+
+def slice_columns(columns, mask):
+    return {name: values[mask] for name, values in columns.items()}
+
+# Dimensions shown as columns beside each item in the per-dimension reports;
+# the analyzed dimension's own column is left out
+DETAIL_DIMENSIONS = ('category', 'color', 'brand')
+
+def dimension_config(dimension, extra_cols=()):
+    # Table, id column, label and item columns of a per-dimension report
+    table, id_col, _ = DIMENSIONS[dimension]
+    return {'table': table, 'id': id_col, 'label': dimension.capitalize(),
+            'cols': ['Item Name'] + [d.capitalize() for d in DETAIL_DIMENSIONS if d != dimension]
+                    + list(extra_cols)}
+
+def print_dimension_options(template="{label}"):
+    # Menu options 1..len(DIMENSIONS), e.g. "2. Color distribution" from
+    # "{label} distribution" ({name} is the lower-case name)
+    for i, dimension in enumerate(DIMENSIONS, 1):
+        print(f"{i}. {template.format(label=dimension.capitalize(), name=dimension)}")
+
+def dimension_choice(choice):
+    # The dimension picked by a print_dimension_options() number, or None
+    dimensions = list(DIMENSIONS)
+    if choice.isdigit() and 1 <= int(choice) <= len(dimensions):
+        return dimensions[int(choice) - 1]
+    return None
+
+def fetch_cost_per_wear(db, user_id, id_col=None, selected_id=None):
+    # CPW, ownership duration and ordering for a user's items in one query,
+    # optionally limited to one dimension value (e.g. 'brand_id', 3).
+    # Never-worn items show "No wears" and sort after every worn item.
+    where, params = "", [user_id]
+    if id_col is not None:
+        where = f"AND i.{id_col} = ?"
+        params.append(selected_id)
+
+    return db.execute(f"""
+        WITH owned AS (
+            SELECT 
+                i.name,
+                COALESCE(cat.name, 'N/A') as category,
+                COALESCE(i.price, 0) as price,
+                COALESCE(st.wear_count, 0) as wear_count,
+                COALESCE(st.wear_count, 0) = 0 as never_worn,
+                COALESCE(st.cost_per_wear, 0) as cost_per_wear,
+                i.purchase_date,
+                greatest(date_sub('month', i.purchase_date, current_date), 0) as months_owned
+            FROM Clothing_Items i
+            LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+            LEFT JOIN Categories cat ON i.category_id = cat.category_id
+            WHERE i.user_id = ? {where}
+        )
+        SELECT 
+            name,
+            category,
+            printf('$%.2f', price) as price,
+            wear_count,
+            CASE WHEN never_worn THEN 'No wears' ELSE printf('$%.2f', cost_per_wear) END as cpw,
+            CASE 
+                WHEN purchase_date IS NULL THEN 'N/A'
+                WHEN months_owned = 0 THEN date_diff('day', purchase_date, current_date) || ' days'
+                WHEN months_owned < 12 THEN months_owned || ' months'
+                ELSE (months_owned // 12) || ' yrs ' || (months_owned % 12) || ' mos'
+            END as duration
+        FROM owned
+        ORDER BY never_worn, cost_per_wear, owned.price, name
+    """, params).fetchnumpy()
+
+def fetch_neglected_items(db, user_id, idle_days, limit):
+    # Items not worn in the last idle_days days, ranked by idle days times
+    # price so expensive forgotten items come first. Never-worn items count
+    # as idle since purchase (items without a purchase date are skipped).
+    #
+    # The stale rows come from the last_worn index: DuckDB only range-scans
+    # an index when its column is the scan's sole filter, so the CTE is
+    # MATERIALIZED to keep the user filter from being pushed into it.
+    cutoff = date.today() - timedelta(days=idle_days)
+    return db.execute("""
+        WITH stale AS MATERIALIZED (
+            SELECT item_id, user_id, last_worn
+            FROM Item_Wear_Stats
+            WHERE last_worn < CAST(? AS DATE)
+        ),
+        idle AS (
+            SELECT item_id, last_worn FROM stale WHERE user_id = ?
+            UNION ALL
+            SELECT item_id, NULL FROM Item_Wear_Stats WHERE user_id = ? AND wear_count = 0
+        ),
+        ranked AS (
+            SELECT
+                i.name,
+                COALESCE(cat.name, 'N/A') as category,
+                i.price,
+                idle.last_worn,
+                CAST(current_date - COALESCE(idle.last_worn, i.purchase_date) AS INTEGER) as idle_days
+            FROM idle
+            JOIN Clothing_Items i ON idle.item_id = i.item_id
+            LEFT JOIN Categories cat ON i.category_id = cat.category_id
+            WHERE COALESCE(idle.last_worn, i.purchase_date) < CAST(? AS DATE)
+        )
+        SELECT
+            name,
+            category,
+            COALESCE(printf('$%.2f', price), 'N/A') as price,
+            COALESCE(CAST(last_worn AS VARCHAR), 'Never') as last_worn,
+            idle_days,
+            printf('%.0f', idle_days * COALESCE(price, 0)) as idle_value
+        FROM ranked
+        ORDER BY idle_days * COALESCE(price, 0) DESC, idle_days DESC, name
+        LIMIT ?
+    """, [cutoff, user_id, user_id, cutoff, limit]).fetchnumpy()
+
+def neglected_items(db, user_id):
+    idle_days = input("\nShow items not worn in the last how many days? (default 90): ").strip()
+    limit = input("How many items to list? (default 20): ").strip()
+    try:
+        idle_days = int(idle_days) if idle_days else 90
+        limit = int(limit) if limit else 20
+    except ValueError:
+        print("Please enter a number.")
+        return
+    if idle_days < 1 or limit < 1:
+        print("Both numbers must be at least 1.")
+        return
+
+    results = fetch_neglected_items(db, user_id, idle_days, limit)
+    if len(results['name']) == 0:
+        print(f"\nEvery item has been worn in the last {idle_days} days.")
+        return
+
+    print(f"\nNeglected items (not worn in {idle_days}+ days, idle days x price):\n")
+    print_columns(results, [
+        ('Item Name', 'name', 20),
+        ('Category', 'category', 12),
+        ('Price', 'price', 10),
+        ('Last Worn', 'last_worn', 10),
+        ('Idle Days', 'idle_days', 9),
+        ('Idle Value', 'idle_value', 10),
+    ])
+
+    render_bar_chart('Neglected Items', results['name'], results['idle_days'],
+                     xlabel='Item', ylabel='Days Since Last Worn', color='salmon',
+                     rotation=45, ha='right')
+
+# GROUPING_ID(category, color, size, brand) of each grouping set in the
+# wear summary; a set's bit is 0 for the column it groups by
+SUMMARY_LEVELS = {7: 'Category', 11: 'Color', 13: 'Size', 14: 'Brand', 15: 'Total'}
+
+def wear_summary(db, user_id):
+    # Wear totals by category, color, size and brand plus the grand total,
+    # all from one scan of the user's items and their wear stats
+    results = db.execute("""
+        SELECT 
+            GROUPING_ID(cat.name, c.name, s.name, b.name) as level,
+            COALESCE(CASE 
+                WHEN GROUPING(cat.name) = 0 THEN cat.name
+                WHEN GROUPING(c.name) = 0 THEN c.name
+                WHEN GROUPING(s.name) = 0 THEN s.name
+                WHEN GROUPING(b.name) = 0 THEN b.name
+                ELSE 'All items'
+            END, 'N/A') as value,
+            COUNT(*) as item_count,
+            CAST(SUM(COALESCE(st.wear_count, 0)) AS BIGINT) as wear_count,
+            COALESCE(printf('%.1f%%', 100.0 * SUM(COALESCE(st.wear_count, 0)) / NULLIF(
+                SUM(SUM(COALESCE(st.wear_count, 0))) OVER (
+                    PARTITION BY GROUPING_ID(cat.name, c.name, s.name, b.name)), 0)), '-') as share
+        FROM Clothing_Items i
+        LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+        LEFT JOIN Categories cat ON i.category_id = cat.category_id
+        LEFT JOIN Colors c ON i.color_id = c.color_id
+        LEFT JOIN Sizes s ON i.size_id = s.size_id
+        LEFT JOIN Brands b ON i.brand_id = b.brand_id
+        WHERE i.user_id = ?
+        GROUP BY GROUPING SETS ((cat.name), (c.name), (s.name), (b.name), ())
+        ORDER BY level, wear_count DESC, value
+    """, [user_id]).fetchnumpy()
+
+    if len(results['level']) == 0:
+        print("\nNo items found.")
+        return
+
+    total = slice_columns(results, results['level'] == 15)
+    print(f"\nWear summary: {total['wear_count'][0]} wears across {total['item_count'][0]} items")
+
+    panels = []
+    for level, label in SUMMARY_LEVELS.items():
+        if level == 15:
+            continue
+        group = slice_columns(results, results['level'] == level)
+        print(f"\nBy {label}:")
+        print_columns(group, [
+            (label, 'value', 15),
+            ('Items', 'item_count', 6),
+            ('Wears', 'wear_count', 6),
+            ('Share', 'share', 6),
+        ])
+        panels.append((f'By {label}', group['value'], group['wear_count']))
+
+    render_bar_grid('Wear Summary - All Dimensions', panels, ylabel='Wear Count')
+
+# Rolling windows (days) of the wear trends report, the days it charts and
+# how many of the most worn values get a line
+TREND_WINDOWS = (7, 30, 90)
+TREND_DAYS = 365
+TREND_LINES_SHOWN = 8
+
+def fetch_wear_trends(db, user_id, dimension):
+    # Rolling 7/30/90-day wear totals for each value of a dimension (e.g.
+    # 'brand'), summed from the daily item rows of Wear_Rollups instead of
+    # the wear logs. Returns (columns, rolling): columns holds each value's name,
+    # latest totals and 30-day change, most worn first; rolling maps a window
+    # to a (value, day) array over the last TREND_DAYS days in the same order
+    table, id_col, _ = DIMENSIONS[dimension]
+
+    # Enough days before the charted range to fill the longest window
+    span = TREND_DAYS + max(TREND_WINDOWS) - 1
+    today = date.today()
+    start = today - timedelta(days=span - 1)
+    results = db.execute(f"""
+        SELECT i.{id_col} as member_id, COALESCE(d.name, 'N/A') as name,
+               CAST(r.bucket - CAST(? AS DATE) AS INTEGER) as day, SUM(r.wear_count) as wear_count
+        FROM Wear_Rollups r
+        JOIN Clothing_Items i ON r.member_id = i.item_id
+        LEFT JOIN {table} d ON i.{id_col} = d.{id_col}
+        WHERE r.user_id = ? AND r.dimension = 'item' AND r.grain = 'day'
+          AND r.bucket BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)
+        GROUP BY ALL
+    """, [start, user_id, start, today]).fetchnumpy()
+
+    # One row of daily wears per value; a rolling total is the difference of
+    # two points on the running sum
+    members, first, member = np.unique(results['member_id'], return_index=True, return_inverse=True)
+    daily = np.zeros((len(members), span), dtype=np.int64)
+    np.add.at(daily, (member, results['day']), results['wear_count'])
+    running = np.concatenate([np.zeros((len(members), 1), dtype=np.int64),
+                              np.cumsum(daily, axis=1)], axis=1)
+
+    names = results['name'][first]
+    longest = running[:, -1] - running[:, -1 - max(TREND_WINDOWS)]
+    order = np.lexsort((names, -longest))
+    rolling = {window: (running[order, window:] - running[order, :-window])[:, -TREND_DAYS:]
+               for window in TREND_WINDOWS}
+
+    columns = {'name': names[order]}
+    for window in TREND_WINDOWS:
+        columns[f'last_{window}'] = rolling[window][:, -1]
+    change = rolling[30][:, -1] - rolling[30][:, -31]
+    columns['change'] = np.char.add(np.where(change > 0, '+', ''), change.astype(str))
+    return columns, rolling
+
+def wear_trends(db, user_id):
+    dimensions = list(DIMENSIONS)
+    print("\nShow trends by:")
+    for i, dimension in enumerate(dimensions, 1):
+        print(f"{i}. {dimension.capitalize()}")
+    choice = input("\nEnter your choice: ")
+    if not choice.isdigit() or not 1 <= int(choice) <= len(dimensions):
+        print("Invalid choice.")
+        return
+    dimension = dimensions[int(choice) - 1]
+    label = dimension.capitalize()
+
+    columns, rolling = fetch_wear_trends(db, user_id, dimension)
+    if len(columns['name']) == 0:
+        print(f"\nNo wears logged in the last {TREND_DAYS + max(TREND_WINDOWS) - 1} days.")
+        return
+
+    print(f"\nWear trends by {label.lower()} (wears in the last N days):\n")
+    print_columns(columns, [(label, 'name', 15)]
+                  + [(f'{window} days', f'last_{window}', 8) for window in TREND_WINDOWS]
+                  + [('vs prev 30', 'change', 10)])
+
+    today = np.datetime64(date.today())
+    days = np.arange(today - (TREND_DAYS - 1), today + 1)
+    shown = min(len(columns['name']), TREND_LINES_SHOWN)
+    panels = [(f'Rolling {window}-day wears',
+               dict(zip(columns['name'][:shown], rolling[window][:shown])))
+              for window in TREND_WINDOWS]
+    render_line_grid(f'Wear Trends - By {label}', days, panels, ylabel='Wears')
+
+def fetch_co_worn_items(db, user_id, limit):
+    # Pairs of items most often worn on the same day, from one self-join of
+    # the user's wear days (archived history included). overlap is the share
+    # of the less-worn item's wear days spent with the other item.
+    return db.execute("""
+        WITH worn AS (
+            SELECT DISTINCT item_id, wear_date
+            FROM Wear_History
+            WHERE user_id = ?
+        ),
+        days AS (
+            SELECT item_id, COUNT(*) as day_count FROM worn GROUP BY item_id
+        ),
+        pairs AS (
+            SELECT a.item_id as first_id, b.item_id as second_id, COUNT(*) as together
+            FROM worn a
+            JOIN worn b ON a.wear_date = b.wear_date AND a.item_id < b.item_id
+            GROUP BY ALL
+            ORDER BY together DESC, first_id, second_id
+            LIMIT ?
+        )
+        SELECT
+            i1.name as first_item,
+            i2.name as second_item,
+            p.together,
+            printf('%.0f%%', 100.0 * p.together / least(d1.day_count, d2.day_count)) as overlap
+        FROM pairs p
+        JOIN Clothing_Items i1 ON p.first_id = i1.item_id
+        JOIN Clothing_Items i2 ON p.second_id = i2.item_id
+        JOIN days d1 ON p.first_id = d1.item_id
+        JOIN days d2 ON p.second_id = d2.item_id
+        ORDER BY p.together DESC, first_item, second_item
+    """, [user_id, limit]).fetchnumpy()
+
+CO_WORN_SHOWN = 20
+
+def co_worn_items(db, user_id):
+    results = fetch_co_worn_items(db, user_id, CO_WORN_SHOWN)
+    if len(results['first_item']) == 0:
+        print("\nNo items have been worn on the same day yet.")
+        return
+
+    print("\nItems most often worn together (same day):\n")
+    print_columns(results, [
+        ('Item', 'first_item', 20),
+        ('Worn With', 'second_item', 20),
+        ('Days', 'together', 6),
+        ('Overlap', 'overlap', 7),
+    ])
+
+    labels = np.char.add(np.char.add(text_column(results['first_item'], 12), ' + '),
+                         text_column(results['second_item'], 12))
+    render_bar_chart('Items Worn Together', labels, results['together'],
+                     xlabel='Pair', ylabel='Days Worn Together', color='mediumpurple',
+                     rotation=45, ha='right')
+
+def fetch_item_wear_counts(db, user_id):
+    # Every item of the user with its wear count, most worn first
+    return db.execute("""
+        SELECT 
+            i.name as item_name,
+            COALESCE(c.name, 'N/A') as color_name,
+            COALESCE(b.name, 'N/A') as brand_name,
+            COALESCE(printf('$%.2f', i.price), 'N/A') as price,
+            COALESCE(st.wear_count, 0) as wear_count
+        FROM Clothing_Items i
+        LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+        LEFT JOIN Colors c ON i.color_id = c.color_id
+        LEFT JOIN Brands b ON i.brand_id = b.brand_id
+        WHERE i.user_id = ?
+        ORDER BY wear_count DESC
+    """, [user_id]).fetchnumpy()
 
 def wear_count_analytics(db, user_id):
     print("\nAnalyze by:")
     print("0. Back to Main Menu")
-    print("1. Category")
-    print("2. Color")
-    print("3. Size")
-    print("4. Brand")
-    print("5. All Items")
+    print_dimension_options()
+    n = len(DIMENSIONS)
+    print(f"{n + 1}. All Items")
+    print(f"{n + 2}. Summary across all dimensions")
+    print(f"{n + 3}. Wear trends over time")
+    print(f"{n + 4}. Items most often worn together")
     
     analysis_type = input("\nEnter your choice: ")
     
     try:
         if analysis_type == '0':
             return
-        elif analysis_type == '5':  # All items
-            results = db.execute("""
-                SELECT 
-                    i.name as item_name,
-                    c.name as color_name,
-                    b.name as brand_name,
-                    i.price,
-                    COUNT(w.wear_id) as wear_count
-                FROM Clothing_Items i
-                LEFT JOIN Wear_Logs w ON i.item_id = w.item_id
-                LEFT JOIN Colors c ON i.color_id = c.color_id
-                LEFT JOIN Brands b ON i.brand_id = b.brand_id
-                WHERE i.user_id = ?
-                GROUP BY i.item_id, i.name, c.name, b.name, i.price
-                ORDER BY wear_count DESC
-            """, [user_id]).fetchall()
+        elif analysis_type == str(n + 1):  # All items
+            results = fetch_item_wear_counts(db, user_id)
             
-            if not results:
+            if len(results['item_name']) == 0:
                 print("\nNo items found.")
                 return
             
-            print("\nWear counts for all items:")
-            # Header
-            header = f"{'#':<3} | {'Item Name':<20} | {'Color':<10} | {'Brand':<10} | {'Price':<10} | {'Wear Count':<10}"
-            print("\n" + header)
-            print("-" * len(header))
-            
-            plot_data = []
-            for i, row in enumerate(results, 1):
-                item_name = (row[0][:17] + '..') if len(row[0]) > 17 else row[0]
-                color = row[1] if row[1] else "N/A"
-                brand = row[2] if row[2] else "N/A"
-                price = f"${row[3]:.2f}" if row[3] is not None else "N/A"
-                count = row[4]
-                
-                print(f"{i:<3} | {item_name:<20} | {color:<10} | {brand:<10} | {price:<10} | {count:<10}")
-                plot_data.append((row[0], count))
+            print("\nWear counts for all items:\n")
+            print_columns(results, [
+                ('Item Name', 'item_name', 20),
+                ('Color', 'color_name', 10),
+                ('Brand', 'brand_name', 10),
+                ('Price', 'price', 10),
+                ('Wear Count', 'wear_count', 10),
+            ])
             
-            if plot_data:
-                names = [x[0] for x in plot_data]
-                counts = [x[1] for x in plot_data]
+            render_bar_chart('Wear Counts - All Items', results['item_name'], results['wear_count'],
+                             xlabel='Item', ylabel='Wear Count',
+                             rotation=45, ha='right')
                 
-                plt.figure(figsize=(12, 6))
-                plt.bar(names, counts, color='skyblue')
-                plt.title('Wear Counts - All Items')
-                plt.xlabel('Item')
-                plt.ylabel('Wear Count')
-                plt.xticks(rotation=45, ha='right')
-                plt.tight_layout()
-                plt.show()
-                
-        elif analysis_type in ['1', '2', '3', '4']:
-            # Configuration
-            config = {
-                '1': {'table': 'Categories', 'id': 'category_id', 'label': 'Category', 
-                      'cols': ['Item Name', 'Color', 'Brand', 'Wear Count']},
-                '2': {'table': 'Colors', 'id': 'color_id', 'label': 'Color',
-                      'cols': ['Item Name', 'Category', 'Brand', 'Wear Count']},
-                '3': {'table': 'Sizes', 'id': 'size_id', 'label': 'Size',
-                      'cols': ['Item Name', 'Category', 'Color', 'Brand', 'Wear Count']},
-                '4': {'table': 'Brands', 'id': 'brand_id', 'label': 'Brand',
-                      'cols': ['Item Name', 'Category', 'Color', 'Wear Count']}
-            }
-            
-            conf = config[analysis_type]
+        elif dimension_choice(analysis_type):
+            conf = dimension_config(dimension_choice(analysis_type), ['Wear Count'])
             
             # 1. Select the specific dimension value (Drill-down)
-            dims = db.execute(f"SELECT {conf['id']}, name FROM {conf['table']} WHERE user_id = ?", [user_id]).fetchall()
+            dims = get_dimension(user_id, conf['table'])
             if not dims:
                 print(f"No {conf['label'].lower()}s found.")
                 return
@@ -111,85 +446,50 @@ def wear_count_analytics(db, user_id):
             results = db.execute(f"""
                 SELECT 
                     i.name as item_name,
-                    cat.name as category_name,
-                    c.name as color_name,
-                    b.name as brand_name,
-                    s.name as size_name,
-                    COUNT(w.wear_id) as wear_count
+                    COALESCE(cat.name, 'N/A') as category_name,
+                    COALESCE(c.name, 'N/A') as color_name,
+                    COALESCE(b.name, 'N/A') as brand_name,
+                    COALESCE(s.name, 'N/A') as size_name,
+                    COALESCE(st.wear_count, 0) as wear_count
                 FROM Clothing_Items i
-                LEFT JOIN Wear_Logs w ON i.item_id = w.item_id
+                LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
                 LEFT JOIN Categories cat ON i.category_id = cat.category_id
                 LEFT JOIN Colors c ON i.color_id = c.color_id
                 LEFT JOIN Brands b ON i.brand_id = b.brand_id
                 LEFT JOIN Sizes s ON i.size_id = s.size_id
                 WHERE i.user_id = ? AND i.{conf['id']} = ?
-                GROUP BY i.item_id, i.name, cat.name, c.name, b.name, s.name
                 ORDER BY wear_count DESC
-            """, [user_id, selected_id]).fetchall()
+            """, [user_id, selected_id]).fetchnumpy()
 
-            if not results:
+            if len(results['item_name']) == 0:
                 print(f"No items found for {conf['label']}: {selected_name}.")
                 return
 
-            print(f"\nWear counts for {conf['label']}: {selected_name}")
-            
-            # Prepare Header
-            # Columns map to result indices: 0:Name, 1:Cat, 2:Color, 3:Brand, 4:Size, 5:Count
-            # We construct the table based on conf['cols']
+            print(f"\nWear counts for {conf['label']}: {selected_name}\n")
             
-            # Mapping col name to (header_text, width, result_index)
+            # Mapping col name to (header_text, result column, width)
             col_def = {
-                'Item Name': ('Item Name', 20, 0),
-                'Category': ('Category', 15, 1),
-                'Color': ('Color', 10, 2),
-                'Brand': ('Brand', 10, 3),
-                'Size': ('Size', 8, 4),
-                'Wear Count': ('Wear Count', 10, 5)
+                'Item Name': ('Item Name', 'item_name', 20),
+                'Category': ('Category', 'category_name', 15),
+                'Color': ('Color', 'color_name', 10),
+                'Brand': ('Brand', 'brand_name', 10),
+                'Size': ('Size', 'size_name', 8),
+                'Wear Count': ('Wear Count', 'wear_count', 10)
             }
-            
-            headers = ["#  "]
-            widths = [3]
-            indices = []
-            
-            for col_name in conf['cols']:
-                h_text, width, idx = col_def[col_name]
-                headers.append(f"{h_text:<{width}}")
-                widths.append(width)
-                indices.append(idx)
-                
-            header_str = " | ".join(headers)
-            print("\n" + header_str)
-            print("-" * len(header_str))
-            
-            plot_data = []
-            for i, row in enumerate(results, 1):
-                row_parts = [f"{i:<3}"]
-                
-                # Fetch data for each column
-                for idx, width in zip(indices, widths[1:]): # skip # width
-                    val = row[idx]
-                    if val is None: val = "N/A"
-                    if isinstance(val, int): val = str(val)
-                    # Truncate if too long
-                    if len(val) > width:
-                        val = val[:width-2] + ".."
-                    row_parts.append(f"{val:<{width}}")
-                
-                print(" | ".join(row_parts))
-                plot_data.append((row[0], row[5])) # Name, Count
+            print_columns(results, [col_def[col_name] for col_name in conf['cols']])
 
-            if plot_data:
-                names = [x[0] for x in plot_data]
-                counts = [x[1] for x in plot_data]
-                
-                plt.figure(figsize=(12, 6))
-                plt.bar(names, counts, color='lightgreen')
-                plt.title(f'Wear Counts - {selected_name}')
-                plt.xlabel('Item')
-                plt.ylabel('Wear Count')
-                plt.xticks(rotation=45, ha='right')
-                plt.tight_layout()
-                plt.show()
+            render_bar_chart(f'Wear Counts - {selected_name}', results['item_name'], results['wear_count'],
+                             xlabel='Item', ylabel='Wear Count', color='lightgreen',
+                             rotation=45, ha='right')
+        
+        elif analysis_type == str(n + 2):
+            wear_summary(db, user_id)
+        
+        elif analysis_type == str(n + 3):
+            wear_trends(db, user_id)
+        
+        elif analysis_type == str(n + 4):
+            co_worn_items(db, user_id)
         
         else:
             print("Invalid choice.")
@@ -197,133 +497,78 @@ def wear_count_analytics(db, user_id):
     except Exception as e:
         print(f"Error during analysis: {e}")
 
+def fetch_composition(db, user_id, table, id_col):
+    # Every item of the user with its value in one dimension table (e.g.
+    # 'Colors', 'color_id') and the item count per value and overall
+    return db.execute(f"""
+        SELECT 
+            d.name as dimension_name,
+            i.name as item_name,
+            COALESCE(cat.name, 'N/A') as category_name,
+            COALESCE(c.name, 'N/A') as color_name,
+            COALESCE(b.name, 'N/A') as brand_name,
+            COALESCE(s.name, 'N/A') as size_name,
+            COUNT(i.item_id) OVER (PARTITION BY d.{id_col}) as group_count,
+            COUNT(i.item_id) OVER () as total_count
+        FROM {table} d
+        JOIN Clothing_Items i ON d.{id_col} = i.{id_col}
+        LEFT JOIN Categories cat ON i.category_id = cat.category_id
+        LEFT JOIN Colors c ON i.color_id = c.color_id
+        LEFT JOIN Brands b ON i.brand_id = b.brand_id
+        LEFT JOIN Sizes s ON i.size_id = s.size_id
+        WHERE i.user_id = ?
+        ORDER BY group_count DESC, dimension_name, item_name
+    """, [user_id]).fetchnumpy()
+
 def wardrobe_composition_analytics(db, user_id):
     print("\nAnalyze by:")
     print("0. Back to Main Menu")
-    print("1. Category distribution")
-    print("2. Color distribution")
-    print("3. Size distribution")
-    print("4. Brand distribution")
+    print_dimension_options("{label} distribution")
     
     analysis_type = input("\nEnter your choice: ")
     
     try:
         if analysis_type == '0':
             return
-        if analysis_type in ['1', '2', '3', '4']:
-            config = {
-                '1': {'table': 'Categories', 'id': 'category_id', 'label': 'Category',
-                      'cols': ['Item Name', 'Color', 'Brand']},
-                '2': {'table': 'Colors', 'id': 'color_id', 'label': 'Color',
-                      'cols': ['Item Name', 'Category', 'Brand']},
-                '3': {'table': 'Sizes', 'id': 'size_id', 'label': 'Size',
-                      'cols': ['Item Name', 'Category', 'Color', 'Brand']},
-                '4': {'table': 'Brands', 'id': 'brand_id', 'label': 'Brand',
-                      'cols': ['Item Name', 'Category', 'Color']}
-            }
-            
-            conf = config[analysis_type]
+        if dimension_choice(analysis_type):
+            conf = dimension_config(dimension_choice(analysis_type))
             table = conf['table']
             id_col = conf['id']
             
-            # Query to get items with their dimension info
-            # We join all dimensions to get names for columns
-            query = f"""
-                SELECT 
-                    d.name as dimension_name,
-                    i.name as item_name,
-                    cat.name as category_name,
-                    c.name as color_name,
-                    b.name as brand_name,
-                    s.name as size_name,
-                    COUNT(i.item_id) OVER (PARTITION BY d.{id_col}) as group_count,
-                    COUNT(i.item_id) OVER () as total_count
-                FROM {table} d
-                JOIN Clothing_Items i ON d.{id_col} = i.{id_col}
-                LEFT JOIN Categories cat ON i.category_id = cat.category_id
-                LEFT JOIN Colors c ON i.color_id = c.color_id
-                LEFT JOIN Brands b ON i.brand_id = b.brand_id
-                LEFT JOIN Sizes s ON i.size_id = s.size_id
-                WHERE i.user_id = ?
-                ORDER BY group_count DESC, dimension_name, item_name
-            """
-            
-            results = db.execute(query, [user_id]).fetchall()
+            results = fetch_composition(db, user_id, table, id_col)
             
-            if not results:
+            if len(results['item_name']) == 0:
                 print(f"\nNo items found for {conf['label']} analysis.")
                 return
 
             print(f"\nWardrobe Composition by {conf['label']}:")
             
-            # Column definitions: (Header, Width, Index in Query Result)
+            # Column definitions: (Header, Result Column, Width)
             col_def = {
-                'Item Name': ('Item Name', 20, 1),
-                'Category': ('Category', 15, 2),
-                'Color': ('Color', 10, 3),
-                'Brand': ('Brand', 10, 4),
-                'Size': ('Size', 8, 5)
+                'Item Name': ('Item Name', 'item_name', 20),
+                'Category': ('Category', 'category_name', 15),
+                'Color': ('Color', 'color_name', 10),
+                'Brand': ('Brand', 'brand_name', 10),
+                'Size': ('Size', 'size_name', 8)
             }
+            spec = [col_def[col_name] for col_name in conf['cols']]
 
-            current_group = None
-            plot_data = {}
-            group_items_counter = 0
-            
-            # Pre-calculate headers for the chosen columns
-            headers = ["#  "]
-            widths = [3]
-            indices = []
-            for col_name in conf['cols']:
-                h_text, width, idx = col_def[col_name]
-                headers.append(f"{h_text:<{width}}")
-                widths.append(width)
-                indices.append(idx)
-            header_str = " | ".join(headers)
-            divider_str = "-" * len(header_str)
-
-            for row in results:
-                dim_name = row[0]
-                group_count = row[6]
-                total_count = row[7]
-                
-                if current_group != dim_name:
-                    current_group = dim_name
-                    percentage = (group_count / total_count) * 100
-                    print(f"\n{dim_name} - total - {group_count} items ({percentage:.1f}%)")
-                    
-                    # Print Table Header for the new group
-                    print(header_str)
-                    print(divider_str)
-                    
-                    plot_data[dim_name] = group_count
-                    group_items_counter = 0 # Reset counter for the new group
-                
-                group_items_counter += 1
-                row_parts = [f"{group_items_counter:<3}"]
-                
-                for idx, width in zip(indices, widths[1:]):
-                    val = row[idx]
-                    if val is None: val = "N/A"
-                    if len(val) > width:
-                        val = val[:width-2] + ".."
-                    row_parts.append(f"{val:<{width}}")
-                
-                print(" | ".join(row_parts))
+            # Rows arrive grouped by dimension value; find where each group starts
+            dim_names = results['dimension_name']
+            group_starts = np.flatnonzero(np.r_[True, dim_names[1:] != dim_names[:-1]])
+            group_ends = np.r_[group_starts[1:], len(dim_names)]
+            group_counts = results['group_count'][group_starts]
+            percentages = group_counts / results['total_count'][0] * 100
+
+            for start, end, count, percentage in zip(group_starts, group_ends, group_counts, percentages):
+                print(f"\n{dim_names[start]} - total - {count} items ({percentage:.1f}%)")
+                print_columns(slice_columns(results, slice(start, end)), spec)
 
             # Plotting
-            if plot_data:
-                sorted_plot = sorted(plot_data.items(), key=lambda x: x[1], reverse=True)
-                names = [x[0] for x in sorted_plot]
-                counts = [x[1] for x in sorted_plot]
-                
-                plt.figure(figsize=(10, 6))
-                plt.bar(names, counts, color='skyblue')
-                plt.title(f'Wardrobe Composition by {conf["label"]}')
-                plt.xlabel(conf['label'])
-                plt.ylabel('Item Count')
-                plt.xticks(rotation=45, ha='right')
-                plt.tight_layout()
-                plt.show()
+            render_bar_chart(f'Wardrobe Composition by {conf["label"]}',
+                             dim_names[group_starts], group_counts,
+                             xlabel=conf['label'], ylabel='Item Count', figsize=(10, 6),
+                             rotation=45, ha='right')
         
         else:
             print("Invalid choice.")
@@ -331,30 +576,84 @@ def wardrobe_composition_analytics(db, user_id):
     except Exception as e:
         print(f"Error during analysis: {e}")
 
+def fetch_monthly_expenses(db, user_id, year):
+    # (monthly totals, items bought) for one year. The totals come
+    # precomputed from the spend rollup; the half-open [Jan 1, next Jan 1)
+    # range keeps the item predicate sargable.
+    year_start = date(year, 1, 1)
+    year_end = date(year + 1, 1, 1)
+    totals = db.execute("""
+        SELECT month(month) as month_num, total
+        FROM Monthly_Spend
+        WHERE user_id = ? AND month >= ? AND month < ?
+    """, [user_id, year_start, year_end]).fetchnumpy()
+    
+    results = db.execute("""
+        SELECT 
+            month(i.purchase_date) as month_num,
+            CAST(i.purchase_date AS VARCHAR) as purchase_date,
+            i.name,
+            COALESCE(c.name, 'N/A') as color,
+            COALESCE(b.name, 'N/A') as brand,
+            COALESCE(printf('$%.2f', i.price), 'N/A') as price
+        FROM Clothing_Items i
+        LEFT JOIN Colors c ON i.color_id = c.color_id
+        LEFT JOIN Brands b ON i.brand_id = b.brand_id
+        WHERE i.user_id = ? AND i.purchase_date >= ? AND i.purchase_date < ?
+        ORDER BY i.purchase_date
+    """, [user_id, year_start, year_end]).fetchnumpy()
+    return totals, results
+
+def fetch_daily_expenses(db, user_id, month_start, month_end):
+    # ((month total, item count) or None, items bought or None) for
+    # [month_start, month_end). The total comes precomputed from the spend
+    # rollup; an empty month needs no item scan at all.
+    spend = db.execute("""
+        SELECT total, item_count
+        FROM Monthly_Spend
+        WHERE user_id = ? AND month = ?
+    """, [user_id, month_start]).fetchone()
+    
+    results = None
+    if spend and spend[1] > 0:
+        results = db.execute("""
+            SELECT 
+                day(i.purchase_date) as day_num,
+                CAST(i.purchase_date AS VARCHAR) as purchase_date,
+                i.name,
+                COALESCE(c.name, 'N/A') as color,
+                COALESCE(b.name, 'N/A') as brand,
+                COALESCE(i.price, 0) as amount,
+                COALESCE(printf('$%.2f', i.price), 'N/A') as price
+            FROM Clothing_Items i
+            LEFT JOIN Colors c ON i.color_id = c.color_id
+            LEFT JOIN Brands b ON i.brand_id = b.brand_id
+            WHERE i.user_id = ? 
+            AND i.purchase_date >= ? AND i.purchase_date < ?
+            ORDER BY i.purchase_date
+        """, [user_id, month_start, month_end]).fetchnumpy()
+    return spend, results
+
 def investment_analytics(db, user_id):
     print("\nAnalyze by:")
     print("0. Back to Main Menu")
-    print("1. Cost per wear by category")
-    print("2. Cost per wear by color")
-    print("3. Cost per wear by brand")
-    print("4. Monthly expenses through year")
-    print("5. Daily expenses though month")
+    print_dimension_options("Cost per wear by {name}")
+    n = len(DIMENSIONS)
+    print(f"{n + 1}. Monthly expenses through year")
+    print(f"{n + 2}. Daily expenses though month")
+    print(f"{n + 3}. Cost per wear across whole wardrobe")
+    print(f"{n + 4}. Neglected items")
     
     choice = input("\nEnter your choice: ")
     
     try:
         if choice == '0':
             return
-        if choice in ['1', '2', '3']:
-            config = {
-                '1': {'table': 'Categories', 'id': 'category_id', 'label': 'Category'},
-                '2': {'table': 'Colors', 'id': 'color_id', 'label': 'Color'},
-                '3': {'table': 'Brands', 'id': 'brand_id', 'label': 'Brand'}
-            }
-            conf = config[choice]
+        if dimension_choice(choice):
+            conf = dimension_config(dimension_choice(choice))
             
             # Get dimensions
-            dims = db.execute(f"SELECT {conf['id']}, name FROM {conf['table']} WHERE user_id = ?", [user_id]).fetchall()
+            dims = get_dimension(user_id, conf['table'])
             if not dims:
                 print(f"No {conf['label'].lower()}s found.")
                 return
@@ -369,92 +668,26 @@ def investment_analytics(db, user_id):
                     selected_id = dims[sub_choice-1][0]
                     selected_name = dims[sub_choice-1][1]
                     
-                    # Get items and CPW
-                    items = db.execute(f"""
-                        SELECT 
-                            i.name,
-                            i.price,
-                            COUNT(w.wear_id) as wear_count,
-                            i.purchase_date
-                        FROM Clothing_Items i
-                        LEFT JOIN Wear_Logs w ON i.item_id = w.item_id
-                        WHERE i.user_id = ? AND i.{conf['id']} = ?
-                        GROUP BY i.item_id, i.name, i.price, i.purchase_date
-                    """, [user_id, selected_id]).fetchall()
+                    items = fetch_cost_per_wear(db, user_id, conf['id'], selected_id)
                     
-                    if not items:
+                    if len(items['name']) == 0:
                         print(f"No items found in {selected_name}.")
                         return
-                        
-                    # Calculate CPW and sort
-                    processed_items = []
-                    for item in items:
-                        name = item[0]
-                        price = float(item[1]) if item[1] else 0.0
-                        wears = item[2]
-                        purchase_date = item[3]
-                        
-                        if wears > 0:
-                            cpw = price / wears
-                        else:
-                            cpw = float('inf') # Infinite cost if never worn
-                            
-                        # Calculate Duration
-                        duration_str = "N/A"
-                        if purchase_date:
-                            try:
-                                if isinstance(purchase_date, str):
-                                    p_date = datetime.strptime(purchase_date, '%Y-%m-%d').date()
-                                else:
-                                    p_date = purchase_date
-                                
-                                now = datetime.now().date()
-                                total_months = (now.year - p_date.year) * 12 + (now.month - p_date.month)
-                                if now.day < p_date.day:
-                                    total_months -= 1
-                                
-                                if total_months < 0: total_months = 0
-                                
-                                if total_months == 0:
-                                    days = (now - p_date).days
-                                    duration_str = f"{days} days"
-                                elif total_months < 12:
-                                    duration_str = f"{total_months} months"
-                                else:
-                                    years = total_months // 12
-                                    months = total_months % 12
-                                    duration_str = f"{years} yrs {months} mos"
-                            except Exception:
-                                pass
-
-                        processed_items.append({
-                            'name': name, 'price': price, 'wears': wears, 
-                            'cpw': cpw, 'duration': duration_str
-                        })
-                    
-                    # Sort by CPW ascending (cheapest per wear first), then by price
-                    processed_items.sort(key=lambda x: (x['cpw'], x['price']))
                     
                     print(f"\nCost Per Wear (CPW) for {selected_name}:")
-                    print(f"{{:<20}} | {{:<10}} | {{:<6}} | {{:<10}} | {{:<18}}".format('Item', 'Price', 'Wears', 'CPW', 'Duration'))
-                    print("-" * 75)
-                    
-                    for item in processed_items:
-                        if item['cpw'] == float('inf'):
-                            cpw_str = "No wears"
-                        else:
-                            cpw_str = f"${item['cpw']:.2f}"
-                        
-                        print(f"{{:<20}} | ${{:<9.2f}} | {{:<6}} | {{:<10}} | {{:<18}}".format(
-                            item['name'][:20], item['price'], item['wears'], cpw_str, item['duration']))
-                    
-                    # Chart removed as requested
+                    print_columns(items, [
+                        ('Item', 'name', 20),
+                        ('Price', 'price', 10),
+                        ('Wears', 'wear_count', 6),
+                        ('CPW', 'cpw', 10),
+                        ('Duration', 'duration', 18),
+                    ])
                 else:
                     print("Invalid selection.")
             except ValueError:
                 print("Invalid input.")
 
-        elif choice == '4':
+        elif choice == str(n + 1):
             current_year = datetime.now().year
             print("\nSelect Year:")
             print(f"1. {current_year}")
@@ -470,80 +703,24 @@ def investment_analytics(db, user_id):
                 print("Invalid choice")
                 return
                 
-            results = db.execute("""
-                SELECT 
-                    strftime('%m', i.purchase_date) as month,
-                    i.purchase_date,
-                    i.name,
-                    c.name,
-                    b.name,
-                    i.price
-                FROM Clothing_Items i
-                LEFT JOIN Colors c ON i.color_id = c.color_id
-                LEFT JOIN Brands b ON i.brand_id = b.brand_id
-                WHERE i.user_id = ? AND strftime('%Y', i.purchase_date) = ?
-                ORDER BY i.purchase_date
-            """, [user_id, str(target_year)]).fetchall()
-            
-            # Organize data by month
-            months_data = {f"{m:02d}": {'total': 0.0, 'items': []} for m in range(1, 13)}
-            
-            for row in results:
-                month = row[0]
-                p_date = row[1]
-                name = row[2]
-                color = row[3] if row[3] else "N/A"
-                brand = row[4] if row[4] else "N/A"
-                price = float(row[5]) if row[5] is not None else None
-                
-                if month in months_data:
-                    months_data[month]['total'] += (price if price else 0.0)
-                    months_data[month]['items'].append({
-                        'date': p_date, 'name': name, 'color': color, 
-                        'brand': brand, 'price': price
-                    })
+            totals, results = fetch_monthly_expenses(db, user_id, target_year)
             
             month_names = [datetime(2000, m, 1).strftime('%B') for m in range(1, 13)]
-            amounts = [months_data[f"{m:02d}"]['total'] for m in range(1, 13)]
+            amounts = np.zeros(12)
+            amounts[totals['month_num'] - 1] = totals['total']
             
             print(f"\nMonthly Expenses for {target_year}:")
             
-            # Header definition
-            header = f"{'#':<3} | {'Date':<12} | {'Item Name':<20} | {'Color':<10} | {'Brand':<10} | {'Price':<10}"
-            divider = "-" * len(header)
-
-            for i, m_name in enumerate(month_names):
-                month_key = f"{i+1:02d}"
-                data = months_data[month_key]
-                if data['total'] > 0:
-                    print(f"\n{m_name}: Total ${data['total']:.2f}")
-                    print(header)
-                    print(divider)
-                    for idx, item in enumerate(data['items'], 1):
-                        date_val = str(item['date']) if item['date'] else "N/A"
-                        name_val = item['name']
-                        if len(name_val) > 20:
-                            name_val = name_val[:17] + ".."
-                        
-                        color_val = str(item['color'])
-                        brand_val = str(item['brand'])
-                        
-                        if item['price'] is not None:
-                            price_val = f"${item['price']:.2f}"
-                        else:
-                            price_val = "N/A"
-                            
-                        print(f"{idx:<3} | {date_val:<12} | {name_val:<20} | {color_val:<10} | {brand_val:<10} | {price_val:<10}")
+            spec = [('Date', 'purchase_date', 12), ('Item Name', 'name', 20),
+                    ('Color', 'color', 10), ('Brand', 'brand', 10), ('Price', 'price', 10)]
+            for month_num in np.flatnonzero(amounts > 0) + 1:
+                print(f"\n{month_names[month_num - 1]}: Total ${amounts[month_num - 1]:.2f}")
+                print_columns(slice_columns(results, results['month_num'] == month_num), spec)
                 
-            plt.figure(figsize=(12, 6))
-            plt.bar(month_names, amounts, color='skyblue')
-            plt.title(f'Monthly Expenses - {target_year}')
-            plt.ylabel('Amount ($)')
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            plt.show()
-
-        elif choice == '5':
+            render_bar_chart(f'Monthly Expenses - {target_year}', month_names, amounts,
+                             ylabel='Amount ($)', rotation=45)
+
+        elif choice == str(n + 2):
             now = datetime.now()
             print("\nSelect Month:")
             months_map = {}
@@ -555,93 +732,60 @@ def investment_analytics(db, user_id):
             m_choice = input("Enter choice: ")
             if m_choice in months_map:
                 target_month = months_map[m_choice]
-                target_month_str = f"{target_month:02d}"
                 target_year_str = str(now.year)
                 
                 # Get number of days in the month
-                _, num_days = calendar.monthrange(int(target_year_str), target_month)
-                
-                results = db.execute("""
-                    SELECT 
-                        strftime('%d', i.purchase_date) as day,
-                        i.purchase_date,
-                        i.name,
-                        c.name,
-                        b.name,
-                        i.price
-                    FROM Clothing_Items i
-                    LEFT JOIN Colors c ON i.color_id = c.color_id
-                    LEFT JOIN Brands b ON i.brand_id = b.brand_id
-                    WHERE i.user_id = ? 
-                    AND strftime('%Y', i.purchase_date) = ?
-                    AND strftime('%m', i.purchase_date) = ?
-                    ORDER BY i.purchase_date
-                """, [user_id, target_year_str, target_month_str]).fetchall()
-                
-                # Initialize data for all days in the month
-                daily_data = {f"{d:02d}": {'total': 0.0, 'items': []} for d in range(1, num_days + 1)}
+                _, num_days = calendar.monthrange(now.year, target_month)
+                month_start = date(now.year, target_month, 1)
+                month_end = month_start + timedelta(days=num_days)
                 
-                for row in results:
-                    day = row[0]
-                    p_date = row[1]
-                    name = row[2]
-                    color = row[3] if row[3] else "N/A"
-                    brand = row[4] if row[4] else "N/A"
-                    price = float(row[5]) if row[5] is not None else None
-                    
-                    if day in daily_data:
-                        daily_data[day]['total'] += (price if price else 0.0)
-                        daily_data[day]['items'].append({
-                            'date': p_date, 'name': name, 'color': color, 
-                            'brand': brand, 'price': price
-                        })
+                spend, results = fetch_daily_expenses(db, user_id, month_start, month_end)
                 
-                # Prepare plot data with ALL days
-                days = sorted(daily_data.keys())
-                amounts = [daily_data[d]['total'] for d in days]
+                # Totals for ALL days of the month, indexed by day - 1
+                amounts = np.zeros(num_days)
+                if results is not None:
+                    amounts = np.bincount(results['day_num'] - 1, weights=results['amount'],
+                                          minlength=num_days)
+                days = [f"{d:02d}" for d in range(1, num_days + 1)]
                 
                 print(f"\nDaily Expenses for {datetime(now.year, target_month, 1).strftime('%B')} {target_year_str}:")
+                if spend and spend[0] > 0:
+                    print(f"Month Total: ${float(spend[0]):.2f}")
                 
-                # Header definition
-                header = f"{'#':<3} | {'Date':<12} | {'Item Name':<20} | {'Color':<10} | {'Brand':<10} | {'Price':<10}"
-                divider = "-" * len(header)
-                
-                has_data = False
-                for day in days:
-                    data = daily_data[day]
-                    if data['total'] > 0:
-                        has_data = True
-                        print(f"\nDay {day}: Total ${data['total']:.2f}")
-                        print(header)
-                        print(divider)
-                        for idx, item in enumerate(data['items'], 1):
-                            date_val = str(item['date']) if item['date'] else "N/A"
-                            name_val = item['name']
-                            if len(name_val) > 20:
-                                name_val = name_val[:17] + ".."
-                            
-                            color_val = str(item['color'])
-                            brand_val = str(item['brand'])
-                            
-                            if item['price'] is not None:
-                                price_val = f"${item['price']:.2f}"
-                            else:
-                                price_val = "N/A"
-                                
-                            print(f"{idx:<3} | {date_val:<12} | {name_val:<20} | {color_val:<10} | {brand_val:<10} | {price_val:<10}")
+                spec = [('Date', 'purchase_date', 12), ('Item Name', 'name', 20),
+                        ('Color', 'color', 10), ('Brand', 'brand', 10), ('Price', 'price', 10)]
+                spent_days = np.flatnonzero(amounts > 0) + 1
+                for day_num in spent_days:
+                    print(f"\nDay {day_num:02d}: Total ${amounts[day_num - 1]:.2f}")
+                    print_columns(slice_columns(results, results['day_num'] == day_num), spec)
                 
-                if not has_data:
+                if len(spent_days) == 0:
                     print("No expenses found for this month.")
                     
-                plt.figure(figsize=(12, 6))
-                plt.bar(days, amounts, color='lightgreen')
-                plt.title(f'Daily Expenses - {datetime(now.year, target_month, 1).strftime("%B")} {target_year_str}')
-                plt.xlabel('Day')
-                plt.ylabel('Amount ($)')
-                plt.tight_layout()
-                plt.show()
+                render_bar_chart(f'Daily Expenses - {datetime(now.year, target_month, 1).strftime("%B")} {target_year_str}',
+                                 days, amounts, xlabel='Day', ylabel='Amount ($)', color='lightgreen')
             else:
                 print("Invalid month.")
+
+        elif choice == str(n + 3):
+            items = fetch_cost_per_wear(db, user_id)
+            
+            if len(items['name']) == 0:
+                print("No items found.")
+                return
+            
+            print("\nCost Per Wear (CPW) for whole wardrobe:")
+            print_columns(items, [
+                ('Item', 'name', 20),
+                ('Category', 'category', 15),
+                ('Price', 'price', 10),
+                ('Wears', 'wear_count', 6),
+                ('CPW', 'cpw', 10),
+                ('Duration', 'duration', 18),
+            ])
+        
+        elif choice == str(n + 4):
+            neglected_items(db, user_id)
         
         else:
             print("Invalid choice.")
@@ -0,0 +1,233 @@
+import argparse
+import duckdb
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+# Runs every read path the menus use against a database (typically one made
+# by generate_data.py) without prompting, and writes latency percentiles,
+# throughput and memory to a JSON report:
+#
+#   python benchmark.py bench.db --repeat 20 --output before.json
+#   python benchmark.py bench.db --repeat 20 --output after.json --compare before.json
+#
+# Each run cycles through the sampled users so results aren't one user's
+# cache-warm special case. Each path runs the same statement or fetch_*
+# function as its menu screen. Memory is measured per path as the peak of
+# Python allocations over one extra untimed run (tracing would skew the
+# timings); the process-wide peak RSS is reported once for the whole run.
+
+def result_rows(result):
+    # Row count of a query path's result: a list of rows or a dict of
+    # fetchnumpy columns
+    if isinstance(result, dict):
+        return len(next(iter(result.values()), []))
+    return len(result)
+
+def query_paths(db):
+    from item_management import fetch_item_page
+    from wear_entry_management import fetch_wear_log_page
+    from analytics_management import (fetch_co_worn_items, fetch_composition, fetch_cost_per_wear,
+                                      fetch_daily_expenses, fetch_item_wear_counts,
+                                      fetch_monthly_expenses, fetch_neglected_items,
+                                      fetch_wear_trends)
+    from statements import run
+
+    def first_id(table, id_col, user_id):
+        row = db.execute(f"SELECT {id_col} FROM {table} WHERE user_id = ? ORDER BY name LIMIT 1",
+                         [user_id]).fetchone()
+        return row[0] if row else None
+
+    today = date.today()
+    year_ago = today - timedelta(days=365)
+    month_start = today.replace(day=1)
+    month_end = (month_start + timedelta(days=31)).replace(day=1)
+
+    # name -> (menu screen it stands for, function of user_id)
+    return {
+        'items_first_page': ('view_all_items',
+                             lambda u: fetch_item_page(u, 'first', None)),
+        'items_by_brand': ('search_filter_items',
+                           lambda u: run("items_by_brand",
+                                         [u, first_id('Brands', 'brand_id', u)]).fetchall()),
+        'wear_history_first_page': ('view_wear_history',
+                                    lambda u: fetch_wear_log_page(u, 'first', None)),
+        'wear_history_jump_to_date': ('view_wear_history',
+                                      lambda u: fetch_wear_log_page(u, 'date', year_ago)),
+        'wear_logs_by_category': ('search_filter_wear_entry',
+                                  lambda u: run("wear_logs_by_category",
+                                                [u, first_id('Categories', 'category_id', u)]).fetchall()),
+        'wear_logs_last_year': ('search_filter_wear_entry',
+                                lambda u: run("wear_logs_by_date_range",
+                                              [u, year_ago, today, year_ago, today]).fetchall()),
+        'wear_counts_all_items': ('wear_count_analytics',
+                                  lambda u: fetch_item_wear_counts(db, u)),
+        'wear_trends_by_category': ('wear_count_analytics',
+                                    lambda u: fetch_wear_trends(db, u, 'category')[0]),
+        'co_worn_items': ('wear_count_analytics',
+                          lambda u: fetch_co_worn_items(db, u, 20)),
+        'composition_by_color': ('wardrobe_composition_analytics',
+                                 lambda u: fetch_composition(db, u, 'Colors', 'color_id')),
+        'cost_per_wear_whole_wardrobe': ('investment_analytics',
+                                         lambda u: fetch_cost_per_wear(db, u)),
+        'neglected_items': ('investment_analytics',
+                            lambda u: fetch_neglected_items(db, u, 90, 20)),
+        'monthly_expenses': ('investment_analytics',
+                             lambda u: fetch_monthly_expenses(db, u, today.year)[1]),
+        'daily_expenses': ('investment_analytics',
+                           lambda u: fetch_daily_expenses(db, u, month_start, month_end)[1] or {}),
+    }
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile of an already sorted list
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def peak_alloc_mb(fn, user_id):
+    # Peak Python memory allocated by one call of fn, in MB. DuckDB's own
+    # buffers are not traced; the result rows the menus hold are.
+    tracemalloc.start()
+    try:
+        fn(user_id)
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def run_path(fn, user_ids, repeat, warmup):
+    from database import use_user_database
+
+    for i in range(warmup):
+        use_user_database(user_ids[i % len(user_ids)])
+        fn(user_ids[i % len(user_ids)])
+
+    timings, rows = [], 0
+    for i in range(repeat):
+        # Switching shards (sharded layout only) is not part of the timing
+        use_user_database(user_ids[i % len(user_ids)])
+        start = time.perf_counter()
+        result = fn(user_ids[i % len(user_ids)])
+        timings.append(time.perf_counter() - start)
+        rows += result_rows(result)
+
+    use_user_database(user_ids[0])
+    peak_alloc = peak_alloc_mb(fn, user_ids[0])
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        'runs': repeat,
+        'p50_ms': round(percentile(timings, 50) * 1000, 3),
+        'p95_ms': round(percentile(timings, 95) * 1000, 3),
+        'max_ms': round(timings[-1] * 1000, 3),
+        'rows_per_run': round(rows / repeat, 1),
+        'rows_per_sec': round(rows / total, 1) if total else None,
+        'peak_alloc_mb': round(peak_alloc, 2),
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_report(report, baseline=None):
+    print(f"{'Query path':<34} | {'p50 ms':>9} | {'p95 ms':>9} | {'rows/s':>12} | {'alloc MB':>8}"
+          + (f" | {'p50 vs base':>11}" if baseline else ""))
+    print("-" * (86 + (14 if baseline else 0)))
+    for name, stats in report['paths'].items():
+        line = (f"{name:<34} | {stats['p50_ms']:>9.2f} | {stats['p95_ms']:>9.2f} | "
+                f"{stats['rows_per_sec'] or 0:>12.0f} | {stats['peak_alloc_mb']:>8.2f}")
+        if baseline:
+            base = baseline['paths'].get(name)
+            if base and base['p50_ms']:
+                line += f" | {(stats['p50_ms'] / base['p50_ms'] - 1) * 100:>+10.1f}%"
+            else:
+                line += f" | {'-':>11}"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Smart Wardrobe query paths")
+    parser.add_argument('path', help="database file to benchmark")
+    parser.add_argument('--repeat', type=int, default=20, help="timed runs per query path")
+    parser.add_argument('--warmup', type=int, default=2, help="untimed runs per query path")
+    parser.add_argument('--users', type=int, default=10, help="number of users to cycle through")
+    parser.add_argument('--only', action='append', help="run just this query path (repeatable)")
+    parser.add_argument('--output', help="write the JSON report here")
+    parser.add_argument('--compare', help="earlier JSON report to show p50 changes against")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.path):
+        parser.error(f"{args.path} does not exist; create one with generate_data.py")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    from database import db, create_tables
+    db.configure(path=args.path)
+    create_tables()
+
+    paths = query_paths(db)
+    if args.only:
+        unknown = [name for name in args.only if name not in paths]
+        if unknown:
+            parser.error(f"Unknown query path(s): {', '.join(unknown)}. "
+                         f"Choose from: {', '.join(paths)}")
+        paths = {name: paths[name] for name in args.only}
+
+    # Sample users spread across the id range
+    user_ids = [row[0] for row in db.execute("""
+        SELECT user_id FROM Users
+        ORDER BY hash(user_id)
+        LIMIT ?
+    """, [args.users]).fetchall()]
+    if not user_ids:
+        print("Error: the database has no users.", file=sys.stderr)
+        return 1
+
+    report = {
+        'database': os.path.abspath(args.path),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'duckdb': duckdb.__version__,
+        'row_counts': {table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                       for table in ('Users', 'Clothing_Items', 'Wear_Logs')},
+        'users_sampled': len(user_ids),
+        'paths': {},
+    }
+    for name, (screen, fn) in paths.items():
+        try:
+            stats = run_path(fn, user_ids, args.repeat, args.warmup)
+        except Exception as e:
+            print(f"Error benchmarking {name}: {e}", file=sys.stderr)
+            continue
+        report['paths'][name] = {'screen': screen, **stats}
+    report['peak_rss_mb'] = round(peak_rss_mb(), 1)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+    print(f"\nPeak RSS for the whole run: {report['peak_rss_mb']:.1f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import os
+import re
+
+# Charts are written to files with a non-interactive backend instead of
+# blocking on plt.show(). Override with WARDROBE_CHARTS=off,
+# WARDROBE_CHART_FORMAT=svg or WARDROBE_CHART_DIR=<path>.
+chart_settings = {
+    'enabled': os.environ.get('WARDROBE_CHARTS', 'on').lower() not in ('off', '0', 'false', 'no'),
+    'format': os.environ.get('WARDROBE_CHART_FORMAT', 'png').lower(),
+    'directory': os.environ.get('WARDROBE_CHART_DIR', 'charts'),
+}
+
+_pyplot = None
+
+def set_charts_enabled(enabled):
+    chart_settings['enabled'] = enabled
+
+def _get_pyplot():
+    # matplotlib is only imported the first time a chart is actually drawn
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        _pyplot = plt
+    return _pyplot
+
+def _save_figure(fig, title):
+    os.makedirs(chart_settings['directory'], exist_ok=True)
+    filename = re.sub(r'\W+', '_', title).strip('_').lower()
+    path = os.path.join(chart_settings['directory'], f"{filename}.{chart_settings['format']}")
+    fig.savefig(path, format=chart_settings['format'])
+    return path
+
+def render_bar_chart(title, labels, values, xlabel=None, ylabel=None, color='skyblue',
+                     figsize=(12, 6), rotation=None, ha='center'):
+    # Draw a bar chart to <directory>/<title>.<format> and return the path,
+    # or None when charts are turned off
+    if not chart_settings['enabled']:
+        return None
+
+    plt = _get_pyplot()
+    fig = plt.figure(figsize=figsize)
+    try:
+        plt.bar(labels, values, color=color)
+        plt.title(title)
+        if xlabel:
+            plt.xlabel(xlabel)
+        if ylabel:
+            plt.ylabel(ylabel)
+        if rotation is not None:
+            plt.xticks(rotation=rotation, ha=ha)
+        plt.tight_layout()
+        path = _save_figure(fig, title)
+    finally:
+        plt.close(fig)
+
+    print(f"\nChart saved to {path}")
+    return path
+
+def render_bar_grid(title, panels, ylabel=None, color='skyblue', figsize=(14, 10)):
+    # Several bar charts in one figure, two per row; panels is a list of
+    # (subtitle, labels, values)
+    if not chart_settings['enabled'] or not panels:
+        return None
+
+    plt = _get_pyplot()
+    rows = (len(panels) + 1) // 2
+    fig, axes = plt.subplots(rows, 2, figsize=figsize, squeeze=False)
+    try:
+        for ax, (subtitle, labels, values) in zip(axes.flat, panels):
+            ax.bar(labels, values, color=color)
+            ax.set_title(subtitle)
+            if ylabel:
+                ax.set_ylabel(ylabel)
+            ax.tick_params(axis='x', labelrotation=45)
+        for ax in axes.flat[len(panels):]:
+            ax.set_visible(False)
+        fig.suptitle(title)
+        fig.tight_layout()
+        path = _save_figure(fig, title)
+    finally:
+        plt.close(fig)
+
+    print(f"\nChart saved to {path}")
+    return path
+
+def render_line_grid(title, x, panels, ylabel=None, figsize=(14, 10)):
+    # Line charts sharing one x axis, stacked in a single column; panels is
+    # a list of (subtitle, {label: values}) with values aligned to x
+    if not chart_settings['enabled'] or not panels:
+        return None
+
+    plt = _get_pyplot()
+    fig, axes = plt.subplots(len(panels), 1, figsize=figsize, sharex=True, squeeze=False)
+    try:
+        for ax, (subtitle, series) in zip(axes.flat, panels):
+            for label, values in series.items():
+                ax.plot(x, values, label=label)
+            ax.set_title(subtitle)
+            if ylabel:
+                ax.set_ylabel(ylabel)
+        axes.flat[0].legend(loc='upper left', fontsize='small', ncol=2)
+        fig.autofmt_xdate()
+        fig.suptitle(title)
+        fig.tight_layout()
+        path = _save_figure(fig, title)
+    finally:
+        plt.close(fig)
+
+    print(f"\nChart saved to {path}")
+    return path
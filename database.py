@@ -1,10 +1,409 @@
+import atexit
 import duckdb
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
 
-# Initialize database connection
-db = duckdb.connect(database='wardrobe.db', read_only=False)
+class QueryStats:
+    # Per-call-site statement statistics gathered by ConnectionManager.execute:
+    # calls, total/max latency (execute plus fetch), rows fetched and, for
+    # reads slower than the EXPLAIN threshold, the EXPLAIN ANALYZE plan of the
+    # slowest such call.
 
-def create_tables():
-    # Create tables if they don't exist
+    def __init__(self, enabled=True, explain_threshold_ms=None):
+        self.enabled = enabled
+        self.explain_threshold_ms = explain_threshold_ms
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def entry(self, tag, query):
+        with self._lock:
+            entry = self._entries.get(tag)
+            if entry is None:
+                entry = {'tag': tag, 'query': " ".join(query.split()), 'calls': 0,
+                         'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0,
+                         'plan': None, 'plan_ms': None}
+                self._entries[tag] = entry
+            return entry
+
+    def record(self, entry, elapsed_ms, call_ms, rows=0, new_call=False):
+        # elapsed_ms is this execute or fetch; call_ms is the statement's
+        # running total so far
+        with self._lock:
+            if new_call:
+                entry['calls'] += 1
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], call_ms)
+            entry['rows'] += rows
+
+    def wants_plan(self, entry, elapsed_ms):
+        # Only re-profile a statement when it beats its slowest captured run
+        threshold = self.explain_threshold_ms
+        return (threshold is not None and elapsed_ms >= threshold
+                and (entry['plan_ms'] is None or elapsed_ms > entry['plan_ms']))
+
+    def report(self):
+        # Entries ordered by total time, slowest call site first
+        with self._lock:
+            rows = [dict(e) for e in self._entries.values()]
+        for row in rows:
+            row['total_ms'] = round(row['total_ms'], 3)
+            row['max_ms'] = round(row['max_ms'], 3)
+            row['avg_ms'] = round(row['total_ms'] / row['calls'], 3) if row['calls'] else 0.0
+        return sorted(rows, key=lambda r: r['total_ms'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+
+class InstrumentedResult:
+    # Wraps the cursor returned by execute() so fetch time and fetched rows
+    # are added to the statement's stats; everything else passes through
+    def __init__(self, cursor, stats, entry, execute_ms):
+        self._cursor = cursor
+        self._stats = stats
+        self._entry = entry
+        self._call_ms = execute_ms
+
+    def _timed(self, fetch, count, *args):
+        start = time.perf_counter()
+        result = fetch(*args)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._call_ms += elapsed_ms
+        self._stats.record(self._entry, elapsed_ms, self._call_ms, count(result))
+        return result
+
+    def fetchone(self):
+        return self._timed(self._cursor.fetchone, lambda r: 0 if r is None else 1)
+
+    def fetchall(self):
+        return self._timed(self._cursor.fetchall, len)
+
+    def fetchmany(self, size=1):
+        return self._timed(self._cursor.fetchmany, len, size)
+
+    def fetchnumpy(self):
+        return self._timed(self._cursor.fetchnumpy, lambda r: len(next(iter(r.values()), [])))
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+def _call_site():
+    # "module.function:line" of whoever called db.execute/executemany
+    frame = sys._getframe(2)
+    module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+
+class ConnectionManager:
+    # Owns the single DuckDB database instance and hands each thread its own
+    # cursor, so concurrent readers run in parallel and every thread has an
+    # independent transaction. Modules keep calling db.execute(...) as before.
+    #
+    # With shard_dir set, the file at path is only a catalog (Users) and each
+    # user's wardrobe lives in <shard_dir>/user_<id>.db. use_database() attaches
+    # such a file and makes it the calling thread's default database, so the
+    # same unqualified SQL runs against whichever wardrobe the thread serves.
+
+    def __init__(self, path='wardrobe.db', threads=None, memory_limit=None, shard_dir=None):
+        self.path = path
+        self.threads = threads
+        self.memory_limit = memory_limit
+        self.shard_dir = shard_dir
+        self.catalog = None
+        self._attached = set()
+        self._connection = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def configure(self, path=None, threads=None, memory_limit=None, shard_dir=None):
+        # Must be called before the first query opens the database
+        if self._connection is not None:
+            raise RuntimeError("Database is already open; configure it before first use.")
+        if path is not None:
+            self.path = path
+        if threads is not None:
+            self.threads = threads
+        if memory_limit is not None:
+            self.memory_limit = memory_limit
+        if shard_dir is not None:
+            self.shard_dir = shard_dir
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            with self._lock:
+                if self._connection is None:
+                    config = {}
+                    if self.threads:
+                        config['threads'] = int(self.threads)
+                    if self.memory_limit:
+                        config['memory_limit'] = self.memory_limit
+                    self._connection = duckdb.connect(database=self.path, read_only=False,
+                                                      config=config)
+                    self.catalog = self._connection.execute(
+                        "SELECT current_database()").fetchone()[0]
+        return self._connection
+
+    def cursor(self):
+        # The calling thread's cursor, created on first use
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is None:
+            cursor = self.connection.cursor()
+            self._local.cursor = cursor
+            self._local.depth = 0
+            self._local.database = None
+        return cursor
+
+    def use_database(self, name, path=None, setup=None):
+        # Make an attached database (attaching path first, if given) the
+        # default for this thread's statements. The first attach in the
+        # process runs setup() against it while holding the lock, so no
+        # other thread uses the database before setup has finished; if setup
+        # fails, the next call runs it again. use_database(db.catalog)
+        # switches back.
+        cursor = self.cursor()
+        if path is not None and name not in self._attached:
+            with self._lock:
+                if name not in self._attached:
+                    escaped = path.replace("'", "''")
+                    cursor.execute(f"ATTACH IF NOT EXISTS '{escaped}' AS {name}")
+                    cursor.execute(f"USE {name}")
+                    self._local.database = name
+                    try:
+                        if setup is not None:
+                            setup()
+                    except BaseException:
+                        cursor.execute(f"USE {self.catalog}")
+                        self._local.database = self.catalog
+                        raise
+                    self._attached.add(name)
+        if self._local.database != name:
+            cursor.execute(f"USE {name}")
+            self._local.database = name
+
+    def execute(self, query, parameters=None, tag=None):
+        # query is SQL text or a parsed duckdb.Statement (see statements.py);
+        # tag names the statement in query_stats instead of its call site
+        if not query_stats.enabled:
+            return self.cursor().execute(query, parameters)
+
+        text = query if isinstance(query, str) else query.query
+        entry = query_stats.entry(tag or _call_site(), text)
+        start = time.perf_counter()
+        cursor = self.cursor().execute(query, parameters)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_stats.record(entry, elapsed_ms, elapsed_ms, new_call=True)
+
+        if query_stats.wants_plan(entry, elapsed_ms):
+            plan = self._explain_analyze(text, parameters)
+            if plan is not None:
+                entry['plan'], entry['plan_ms'] = plan, elapsed_ms
+        return InstrumentedResult(cursor, query_stats, entry, elapsed_ms)
+
+    def executemany(self, query, parameters):
+        if not query_stats.enabled:
+            return self.cursor().executemany(query, parameters)
+
+        entry = query_stats.entry(_call_site(), query)
+        start = time.perf_counter()
+        cursor = self.cursor().executemany(query, parameters)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_stats.record(entry, elapsed_ms, elapsed_ms, new_call=True)
+        return cursor
+
+    def _explain_analyze(self, query, parameters):
+        # Re-runs a slow read on a separate cursor to capture its profiled
+        # plan. Writes are never re-run, and the separate cursor leaves the
+        # caller's pending result and transaction untouched (so it only sees
+        # committed data).
+        if query.lstrip().split(None, 1)[0].upper() not in ('SELECT', 'WITH'):
+            return None
+        cursor = self.connection.cursor()
+        try:
+            if self._local.database is not None:
+                cursor.execute(f"USE {self._local.database}")
+            return cursor.execute(f"EXPLAIN ANALYZE {query}", parameters).fetchall()[0][1]
+        except duckdb.Error as e:
+            return f"EXPLAIN ANALYZE failed: {e}"
+        finally:
+            cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        # Atomic unit of work on this thread's cursor. Nested calls join the
+        # outer transaction; only the outermost one commits or rolls back.
+        cursor = self.cursor()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield cursor
+            finally:
+                self._local.depth -= 1
+            return
+
+        cursor.execute("BEGIN TRANSACTION")
+        self._local.depth = 1
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        else:
+            cursor.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def close_cursor(self):
+        # Release the calling thread's cursor, e.g. when a worker thread exits
+        cursor = getattr(self._local, 'cursor', None)
+        if cursor is not None:
+            cursor.close()
+            self._local.cursor = None
+
+    def close(self):
+        self.close_cursor()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+def _env_flag(name, default):
+    return os.environ.get(name, default).lower() not in ('off', '0', 'false', 'no')
+
+# Statement statistics for every db.execute call. WARDROBE_QUERY_STATS=off
+# disables them, WARDROBE_EXPLAIN_MS=<ms> captures EXPLAIN ANALYZE for reads
+# at least that slow, and WARDROBE_QUERY_STATS_FILE=<path> writes the report
+# there as JSON when the program exits.
+query_stats = QueryStats(
+    enabled=_env_flag('WARDROBE_QUERY_STATS', 'on'),
+    explain_threshold_ms=(float(os.environ['WARDROBE_EXPLAIN_MS'])
+                          if os.environ.get('WARDROBE_EXPLAIN_MS') else None),
+)
+
+def print_query_stats(limit=20, show_plans=False):
+    report = query_stats.report()
+    if not report:
+        print("No queries recorded.")
+        return
+    
+    print(f"{'Call site':<45} | {'Calls':>6} | {'Total ms':>10} | {'Avg ms':>8} | {'Max ms':>8} | {'Rows':>8}")
+    print("-" * 100)
+    for row in report[:limit]:
+        print(f"{row['tag'][:45]:<45} | {row['calls']:>6} | {row['total_ms']:>10.2f} | "
+              f"{row['avg_ms']:>8.2f} | {row['max_ms']:>8.2f} | {row['rows']:>8}")
+    
+    if not show_plans:
+        return
+    for row in report[:limit]:
+        if row['plan']:
+            print(f"\nSlowest plan captured for {row['tag']} ({row['plan_ms']:.2f} ms):\n"
+                  f"{row['query']}\n{row['plan']}")
+
+def dump_query_stats(path):
+    with open(path, 'w') as f:
+        json.dump(query_stats.report(), f, indent=2)
+
+if os.environ.get('WARDROBE_QUERY_STATS_FILE'):
+    atexit.register(dump_query_stats, os.environ['WARDROBE_QUERY_STATS_FILE'])
+
+# Shared database handle; WARDROBE_DB, WARDROBE_DB_THREADS and
+# WARDROBE_DB_MEMORY_LIMIT override the defaults, and WARDROBE_SHARD_DIR
+# switches to one database file per user (see split_database.py)
+db = ConnectionManager(
+    path=os.environ.get('WARDROBE_DB', 'wardrobe.db'),
+    threads=os.environ.get('WARDROBE_DB_THREADS'),
+    memory_limit=os.environ.get('WARDROBE_DB_MEMORY_LIMIT'),
+    shard_dir=os.environ.get('WARDROBE_SHARD_DIR'),
+)
+
+# Primary key column and backing sequence for every table with a surrogate key
+ID_SEQUENCES = {
+    'Users': ('user_id', 'users_id_seq'),
+    'Categories': ('category_id', 'categories_id_seq'),
+    'Colors': ('color_id', 'colors_id_seq'),
+    'Sizes': ('size_id', 'sizes_id_seq'),
+    'Brands': ('brand_id', 'brands_id_seq'),
+    'Clothing_Items': ('item_id', 'clothing_items_id_seq'),
+    'Wear_Logs': ('wear_id', 'wear_logs_id_seq'),
+    'Outfits': ('outfit_id', 'outfits_id_seq'),
+}
+
+def next_id(table):
+    # SQL expression that allocates the next primary key for a table,
+    # e.g. INSERT INTO Colors VALUES ({next_id('Colors')}, ?, ?)
+    return f"nextval('{ID_SEQUENCES[table][1]}')"
+
+def transaction():
+    # Group several statements into one atomic write; rolled back on any error.
+    # DuckDB checks foreign keys against the state before the transaction, so
+    # rows and the parent they reference can't be deleted in the same one:
+    # delete the children in one transaction and the parent in the next.
+    return db.transaction()
+
+def create_id_sequences():
+    # Sequences are seeded from the current MAX(id) once, so databases created
+    # before they existed keep allocating ids after their last row
+    existing = {row[0] for row in db.execute("""
+        SELECT sequence_name FROM duckdb_sequences()
+        WHERE database_name = current_database()
+    """).fetchall()}
+    for table, (id_col, sequence) in ID_SEQUENCES.items():
+        if sequence in existing:
+            continue
+        start = db.execute(f"SELECT COALESCE(MAX({id_col}), 0) + 1 FROM {table}").fetchone()[0]
+        db.execute(f"CREATE SEQUENCE {sequence} START WITH {start}")
+
+def reseed_id_sequences():
+    # Restart every sequence after its table's current MAX(id), e.g. after
+    # rows were copied in with their original ids
+    for _, sequence in ID_SEQUENCES.values():
+        db.execute(f"DROP SEQUENCE IF EXISTS {sequence}")
+    create_id_sequences()
+
+def shard_name(user_id):
+    return f"user_{int(user_id)}"
+
+def use_user_database(user_id):
+    # Point this thread's queries at the user's own database in the sharded
+    # layout (no-op otherwise). Only users registered in the catalog get a
+    # shard. The first attach in a process creates or upgrades the shard's
+    # schema and its copy of the user's Users row, which the shard's foreign
+    # keys refer to.
+    if not db.shard_dir:
+        return
+    user = db.execute(f"SELECT user_id, name, email FROM {db.catalog}.main.Users WHERE user_id = ?",
+                      [user_id]).fetchone()
+    if user is None:
+        raise ValueError(f"Unknown user {user_id}")
+
+    def setup():
+        create_tables(verbose=False)
+        # Passwords stay in the catalog only
+        db.execute("""
+            INSERT INTO Users (user_id, name, email, password) VALUES (?, ?, ?, '')
+            ON CONFLICT DO NOTHING
+        """, list(user))
+        # A new shard's view was built before it had an owner, so without
+        # the owner's archive partitions
+        create_wear_history_view()
+
+    name = shard_name(user_id)
+    os.makedirs(db.shard_dir, exist_ok=True)
+    db.use_database(name, os.path.join(db.shard_dir, f"{name}.db"), setup)
+
+def use_catalog():
+    # Back to the catalog database, e.g. after logout
+    if db.shard_dir:
+        db.use_database(db.catalog)
+
+def create_tables(verbose=True):
+    # Create tables if they don't exist; verbose=False keeps the migration
+    # report quiet, e.g. when a shard is upgraded during login
     db.execute("""
         CREATE TABLE IF NOT EXISTS Users (
             user_id INTEGER PRIMARY KEY,
@@ -78,4 +477,336 @@ def create_tables():
             FOREIGN KEY (user_id) REFERENCES Users(user_id),
             FOREIGN KEY (item_id) REFERENCES Clothing_Items(item_id)
         )
-    """)
\ No newline at end of file
+    """)
+
+    # Before migrate(): migrations may read the full history through the view
+    create_wear_history_view()
+    migrate(verbose)
+    # After migrate(), which creates some of the tables they number
+    create_id_sequences()
+
+# Wear_Rollups holds wear counts per day, week and month bucket for every item
+# (dimension 'item'), so trend reports never rescan the logs; per category,
+# color, size or brand totals are summed from the item rows when read. A
+# bucket is the first day of its period (weeks start on Monday).
+WEAR_ROLLUP_GRAINS = ('day', 'week', 'month')
+
+def wear_rollup_upsert(deltas):
+    # SQL that adds a set of wear count changes to Wear_Rollups. deltas is a
+    # query returning (item_id, wear_date, wears), e.g. one row per new log
+    # with wears = 1, or -1 for a log about to be deleted. Only the changed
+    # items' rows are written, so concurrent writers of different items
+    # don't touch the same rows.
+    grains = ", ".join(f"('{grain}')" for grain in WEAR_ROLLUP_GRAINS)
+    return f"""
+        INSERT INTO Wear_Rollups (user_id, dimension, member_id, grain, bucket, wear_count)
+        SELECT i.user_id, 'item', i.item_id, g.grain,
+               CAST(date_trunc(g.grain, d.wear_date) AS DATE), SUM(d.wears)
+        FROM ({deltas}) d(item_id, wear_date, wears)
+        JOIN Clothing_Items i ON d.item_id = i.item_id
+        CROSS JOIN (VALUES {grains}) g(grain)
+        GROUP BY ALL
+        ON CONFLICT (dimension, member_id, grain, bucket) DO UPDATE SET
+            wear_count = Wear_Rollups.wear_count + excluded.wear_count
+    """
+
+# Ordered schema migrations as (version, description, statements). Append new
+# steps at the end; a step runs once per database and is recorded in
+# Schema_Version so existing wardrobe.db files are upgraded in place.
+MIGRATIONS = [
+    # Wear_Logs.user_id/item_id and Clothing_Items.user_id need no index of
+    # their own: their foreign keys are indexed already (steps 1, 2 and 4
+    # used to add duplicates, which step 12 drops), and so is the UNIQUE
+    # Users.email
+    (3, "Index wear logs by date", [
+        "CREATE INDEX IF NOT EXISTS idx_wear_logs_date ON Wear_Logs(wear_date)",
+    ]),
+    (5, "Add per-user monthly spend rollup", [
+        """
+        CREATE TABLE IF NOT EXISTS Monthly_Spend (
+            user_id INTEGER,
+            month DATE,
+            total DECIMAL(12,2) NOT NULL,
+            item_count INTEGER NOT NULL,
+            PRIMARY KEY (user_id, month),
+            FOREIGN KEY (user_id) REFERENCES Users(user_id)
+        )
+        """,
+        """
+        INSERT INTO Monthly_Spend (user_id, month, total, item_count)
+        SELECT user_id, CAST(date_trunc('month', purchase_date) AS DATE),
+               COALESCE(SUM(price), 0), COUNT(*)
+        FROM Clothing_Items
+        WHERE purchase_date IS NOT NULL
+        GROUP BY ALL
+        """,
+    ]),
+    # No foreign key to Clothing_Items, so the stats row and its item can be
+    # deleted together (see transaction())
+    (6, "Add per-item wear statistics", [
+        """
+        CREATE TABLE IF NOT EXISTS Item_Wear_Stats (
+            item_id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            wear_count INTEGER NOT NULL,
+            first_worn DATE,
+            last_worn DATE,
+            cost_per_wear DECIMAL(10,2)
+        )
+        """,
+        """
+        INSERT INTO Item_Wear_Stats
+        SELECT i.item_id, i.user_id, COUNT(w.wear_id), MIN(w.wear_date), MAX(w.wear_date),
+               CASE WHEN COUNT(w.wear_id) > 0 THEN i.price / COUNT(w.wear_id) END
+        FROM Clothing_Items i
+        LEFT JOIN Wear_Logs w ON i.item_id = w.item_id
+        GROUP BY i.item_id, i.user_id, i.price
+        """,
+    ]),
+    # Per-item totals of the logs moved to Parquet by wear_archive.py, so
+    # Item_Wear_Stats can be refreshed without reading the archive
+    (7, "Add archived wear log totals", [
+        """
+        CREATE TABLE IF NOT EXISTS Archived_Wear_Stats (
+            item_id INTEGER PRIMARY KEY,
+            user_id INTEGER NOT NULL,
+            wear_count INTEGER NOT NULL,
+            first_worn DATE,
+            last_worn DATE
+        )
+        """,
+    ]),
+    # Backfilled from Wear_History so archived logs are counted too
+    (8, "Add daily, weekly and monthly wear rollups", [
+        """
+        CREATE TABLE IF NOT EXISTS Wear_Rollups (
+            user_id INTEGER NOT NULL,
+            dimension VARCHAR NOT NULL,
+            member_id INTEGER NOT NULL,
+            grain VARCHAR NOT NULL,
+            bucket DATE NOT NULL,
+            wear_count INTEGER NOT NULL,
+            PRIMARY KEY (dimension, member_id, grain, bucket)
+        )
+        """,
+        wear_rollup_upsert("SELECT item_id, wear_date, 1 FROM Wear_History"),
+    ]),
+    # Lets the neglected items report find items last worn before a cutoff
+    # with an index range scan
+    (9, "Index item wear statistics by last worn date", [
+        "CREATE INDEX IF NOT EXISTS idx_item_wear_stats_last_worn ON Item_Wear_Stats(last_worn)",
+    ]),
+    # Saved sets of items that can be logged as worn together in one step
+    (10, "Add saved outfits", [
+        """
+        CREATE TABLE IF NOT EXISTS Outfits (
+            outfit_id INTEGER PRIMARY KEY,
+            user_id INTEGER,
+            name VARCHAR NOT NULL,
+            UNIQUE (user_id, name),
+            FOREIGN KEY (user_id) REFERENCES Users(user_id)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS Outfit_Items (
+            outfit_id INTEGER,
+            item_id INTEGER,
+            user_id INTEGER,
+            PRIMARY KEY (outfit_id, item_id),
+            FOREIGN KEY (outfit_id) REFERENCES Outfits(outfit_id),
+            FOREIGN KEY (item_id) REFERENCES Clothing_Items(item_id),
+            FOREIGN KEY (user_id) REFERENCES Users(user_id)
+        )
+        """,
+    ]),
+    # Per-dimension totals are now summed from the item rows when read
+    (11, "Keep wear rollups per item only", [
+        "DELETE FROM Wear_Rollups WHERE dimension <> 'item'",
+    ]),
+    (12, "Drop indexes that duplicate foreign key indexes", [
+        "DROP INDEX IF EXISTS idx_wear_logs_user",
+        "DROP INDEX IF EXISTS idx_wear_logs_item",
+        "DROP INDEX IF EXISTS idx_clothing_items_user",
+    ]),
+]
+
+# Wear logs older than an archive cutoff are moved out of Wear_Logs into
+# Parquet files under <archive dir>/wear_logs/user_id=<id>/year=<yyyy>/
+# (see wear_archive.py). The archive dir is WARDROBE_ARCHIVE_DIR if set,
+# otherwise <database name>_archive/ next to the database file (the catalog
+# in the sharded layout), so no two databases read each other's archive.
+# Reads that need the full history use the Wear_History view, which unions
+# the hot table with those files. Filters on user_id only open that user's
+# partitions, and filters on the view's year column only open those years,
+# so date-bounded reads also bound year (e.g.
+# "AND w.year >= year(CAST(? AS DATE))"). Archived logs of removed items
+# are hidden.
+def wear_archive_path(database_path=None):
+    # Archived wear logs of the database file at database_path (default:
+    # the open database)
+    archive_dir = os.environ.get('WARDROBE_ARCHIVE_DIR')
+    if not archive_dir:
+        archive_dir = os.path.splitext(os.path.abspath(database_path or db.path))[0] + '_archive'
+    return os.path.join(os.path.abspath(archive_dir), 'wear_logs')
+
+def create_wear_history_view():
+    # The view is rebuilt at startup and after each archive run, since
+    # read_parquet fails on a glob that matches no files
+    partition = '*'
+    if db.shard_dir:
+        # A shard only sees its owner's partitions; the catalog sees none
+        owners = db.execute("SELECT user_id FROM Users").fetchall()
+        partition = f"user_id={owners[0][0]}" if len(owners) == 1 else None
+    pattern = os.path.join(wear_archive_path(), partition or '', '*', '*.parquet')
+    cold = ""
+    if partition and glob.glob(pattern):
+        escaped = pattern.replace("'", "''")
+        cold = f"""
+            UNION ALL
+            SELECT CAST(wear_id AS INTEGER), CAST(user_id AS INTEGER),
+                   CAST(item_id AS INTEGER), wear_date, CAST(year AS INTEGER)
+            FROM read_parquet('{escaped}', hive_partitioning = true)
+            WHERE item_id IN (SELECT item_id FROM Clothing_Items)
+        """
+    db.execute(f"""
+        CREATE OR REPLACE VIEW Wear_History AS
+        SELECT wear_id, user_id, item_id, wear_date, year(wear_date) AS year FROM Wear_Logs
+        {cold}
+    """)
+
+# Representative hot queries whose plans are compared across a migration run.
+# DuckDB only serves a filter from an index when it is a single comparison
+# on the indexed column that matches few rows, so each probe has exactly
+# one predicate. The user_id/item_id columns are indexed by their foreign
+# keys; those probes guard against regressions. The {placeholders} are
+# filled from the database's own rows by probe_values().
+PLAN_PROBES = {
+    'wear history by user':
+        "SELECT wear_date, item_id FROM Wear_Logs WHERE user_id = {user_id} ORDER BY wear_date DESC",
+    'wear logs by item':
+        "SELECT wear_date FROM Wear_Logs WHERE item_id = {item_id}",
+    'oldest wear logs':
+        "SELECT item_id FROM Wear_Logs WHERE wear_date < {wear_cutoff}",
+    'items by user':
+        "SELECT item_id, name FROM Clothing_Items WHERE user_id = {user_id}",
+    'items last worn longest ago':
+        "SELECT item_id FROM Item_Wear_Stats WHERE last_worn < {worn_cutoff}",
+    'login by email':
+        "SELECT user_id FROM Users WHERE email = {email}",
+}
+
+# Share of the oldest rows a probe's date cutoff selects; small enough for
+# an index range scan to pay off
+PROBE_CUTOFF_SHARE = 0.001
+
+def sql_literal(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, date):
+        return f"DATE '{value.isoformat()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+def probe_values():
+    # SQL literals for PLAN_PROBES from existing rows: the user with the most
+    # wear logs, one of their worn items, and date cutoffs that select the
+    # oldest PROBE_CUTOFF_SHARE of the logs and of the items' last wears.
+    # NULL where a table is empty or doesn't exist yet.
+    def first(sql):
+        try:
+            row = db.execute(sql).fetchone()
+        except duckdb.CatalogException:
+            return None
+        return row[0] if row else None
+
+    def cutoff(table, column):
+        return first(f"""
+            SELECT {column} FROM {table} WHERE {column} IS NOT NULL
+            ORDER BY {column}
+            LIMIT 1 OFFSET (SELECT CAST(COUNT({column}) * {PROBE_CUTOFF_SHARE} AS BIGINT) FROM {table})
+        """)
+
+    user_id = first("""
+        SELECT user_id FROM Wear_Logs GROUP BY user_id ORDER BY COUNT(*) DESC, user_id LIMIT 1
+    """) or first("SELECT MIN(user_id) FROM Users")
+    values = {
+        'user_id': user_id,
+        'item_id': first(f"SELECT MIN(item_id) FROM Wear_Logs WHERE user_id = {sql_literal(user_id)}"),
+        'wear_cutoff': cutoff('Wear_Logs', 'wear_date'),
+        'worn_cutoff': cutoff('Item_Wear_Stats', 'last_worn'),
+        'email': first(f"SELECT email FROM Users WHERE user_id = {sql_literal(user_id)}"),
+    }
+    return {name: sql_literal(value) for name, value in values.items()}
+
+def schema_version():
+    return db.execute("SELECT COALESCE(MAX(version), 0) FROM Schema_Version").fetchone()[0]
+
+def scan_types(plan):
+    # The "Type: ..." line of every scan in a rendered plan, e.g.
+    # ('Sequential Scan',) or ('Index Scan',)
+    types = []
+    for line in plan.splitlines():
+        text = line.strip(" │")
+        if text.startswith("Type:"):
+            types.append(text[len("Type:"):].strip())
+    return tuple(types)
+
+def explain_plans(values):
+    # Plain EXPLAIN always reports a sequential scan; whether an index is
+    # used is only decided at run time, so the probes are profiled with the
+    # probe_values() literals. A probe whose table doesn't exist yet maps to
+    # None.
+    plans = {}
+    for name, sql in PLAN_PROBES.items():
+        try:
+            plans[name] = scan_types(
+                db.execute(f"EXPLAIN ANALYZE {sql.format(**values)}").fetchall()[0][1])
+        except duckdb.CatalogException:
+            plans[name] = None
+    return plans
+
+def describe_plan(types):
+    if types is None:
+        return "no table"
+    return ", ".join(types) or "no scan"
+
+def migrate(verbose=True):
+    db.execute("""
+        CREATE TABLE IF NOT EXISTS Schema_Version (
+            version INTEGER PRIMARY KEY,
+            description VARCHAR NOT NULL,
+            applied_at TIMESTAMP DEFAULT current_timestamp
+        )
+    """)
+    
+    current = schema_version()
+    pending = [m for m in MIGRATIONS if m[0] > current]
+    if not pending:
+        return
+    
+    if verbose:
+        # The same literals before and after, picked before any step runs
+        values = probe_values()
+        plans_before = explain_plans(values)
+    for version, description, statements in pending:
+        with transaction():
+            for statement in statements:
+                db.execute(statement)
+            db.execute("INSERT INTO Schema_Version (version, description) VALUES (?, ?)",
+                       [version, description])
+        if verbose:
+            print(f"Applied schema migration {version}: {description}")
+    if not verbose:
+        return
+    # Tables the steps created have rows to pick from now
+    values = {name: value if value != "NULL" else new
+              for (name, value), new in zip(values.items(), probe_values().values())}
+    plans_after = explain_plans(values)
+    
+    changed = [f"{name} ({describe_plan(plans_before[name])} -> {describe_plan(plans_after[name])})"
+               for name in PLAN_PROBES if plans_before[name] != plans_after[name]]
+    if changed:
+        print("Query plans changed: " + "; ".join(changed))
+    else:
+        print("No query plans changed.")
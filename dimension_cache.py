@@ -0,0 +1,36 @@
+from statements import DIMENSIONS, run
+
+# Lookup tables (see statements.DIMENSIONS) served from memory for the
+# logged-in user: user_id -> {table: [(id, name), ...]}
+_cache = {}
+_stats = {'hits': 0, 'misses': 0}
+
+def load_dimensions(user_id):
+    # Fill the cache for every lookup table in one pass, e.g. at login
+    _cache[user_id] = {}
+    for table, _, _ in DIMENSIONS.values():
+        _fetch(user_id, table)
+
+def get_dimension(user_id, table):
+    # [(id, name), ...] for one lookup table, in insertion order
+    values = _cache.get(user_id, {}).get(table)
+    if values is not None:
+        _stats['hits'] += 1
+        return values
+    _stats['misses'] += 1
+    return _fetch(user_id, table)
+
+def invalidate_dimension(user_id, table):
+    # Call after inserting a new value into one of the lookup tables
+    _cache.get(user_id, {}).pop(table, None)
+
+def clear_dimensions(user_id):
+    _cache.pop(user_id, None)
+
+def dimension_cache_stats():
+    return dict(_stats)
+
+def _fetch(user_id, table):
+    values = run(f"dimension_values_{table.lower()}", [user_id]).fetchall()
+    _cache.setdefault(user_id, {})[table] = values
+    return values
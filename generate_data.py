@@ -0,0 +1,137 @@
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+# Fills a new DuckDB file with synthetic wardrobes for load testing, e.g.
+#
+#   python generate_data.py bench.db --users 100 --items 500 --wears 20000
+#
+# Every row is generated set-based inside DuckDB. Randomness comes from
+# hash(row, seed), so the same arguments always produce the same data
+# regardless of thread count. Item popularity and wear dates are skewed the
+# way real wardrobes are: a few favourites account for most wears, and
+# recent dates are denser than old ones.
+
+def rnd(expr, seed, salt):
+    # Deterministic pseudo-random DOUBLE in [0, 1) for a row expression
+    return f"((hash({expr}, {seed}, {salt}) % 1000000) / 1000000.0)"
+
+def dimension_rows(table, id_col, label, per_user, users):
+    return f"""
+        INSERT INTO {table} ({id_col}, user_id, name)
+        SELECT u * {per_user} + k + 1, u + 1, '{label} ' || (k + 1)
+        FROM range({users}) t1(u), range({per_user}) t2(k)
+    """
+
+def generate(db, args):
+    seed = args.seed
+    users = args.users
+    items = args.items
+    today = date.today()
+
+    db.execute(f"""
+        INSERT INTO Users (user_id, name, email, password)
+        SELECT u + 1, 'User ' || (u + 1), 'user' || (u + 1) || '@example.com', 'password'
+        FROM range({users}) t(u)
+    """)
+
+    for table, id_col, label, per_user in [
+            ('Categories', 'category_id', 'Category', args.categories),
+            ('Colors', 'color_id', 'Color', args.colors),
+            ('Sizes', 'size_id', 'Size', args.sizes),
+            ('Brands', 'brand_id', 'Brand', args.brands)]:
+        db.execute(dimension_rows(table, id_col, label, per_user, users))
+
+    # Item n of user u gets item_id u * items + n + 1; dimension ids index
+    # into that user's own block of dimension rows
+    db.execute(f"""
+        INSERT INTO Clothing_Items
+        SELECT
+            r + 1,
+            r // {items} + 1,
+            'Item ' || (r % {items} + 1),
+            (r // {items}) * {args.categories} + CAST(floor({rnd('r', seed, 1)} * {args.categories}) AS INTEGER) + 1,
+            (r // {items}) * {args.colors} + CAST(floor({rnd('r', seed, 2)} * {args.colors}) AS INTEGER) + 1,
+            (r // {items}) * {args.sizes} + CAST(floor({rnd('r', seed, 3)} * {args.sizes}) AS INTEGER) + 1,
+            (r // {items}) * {args.brands} + CAST(floor({rnd('r', seed, 4)} * {args.brands}) AS INTEGER) + 1,
+            DATE '{today}' - CAST(floor({rnd('r', seed, 5)} * {args.days}) AS INTEGER),
+            CASE WHEN {rnd('r', seed, 6)} < 0.05 THEN NULL
+                 ELSE round(5 + pow({rnd('r', seed, 7)}, 2) * 295, 2) END
+        FROM range({users * items}) t(r)
+    """)
+
+    # pow(x, 3) favours low item numbers (favourites); pow(x, 2) on the
+    # fraction of time since purchase pulls wear dates towards today
+    db.execute(f"""
+        INSERT INTO Wear_Logs
+        SELECT
+            w.r + 1,
+            i.user_id,
+            i.item_id,
+            i.purchase_date + CAST(floor((1 - pow({rnd('w.r', seed, 9)}, 2))
+                                         * (DATE '{today}' - i.purchase_date)) AS INTEGER)
+        FROM (
+            SELECT r, (r // {args.wears}) * {items}
+                      + CAST(floor(pow({rnd('r', seed, 8)}, 3) * {items}) AS INTEGER) + 1 as item_id
+            FROM range({users * args.wears}) t(r)
+        ) w
+        JOIN Clothing_Items i ON w.item_id = i.item_id
+    """)
+
+def rebuild_sequences_and_rollups(db, users, items):
+    from database import reseed_id_sequences
+    from item_management import update_monthly_spend
+    from wear_entry_management import rebuild_wear_rollups, refresh_item_wear_stats
+
+    # Rows were inserted with explicit ids; reseed sequences after them
+    reseed_id_sequences()
+
+    item_ids = list(range(1, users * items + 1))
+    update_monthly_spend(item_ids, 1)
+    refresh_item_wear_stats(item_ids)
+    rebuild_wear_rollups()
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Smart Wardrobe database")
+    parser.add_argument('path', help="database file to create (must not exist)")
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--items', type=int, default=200, help="clothing items per user")
+    parser.add_argument('--wears', type=int, default=5000, help="wear logs per user")
+    parser.add_argument('--categories', type=int, default=8, help="categories per user")
+    parser.add_argument('--colors', type=int, default=12, help="colors per user")
+    parser.add_argument('--sizes', type=int, default=6, help="sizes per user")
+    parser.add_argument('--brands', type=int, default=20, help="brands per user")
+    parser.add_argument('--days', type=int, default=3 * 365,
+                        help="purchase dates are spread over this many past days")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if os.path.exists(args.path):
+        parser.error(f"{args.path} already exists; choose a new file")
+    for name in ('users', 'items', 'wears', 'categories', 'colors', 'sizes', 'brands', 'days'):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name} must be at least 1")
+
+    from database import db, create_tables, transaction
+    db.configure(path=args.path)
+    create_tables()
+
+    start = time.perf_counter()
+    try:
+        with transaction():
+            generate(db, args)
+            rebuild_sequences_and_rollups(db, args.users, args.items)
+    except Exception as e:
+        print(f"Error generating data: {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Generated {args.users} users, {args.users * args.items} items and "
+          f"{args.users * args.wears} wear logs in {elapsed:.1f}s -> {args.path}")
+    db.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
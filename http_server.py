@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import duckdb
+import json
+import random
+from urllib.parse import urlsplit, parse_qs
+
+from database import create_tables, use_user_database
+import wardrobe_service as service
+
+# Small local JSON API over wardrobe_service. One asyncio loop accepts many
+# concurrent clients; queries run on worker threads, each with its own
+# database cursor, so slow reports don't block other requests.
+#
+#   GET  /items?user_id=1&brand=Nike&purchased_from=2024-01-01
+#   GET  /wear-logs?user_id=1&category=Tops&start=2024-01-01&end=2024-12-31&limit=100
+#   POST /wear-logs            {"user_id": 1, "item_ids": [3, 5], "dates": ["2024-05-01"]}
+#   GET  /analytics/wear-counts?user_id=1&dimension=brand&value=Nike
+#   GET  /analytics/composition?user_id=1&dimension=color
+#   GET  /analytics/cost-per-wear?user_id=1&dimension=category&value=Tops
+#   GET  /analytics/cost-per-wear?user_id=1&dimension=category   (one row per category)
+#   GET  /analytics/monthly-expenses?user_id=1&year=2024
+#   GET  /analytics/daily-expenses?user_id=1&year=2024&month=5
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Two requests writing the same rows (e.g. logging one item twice at once)
+# make DuckDB abort one transaction; it is rolled back whole, so the request
+# is run again after a short random delay. One that still conflicts gets 409.
+WRITE_ATTEMPTS = 8
+RETRY_DELAY_S = 0.02
+
+ROUTES = {
+    ('GET', '/items'): (service.list_items,
+                        ['category', 'color', 'size', 'brand', 'purchased_from', 'purchased_to']),
+    ('GET', '/wear-logs'): (service.list_wear_logs,
+                            ['item_id', 'category', 'color', 'size', 'brand', 'start', 'end', 'limit']),
+    ('POST', '/wear-logs'): (service.add_wears, ['item_ids', 'dates']),
+    ('GET', '/analytics/wear-counts'): (service.wear_counts, ['dimension', 'value']),
+    ('GET', '/analytics/composition'): (service.wardrobe_composition, ['dimension']),
+    ('GET', '/analytics/cost-per-wear'): (service.cost_per_wear, ['dimension', 'value']),
+    ('GET', '/analytics/monthly-expenses'): (service.monthly_expenses, ['year']),
+    ('GET', '/analytics/daily-expenses'): (service.daily_expenses, ['year', 'month']),
+}
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 409: 'Conflict',
+               413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+def dispatch(method, target, body):
+    # Returns (status, payload) for one request; runs on a worker thread
+    url = urlsplit(target)
+    route = ROUTES.get((method, url.path))
+    if route is None:
+        return 404, {'error': f"No route for {method} {url.path}"}
+    handler, arg_names = route
+
+    if method == 'POST':
+        args = json.loads(body or b'{}')
+        if not isinstance(args, dict):
+            raise ValueError("Request body must be a JSON object")
+    else:
+        args = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+    if 'user_id' not in args:
+        raise ValueError("user_id is required")
+    kwargs = {name: args[name] for name in arg_names if name in args}
+    for name in ('item_id', 'limit'):
+        if name in kwargs:
+            kwargs[name] = int(kwargs[name])
+    user_id = int(args['user_id'])
+    use_user_database(user_id)
+    return 200, handler(user_id, **kwargs)
+
+async def dispatch_with_retry(method, target, body):
+    for attempt in range(1, WRITE_ATTEMPTS + 1):
+        try:
+            return await asyncio.to_thread(dispatch, method, target, body)
+        except duckdb.TransactionException:
+            if attempt == WRITE_ATTEMPTS:
+                raise
+            await asyncio.sleep(random.uniform(0, RETRY_DELAY_S * 2 ** attempt))
+
+class BodyTooLarge(ValueError):
+    pass
+
+async def read_request(reader):
+    # (method, target, body) of one request; ValueError if it is malformed
+    request_line = (await reader.readline()).decode('latin-1').split()
+    if len(request_line) < 2:
+        raise ValueError("Malformed request line")
+    method, target = request_line[0].upper(), request_line[1]
+
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode('latin-1').strip()
+        if not line:
+            break
+        key, _, value = line.partition(':')
+        headers[key.strip().lower()] = value.strip()
+
+    length = headers.get('content-length', '0')
+    if not length.isdigit():
+        raise ValueError("Invalid Content-Length header")
+    length = int(length)
+    if length > MAX_BODY_BYTES:
+        raise BodyTooLarge("Request body too large")
+    body = await reader.readexactly(length) if length else b''
+    return method, target, body
+
+async def handle_client(reader, writer):
+    try:
+        try:
+            method, target, body = await read_request(reader)
+            status, payload = await dispatch_with_retry(method, target, body)
+        except BodyTooLarge as e:
+            status, payload = 413, {'error': str(e)}
+        except (ValueError, TypeError, KeyError) as e:
+            status, payload = 400, {'error': str(e)}
+        except duckdb.TransactionException as e:
+            status, payload = 409, {'error': f"Write conflict, please retry: {e}"}
+        except (ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception as e:
+            status, payload = 500, {'error': str(e)}
+
+        data = json.dumps(payload, default=service.json_default).encode()
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode() + data)
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(host, port):
+    server = await asyncio.start_server(handle_client, host, port)
+    print(f"Smart Wardrobe API listening on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local JSON API for Smart Wardrobe Tracker")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args()
+
+    create_tables()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+if __name__ == "__main__":
+    main()
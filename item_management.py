@@ -1,29 +1,18 @@
-from database import db
+from database import db, next_id, transaction, wear_rollup_upsert
 from datetime import datetime
+from wear_entry_management import IMPORT_REJECTS_SHOWN, refresh_item_wear_stats, remove_item_wear_rollups
+from dimension_cache import get_dimension, invalidate_dimension
+from pager import browse, PAGE_SIZE
+from statements import DIMENSIONS, run
 
-def view_all_items(user_id):
-    print("\n=== All Clothing Items ===")
-    
-    items = db.execute("""
-        SELECT i.item_id, i.name, c.name as category, co.name as color, 
-               s.name as size, b.name as brand, 
-               i.purchase_date, CASE 
-                   WHEN i.price IS NULL OR i.price = 0 THEN NULL 
-                   ELSE i.price 
-               END as price
-        FROM Clothing_Items i
-        JOIN Categories c ON i.category_id = c.category_id
-        JOIN Colors co ON i.color_id = co.color_id
-        JOIN Sizes s ON i.size_id = s.size_id
-        JOIN Brands b ON i.brand_id = b.brand_id
-        WHERE i.user_id = ?
-        ORDER BY c.category_id ASC, i.name
-    """, [user_id]).fetchall()
-    
-    if not items:
-        print("No items found in your wardrobe.")
-        return
-    
+def fetch_item_page(user_id, direction, key):
+    # One keyset page of items ordered by (category_id, name, item_id);
+    # see pager.browse for the meaning of direction and key
+    params = list(key) if direction in ('next', 'prev') else []
+    return run(f"item_page_{direction}",
+               [user_id] + params + [PAGE_SIZE + 1]).fetchmany(PAGE_SIZE + 1)
+
+def print_item_page(items):
     print(f"\n{'#':<3} | {'Category':<9} | {'Name':<12} | {'Color':<7} | {'Size':<4} | {'Brand':<9} | {'Price':<9} | {'Purchased':<10}")
     print("-" * 82)
     
@@ -39,6 +28,13 @@ def view_all_items(user_id):
         print("{:<3} | {:<9} | {:<12} | {:<7} | {:<4} | {:<9} | {:<9} | {:<10}".format(
             i, category, name, color, size, brand, price_display, date))
 
+def view_all_items(user_id):
+    print("\n=== All Clothing Items ===")
+    
+    browse(lambda direction, key: fetch_item_page(user_id, direction, key),
+           print_item_page, lambda item: (item[8], item[1], item[0]),
+           empty_message="No items found in your wardrobe.")
+
 
 def add_clothing_item(user_id):
     print("\n=== Add New Clothing Item ===")
@@ -47,27 +43,26 @@ def add_clothing_item(user_id):
     # Get category
     print("\nSelect category:")
     print("0. Add new category")
-    categories = db.execute("SELECT category_id, name FROM Categories WHERE user_id = ?", 
-                          [user_id]).fetchall()
+    categories = get_dimension(user_id, 'Categories')
     for i, category in enumerate(categories, 1):
         print(f"{i}. {category[1]}")
     
     category_choice = input("Enter category number: ")
     if category_choice == '0':
         category_name = input("Enter new category name: ")
-        last_id = db.execute("SELECT MAX(category_id) FROM Categories").fetchone()[0]
-        category_id = 1 if last_id is None else last_id + 1
-        db.execute("INSERT INTO Categories (category_id, user_id, name) VALUES (?, ?, ?)", 
-                  (category_id, user_id, category_name))
+        category_id = db.execute(
+            f"INSERT INTO Categories (category_id, user_id, name) VALUES ({next_id('Categories')}, ?, ?) RETURNING category_id",
+            (user_id, category_name)).fetchone()[0]
+        invalidate_dimension(user_id, 'Categories')
     else:
         category_id = categories[int(category_choice)-1][0]
     
     # Get or add color
-    colors = db.execute("SELECT * FROM Colors WHERE user_id = ?", [user_id]).fetchall()
+    colors = get_dimension(user_id, 'Colors')
     print("\nSelect color:")
     print("0. Add new color")
     for i, color in enumerate(colors, 1):
-        print(f"{i}. {color[2]}")
+        print(f"{i}. {color[1]}")
     
     while True:
         try:
@@ -75,11 +70,10 @@ def add_clothing_item(user_id):
             if choice == 0:
                 new_color = input("Enter new color name: ").strip()
                 if new_color:
-                    last_id = db.execute("SELECT MAX(color_id) FROM Colors").fetchone()[0]
-                    new_color_id = 1 if last_id is None else last_id + 1
-                    db.execute("INSERT INTO Colors (color_id, user_id, name) VALUES (?, ?, ?)",
-                             (new_color_id, user_id, new_color))
-                    color_id = new_color_id
+                    color_id = db.execute(
+                        f"INSERT INTO Colors (color_id, user_id, name) VALUES ({next_id('Colors')}, ?, ?) RETURNING color_id",
+                        (user_id, new_color)).fetchone()[0]
+                    invalidate_dimension(user_id, 'Colors')
                     break
             elif 1 <= choice <= len(colors):
                 color_id = colors[choice-1][0]
@@ -89,11 +83,11 @@ def add_clothing_item(user_id):
         print("Invalid choice. Please try again.")
     
     # Get or add size
-    sizes = db.execute("SELECT * FROM Sizes WHERE user_id = ?", [user_id]).fetchall()
+    sizes = get_dimension(user_id, 'Sizes')
     print("\nSelect size:")
     print("0. Add new size")
     for i, size in enumerate(sizes, 1):
-        print(f"{i}. {size[2]}")
+        print(f"{i}. {size[1]}")
     
     while True:
         try:
@@ -101,11 +95,10 @@ def add_clothing_item(user_id):
             if choice == 0:
                 new_size = input("Enter new size name: ").strip()
                 if new_size:
-                    last_id = db.execute("SELECT MAX(size_id) FROM Sizes").fetchone()[0]
-                    new_size_id = 1 if last_id is None else last_id + 1
-                    db.execute("INSERT INTO Sizes (size_id, user_id, name) VALUES (?, ?, ?)",
-                             (new_size_id, user_id, new_size))
-                    size_id = new_size_id
+                    size_id = db.execute(
+                        f"INSERT INTO Sizes (size_id, user_id, name) VALUES ({next_id('Sizes')}, ?, ?) RETURNING size_id",
+                        (user_id, new_size)).fetchone()[0]
+                    invalidate_dimension(user_id, 'Sizes')
                     break
             elif 1 <= choice <= len(sizes):
                 size_id = sizes[choice-1][0]
@@ -115,11 +108,11 @@ def add_clothing_item(user_id):
         print("Invalid choice. Please try again.")
     
     # Get or add brand
-    brands = db.execute("SELECT * FROM Brands WHERE user_id = ?", [user_id]).fetchall()
+    brands = get_dimension(user_id, 'Brands')
     print("\nSelect brand:")
     print("0. Add new brand")
     for i, brand in enumerate(brands, 1):
-        print(f"{i}. {brand[2]}")
+        print(f"{i}. {brand[1]}")
     
     while True:
         try:
@@ -127,11 +120,10 @@ def add_clothing_item(user_id):
             if choice == 0:
                 new_brand = input("Enter new brand name: ").strip()
                 if new_brand:
-                    last_id = db.execute("SELECT MAX(brand_id) FROM Brands").fetchone()[0]
-                    new_brand_id = 1 if last_id is None else last_id + 1
-                    db.execute("INSERT INTO Brands (brand_id, user_id, name) VALUES (?, ?, ?)",
-                             (new_brand_id, user_id, new_brand))
-                    brand_id = new_brand_id
+                    brand_id = db.execute(
+                        f"INSERT INTO Brands (brand_id, user_id, name) VALUES ({next_id('Brands')}, ?, ?) RETURNING brand_id",
+                        (user_id, new_brand)).fetchone()[0]
+                    invalidate_dimension(user_id, 'Brands')
                     break
             elif 1 <= choice <= len(brands):
                 brand_id = brands[choice-1][0]
@@ -170,80 +162,339 @@ def add_clothing_item(user_id):
 
     try:
         # Insert new item without wear_count
-        last_id = db.execute("SELECT MAX(item_id) FROM Clothing_Items").fetchone()[0]
-        item_id = 1 if last_id is None else last_id + 1
-        
-        db.execute("""
-            INSERT INTO Clothing_Items (
-                item_id, user_id, name, category_id, color_id, 
-                size_id, brand_id, purchase_date, price
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (item_id, user_id, name, category_id, color_id, 
-              size_id, brand_id, purchase_date, price))
+        with transaction():
+            item_id = db.execute(f"""
+                INSERT INTO Clothing_Items (
+                    item_id, user_id, name, category_id, color_id, 
+                    size_id, brand_id, purchase_date, price
+                ) VALUES ({next_id('Clothing_Items')}, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING item_id
+            """, (user_id, name, category_id, color_id, 
+                  size_id, brand_id, purchase_date, price)).fetchone()[0]
+            update_monthly_spend([item_id], 1)
+            refresh_item_wear_stats([item_id])
         
         print("\nItem added successfully!")
         
     except Exception as e:
         print(f"Error adding clothing item: {e}")
 
+# Item import files have a column per dimension (named as in
+# statements.DIMENSIONS); these may be left out (price unknown, purchased today)
+ITEM_IMPORT_OPTIONAL = ('price', 'purchase_date')
 
-def remove_clothing_item(user_id):
-    print("\n=== Remove Clothing Item ===")
-    
-    items = db.execute("""
-        SELECT i.item_id, i.name, c.name as category, co.name as color, 
-               s.name as size, b.name as brand, 
-               i.purchase_date, i.price
-        FROM Clothing_Items i
-        JOIN Categories c ON i.category_id = c.category_id
-        JOIN Colors co ON i.color_id = co.color_id
-        JOIN Sizes s ON i.size_id = s.size_id
-        JOIN Brands b ON i.brand_id = b.brand_id
-        WHERE i.user_id = ?
-        ORDER BY c.name, i.name
-    """, [user_id]).fetchall()
+def bulk_import_items(user_id, path):
+    # Stage a CSV or JSON file with DuckDB's readers, validate every row in
+    # one pass, add the category/color/size/brand names the user doesn't
+    # have yet, resolve all names to ids with one join and insert the valid
+    # items in a single transaction. Names match case-insensitively.
+    # Returns (imported_count, rejected_count, first rejected rows as
+    # (row_num, name, reason))
+    if path.lower().endswith(('.json', '.jsonl', '.ndjson')):
+        source = "read_json_auto(?)"
+    else:
+        source = "read_csv(?, header = true, all_varchar = true)"
     
-    if not items:
-        print("No items found in your wardrobe.")
+    columns = {row[0].lower(): row[0] for row in db.execute(
+        f"DESCRIBE SELECT * FROM {source}", [path]).fetchall()}
+    missing = [c for c in ['name', *DIMENSIONS] if c not in columns]
+    if missing:
+        raise ValueError(f"File is missing column(s): {', '.join(missing)}")
+    
+    def text(column):
+        if column not in columns:
+            return "NULL"
+        quoted = columns[column].replace('"', '""')
+        return f"""NULLIF(trim(CAST("{quoted}" AS VARCHAR)), '')"""
+    
+    dimension_checks = "\n".join(
+        f"WHEN {column} IS NULL THEN 'Missing {column}'" for column in DIMENSIONS)
+    
+    with transaction():
+        db.execute(f"""
+            CREATE OR REPLACE TEMP TABLE item_import AS
+            WITH raw AS (
+                SELECT row_number() OVER () AS row_num,
+                       {text('name')} AS name,
+                       {', '.join(f"{text(c)} AS {c}" for c in DIMENSIONS)},
+                       {text('price')} AS raw_price,
+                       {text('purchase_date')} AS raw_date
+                FROM {source}
+            ),
+            parsed AS (
+                SELECT *,
+                       TRY_CAST(replace(raw_price, '$', '') AS DECIMAL(10,2)) AS price,
+                       COALESCE(TRY_CAST(raw_date AS DATE),
+                                CAST(try_strptime(raw_date, '%d/%m/%Y') AS DATE)) AS purchase_date
+                FROM raw
+            )
+            SELECT *,
+                   CASE
+                       WHEN name IS NULL THEN 'Missing name'
+                       {dimension_checks}
+                       WHEN raw_price IS NOT NULL AND price IS NULL THEN 'Invalid price'
+                       WHEN price < 0 THEN 'Negative price'
+                       WHEN raw_date IS NOT NULL AND purchase_date IS NULL THEN 'Invalid date'
+                   END AS error
+            FROM parsed
+        """, [path])
+        
+        # Missing dimension values, one set-based INSERT per lookup table
+        for column, (table, id_col, _) in DIMENSIONS.items():
+            db.execute(f"""
+                INSERT INTO {table} ({id_col}, user_id, name)
+                SELECT {next_id(table)}, ?, name
+                FROM (
+                    SELECT MIN({column}) AS name
+                    FROM item_import
+                    WHERE error IS NULL
+                    GROUP BY lower({column})
+                ) new
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM {table} t
+                    WHERE t.user_id = ? AND lower(t.name) = lower(new.name)
+                )
+            """, [user_id, user_id])
+        
+        lookups = "\n".join(f"""
+            JOIN (SELECT lower(name) AS name_key, MIN({id_col}) AS id
+                  FROM {table} WHERE user_id = ? GROUP BY lower(name)) {column}_ids
+              ON lower(r.{column}) = {column}_ids.name_key"""
+            for column, (table, id_col, _) in DIMENSIONS.items())
+        item_ids = [row[0] for row in db.execute(f"""
+            INSERT INTO Clothing_Items (
+                item_id, user_id, name, category_id, color_id,
+                size_id, brand_id, purchase_date, price
+            )
+            SELECT {next_id('Clothing_Items')}, ?, r.name, category_ids.id, color_ids.id,
+                   size_ids.id, brand_ids.id, COALESCE(r.purchase_date, current_date), r.price
+            FROM item_import r
+            {lookups}
+            WHERE r.error IS NULL
+            RETURNING item_id
+        """, [user_id] + [user_id] * len(DIMENSIONS)).fetchall()]
+        update_monthly_spend(item_ids, 1)
+        refresh_item_wear_stats(item_ids)
+        
+        rejected = db.execute("""
+            SELECT row_num, name, error
+            FROM item_import
+            WHERE error IS NOT NULL
+            ORDER BY row_num
+            LIMIT ?
+        """, [IMPORT_REJECTS_SHOWN]).fetchall()
+        rejected_total = db.execute(
+            "SELECT COUNT(*) FROM item_import WHERE error IS NOT NULL").fetchone()[0]
+        
+        db.execute("DROP TABLE item_import")
+    
+    for table, _, _ in DIMENSIONS.values():
+        invalidate_dimension(user_id, table)
+    return len(item_ids), rejected_total, rejected
+
+def import_clothing_items(user_id):
+    print("\n=== Import Clothing Items ===")
+    print("The file needs name, category, color, size and brand columns, and may")
+    print("have price and purchase_date (yyyy-mm-dd or dd/mm/yyyy) columns.")
+    print("New category, color, size and brand names are added automatically.")
+    print("CSV and JSON files are supported.")
+    
+    path = input("\nEnter file path (press Enter to go back): ").strip()
+    if not path:
         return
     
-    print("\nSelect item to remove:")
-    print("0. Back to Main Menu")
+    try:
+        imported, rejected_total, rejected = bulk_import_items(user_id, path)
+    except Exception as e:
+        print(f"Error importing clothing items: {e}")
+        return
     
-    print(f"\n{'#':<3} | {'Category':<9} | {'Name':<12} | {'Color':<7} | {'Size':<4} | {'Brand':<9} | {'Price':<9} | {'Purchased':<10}")
-    print("-" * 82)
+    print(f"\nImported {imported} clothing items.")
+    if not rejected_total:
+        return
     
-    for i, item in enumerate(items, 1):
-        category = item[2][:9]
-        name = (item[1][:10] + '..') if len(item[1]) > 12 else item[1]
-        color = item[3][:7]
-        size = item[4][:4]
-        brand = item[5][:9]
-        price_display = f"${item[7]:.2f}" if item[7] is not None else "N/A"
-        date = str(item[6]) if item[6] else "N/A"
+    print(f"Rejected {rejected_total} rows:")
+    print(f"\n{'Row':<8} | {'Name':<20} | {'Reason':<20}")
+    print("-" * 54)
+    for row_num, name, reason in rejected:
+        name = str(name) if name is not None else "N/A"
+        if len(name) > 20:
+            name = name[:18] + ".."
+        print(f"{row_num:<8} | {name:<20} | {reason:<20}")
+    if rejected_total > len(rejected):
+        print(f"... and {rejected_total - len(rejected)} more")
+
+
+def update_monthly_spend(item_ids, sign):
+    # Add (sign=1) or subtract (sign=-1) the given items' prices to the
+    # Monthly_Spend rollup. Call in the same transaction that inserts the
+    # items, or in the deleting transaction before the DELETE runs.
+    db.execute("""
+        INSERT INTO Monthly_Spend (user_id, month, total, item_count)
+        SELECT user_id, CAST(date_trunc('month', purchase_date) AS DATE),
+               ? * COALESCE(SUM(price), 0), ? * COUNT(*)
+        FROM Clothing_Items
+        WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+          AND purchase_date IS NOT NULL
+        GROUP BY ALL
+        ON CONFLICT (user_id, month) DO UPDATE SET
+            total = total + excluded.total,
+            item_count = item_count + excluded.item_count
+    """, [sign, sign, list(item_ids)])
+
+
+def remove_items(user_id, item_ids):
+    # Remove items with their wear logs, outfit memberships, stats and rollup
+    # rows using set-based deletes. The logs go in a first transaction and
+    # the items in a second (see transaction()); a failure in between leaves
+    # items without logs, never logs without items, and each transaction
+    # keeps Wear_Rollups in step with what it deleted. Returns (items
+    # removed, wear logs removed).
+    item_ids = [row[0] for row in db.execute("""
+        SELECT item_id FROM Clothing_Items
+        WHERE user_id = ? AND item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+    """, [user_id, list(item_ids)]).fetchall()]
+    if not item_ids:
+        return 0, 0
+    
+    with transaction():
+        db.execute(wear_rollup_upsert("""
+            SELECT item_id, wear_date, -1 FROM Wear_Logs
+            WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+        """), [item_ids])
+        logs_removed = db.execute("""
+            DELETE FROM Wear_Logs WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+        """, [item_ids]).fetchone()[0]
+        db.execute("""
+            DELETE FROM Outfit_Items WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+        """, [item_ids])
+        refresh_item_wear_stats(item_ids)
+    # Then delete the items and take them out of the rollups (what is left
+    # there are their archived wears) and stats. Their archived logs stay in
+    # the Parquet files but drop out of Wear_History with the items, so they
+    # count as removed too.
+    with transaction():
+        logs_removed += db.execute("""
+            SELECT COALESCE(SUM(wear_count), 0) FROM Archived_Wear_Stats
+            WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+        """, [item_ids]).fetchone()[0]
+        update_monthly_spend(item_ids, -1)
+        remove_item_wear_rollups(item_ids)
+        for table in ('Item_Wear_Stats', 'Archived_Wear_Stats', 'Clothing_Items'):
+            db.execute(f"""
+                DELETE FROM {table} WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+            """, [item_ids])
+    return len(item_ids), logs_removed
+
+def find_items(user_id, dimension=None, value_id=None, bought_before=None):
+    # Items matching an optional dimension value and purchase date cutoff,
+    # in item page order
+    if dimension is not None:
+        return run(f"items_matching_{dimension}",
+                   [user_id, value_id, bought_before, bought_before]).fetchall()
+    return run("items_bought_before", [user_id, bought_before]).fetchall()
+
+def pick_items_to_remove(user_id):
+    print("\nSelect items to remove:")
+    items = browse(lambda direction, key: fetch_item_page(user_id, direction, key),
+                   print_item_page, lambda item: (item[8], item[1], item[0]),
+                   select_prompt="Enter item numbers separated by commas",
+                   select_many=True, empty_message="No items found in your wardrobe.")
+    return items or []
+
+def filter_items_to_remove(user_id):
+    dimensions = list(DIMENSIONS)
+    print("\nRemove items by:")
+    print("0. Any category, color, size and brand")
+    for i, dimension in enumerate(dimensions, 1):
+        print(f"{i}. {dimension.capitalize()}")
+    
+    choice = input("Enter choice: ")
+    dimension = value_id = None
+    if choice.isdigit() and 1 <= int(choice) <= len(dimensions):
+        dimension = dimensions[int(choice) - 1]
+        options = get_dimension(user_id, DIMENSIONS[dimension][0])
+        if not options:
+            print(f"No {dimension}s found.")
+            return []
         
-        print("{:<3} | {:<9} | {:<12} | {:<7} | {:<4} | {:<9} | {:<9} | {:<10}".format(
-            i, category, name, color, size, brand, price_display, date))
+        print(f"\nSelect {dimension}:")
+        for i, option in enumerate(options, 1):
+            print(f"{i}. {option[1]}")
+        
+        while True:
+            try:
+                filter_choice = int(input("Enter number: "))
+                if 1 <= filter_choice <= len(options):
+                    value_id = options[filter_choice-1][0]
+                    break
+            except ValueError:
+                pass
+            print("Invalid choice. Please try again.")
+    elif choice != '0':
+        print("Invalid choice.")
+        return []
     
     while True:
+        date_str = input("Only items purchased before (dd/mm/yyyy) or press Enter for any date: ")
+        if not date_str:
+            bought_before = None
+            break
         try:
-            choice = int(input("\nEnter item number: "))
-            if choice == 0:
-                return
-            if 1 <= choice <= len(items):
-                item_id = items[choice-1][0]
-                break
+            bought_before = datetime.strptime(date_str, '%d/%m/%Y').strftime('%Y-%m-%d')
+            break
         except ValueError:
-            pass
-        print("Invalid choice. Please try again.")
+            print("Invalid date format. Please use dd/mm/yyyy")
+    
+    if dimension is None and bought_before is None:
+        print("Choose a filter or a purchase date; use item numbers to remove everything.")
+        return []
+    
+    items = find_items(user_id, dimension, value_id, bought_before)
+    if not items:
+        print("\nNo items match that filter.")
+        return []
+    
+    print(f"\n{len(items)} matching items:")
+    print_item_page(items)
+    return items
+
+def remove_clothing_item(user_id):
+    print("\n=== Remove Clothing Items ===")
+    print("0. Back to Main Menu")
+    print("1. Select items by number")
+    print("2. Select items by filter")
     
-    confirm = input(f"\nAre you sure you want to remove {items[choice-1][1]}? (y/n): ")
+    choice = input("Enter choice: ")
+    if choice == '1':
+        items = pick_items_to_remove(user_id)
+    elif choice == '2':
+        items = filter_items_to_remove(user_id)
+    else:
+        if choice != '0':
+            print("Invalid choice.")
+        return
+    if not items:
+        return
+    
+    item_ids = [item[0] for item in items]
+    # Item_Wear_Stats counts archived logs as well as live ones
+    log_count = db.execute("""
+        SELECT COALESCE(SUM(wear_count), 0) FROM Item_Wear_Stats
+        WHERE item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+    """, [item_ids]).fetchone()[0]
+    
+    if len(items) == 1:
+        prompt = f"remove {items[0][1]}"
+    else:
+        prompt = f"remove these {len(items)} items"
+    confirm = input(f"\nAre you sure you want to {prompt} and {log_count} wear logs? (y/n): ")
     if confirm.lower() == 'y':
-        # Delete associated wear logs first
-        db.execute("DELETE FROM Wear_Logs WHERE item_id = ?", [item_id])
-        # Then delete the item
-        db.execute("DELETE FROM Clothing_Items WHERE item_id = ?", [item_id])
-        print("\nItem removed successfully!")
+        try:
+            removed, logs_removed = remove_items(user_id, item_ids)
+            print(f"\n{removed} items and {logs_removed} wear logs removed successfully!")
+        except Exception as e:
+            print(f"Error removing items: {e}")
     else:
         print("\nOperation cancelled.")
 
@@ -252,57 +503,37 @@ def search_filter_items(user_id):
     print("\n=== Search/Filter Items ===")
     print("Filter by:")
     print("0. Back to Main Menu")
-    print("1. Category")
-    print("2. Color")
-    print("3. Size")
-    print("4. Brand")
-    print("5. Purchase Date")
+    dimensions = list(DIMENSIONS)
+    for i, dimension in enumerate(dimensions, 1):
+        print(f"{i}. {dimension.capitalize()}")
+    print(f"{len(dimensions) + 1}. Purchase Date")
     
     choice = input("Enter choice: ")
     
     if choice == '0':
         return
 
-    if choice in ["1", "2", "3", "4"]:
-        tables = {
-            "1": ("Categories", "category"),
-            "2": ("Colors", "color"),
-            "3": ("Sizes", "size"),
-            "4": ("Brands", "brand")
-        }
-        
-        table_name, field_name = tables[choice]
-        options = db.execute(f"SELECT * FROM {table_name} WHERE user_id = ?", 
-                           [user_id]).fetchall()
+    if choice.isdigit() and 1 <= int(choice) <= len(dimensions):
+        field_name = dimensions[int(choice) - 1]
+        options = get_dimension(user_id, DIMENSIONS[field_name][0])
         
         print(f"\nSelect {field_name}:")
         for i, option in enumerate(options, 1):
-            print(f"{i}. {option[2]}")
+            print(f"{i}. {option[1]}")
         
         while True:
             try:
                 filter_choice = int(input("Enter number: "))
                 if 1 <= filter_choice <= len(options):
                     filter_id = options[filter_choice-1][0]
-                    id_field = f"{field_name}_id"
                     break
             except ValueError:
                 pass
             print("Invalid choice. Please try again.")
         
-        items = db.execute(f"""
-            SELECT i.name, c.name as category, co.name as color, 
-                   s.name as size, b.name as brand, i.purchase_date, i.price
-            FROM Clothing_Items i
-            JOIN Categories c ON i.category_id = c.category_id
-            JOIN Colors co ON i.color_id = co.color_id
-            JOIN Sizes s ON i.size_id = s.size_id
-            JOIN Brands b ON i.brand_id = b.brand_id
-            WHERE i.user_id = ? AND i.{id_field} = ?
-            ORDER BY i.name
-        """, (user_id, filter_id)).fetchall()
+        items = run(f"items_by_{field_name}", [user_id, filter_id]).fetchall()
         
-    elif choice == "5":
+    elif choice == str(len(dimensions) + 1):
         print("\nFilter by:")
         print("1. Specific date")
         print("2. Date range")
@@ -318,17 +549,7 @@ def search_filter_items(user_id):
                 except ValueError:
                     print("Invalid date format. Please use dd/mm/yyyy")
             
-            items = db.execute("""
-                SELECT i.name, c.name as category, co.name as color, 
-                       s.name as size, b.name as brand, i.purchase_date, i.price
-                FROM Clothing_Items i
-                JOIN Categories c ON i.category_id = c.category_id
-                JOIN Colors co ON i.color_id = co.color_id
-                JOIN Sizes s ON i.size_id = s.size_id
-                JOIN Brands b ON i.brand_id = b.brand_id
-                WHERE i.user_id = ? AND i.purchase_date = ?
-                ORDER BY i.name
-            """, (user_id, filter_date)).fetchall()
+            items = run("items_by_purchase_date", [user_id, filter_date]).fetchall()
             
         elif date_choice == "2":
             while True:
@@ -349,17 +570,7 @@ def search_filter_items(user_id):
                 except ValueError:
                     print("Invalid date format. Please use dd/mm/yyyy")
             
-            items = db.execute("""
-                SELECT i.name, c.name as category, co.name as color, 
-                       s.name as size, b.name as brand, i.purchase_date, i.price
-                FROM Clothing_Items i
-                JOIN Categories c ON i.category_id = c.category_id
-                JOIN Colors co ON i.color_id = co.color_id
-                JOIN Sizes s ON i.size_id = s.size_id
-                JOIN Brands b ON i.brand_id = b.brand_id
-                WHERE i.user_id = ? AND i.purchase_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)
-                ORDER BY i.name
-            """, (user_id, start_date, end_date)).fetchall()
+            items = run("items_by_purchase_range", [user_id, start_date, end_date]).fetchall()
     
     if not items:
         print("\nNo items found matching the filter criteria.")
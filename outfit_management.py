@@ -0,0 +1,190 @@
+from database import db, next_id, transaction
+from datetime import datetime
+
+from wear_entry_management import insert_wear_entries
+
+def fetch_outfits(user_id):
+    # Saved outfits as (outfit_id, name, item_count, item names)
+    return db.execute("""
+        SELECT o.outfit_id, o.name, COUNT(oi.item_id) as item_count,
+               COALESCE(string_agg(i.name, ', ' ORDER BY i.name), '') as items
+        FROM Outfits o
+        LEFT JOIN Outfit_Items oi ON o.outfit_id = oi.outfit_id
+        LEFT JOIN Clothing_Items i ON oi.item_id = i.item_id
+        WHERE o.user_id = ?
+        GROUP BY o.outfit_id, o.name
+        ORDER BY o.name
+    """, [user_id]).fetchall()
+
+def fetch_outfit_item_ids(outfit_id):
+    return [row[0] for row in db.execute(
+        "SELECT item_id FROM Outfit_Items WHERE outfit_id = ?", [outfit_id]).fetchall()]
+
+def save_outfit(user_id, name, item_ids):
+    # Create the outfit and its members in one transaction; items that don't
+    # belong to the user are skipped. Returns the new outfit_id.
+    with transaction():
+        outfit_id = db.execute(f"""
+            INSERT INTO Outfits (outfit_id, user_id, name)
+            VALUES ({next_id('Outfits')}, ?, ?)
+            RETURNING outfit_id
+        """, [user_id, name]).fetchone()[0]
+        db.execute("""
+            INSERT INTO Outfit_Items (outfit_id, item_id, user_id)
+            SELECT ?, item_id, user_id
+            FROM Clothing_Items
+            WHERE user_id = ? AND item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+        """, [outfit_id, user_id, list(item_ids)])
+    return outfit_id
+
+def print_outfits(outfits):
+    print(f"\n{'#':<3} | {'Outfit':<20} | {'Items':<5} | {'Members':<40}")
+    print("-" * 78)
+    for i, (_, name, item_count, items) in enumerate(outfits, 1):
+        if len(name) > 20:
+            name = name[:18] + ".."
+        if len(items) > 40:
+            items = items[:38] + ".."
+        print(f"{i:<3} | {name:<20} | {item_count:<5} | {items:<40}")
+
+def select_outfit(user_id, prompt):
+    # Show the saved outfits and return the chosen row, or None
+    outfits = fetch_outfits(user_id)
+    if not outfits:
+        print("No outfits saved yet.")
+        return None
+
+    print_outfits(outfits)
+    while True:
+        try:
+            choice = int(input(f"\n{prompt} (0 = back): "))
+            if choice == 0:
+                return None
+            if 1 <= choice <= len(outfits):
+                return outfits[choice-1]
+        except ValueError:
+            pass
+        print("Invalid choice. Please try again.")
+
+def view_outfits(user_id):
+    print("\n=== Saved Outfits ===")
+    outfits = fetch_outfits(user_id)
+    if not outfits:
+        print("No outfits saved yet.")
+        return
+    print_outfits(outfits)
+
+def create_outfit(user_id):
+    print("\n=== Create an Outfit ===")
+
+    items = db.execute("""
+        SELECT i.item_id, i.name, c.name as category
+        FROM Clothing_Items i
+        JOIN Categories c ON i.category_id = c.category_id
+        WHERE i.user_id = ?
+        ORDER BY c.name, i.name
+    """, [user_id]).fetchall()
+
+    if not items:
+        print("No items found in your wardrobe.")
+        return
+
+    print("\nSelect items:")
+    print("0. Back to Main Menu")
+    for i, item in enumerate(items, 1):
+        print(f"{i}. {item[1]} ({item[2]})")
+
+    # Get item selection, e.g. "1, 4, 7"
+    while True:
+        choice = input("\nEnter item numbers separated by commas: ").strip()
+        if choice == '0':
+            return
+        try:
+            choices = sorted({int(c) for c in choice.split(',') if c.strip()})
+            if len(choices) >= 2 and all(1 <= c <= len(items) for c in choices):
+                item_ids = [items[c-1][0] for c in choices]
+                break
+            if len(choices) == 1:
+                print("An outfit needs at least two items.")
+                continue
+        except ValueError:
+            pass
+        print("Invalid choice. Please try again.")
+
+    while True:
+        name = input("Enter outfit name: ").strip()
+        if name:
+            break
+        print("Outfit name cannot be empty.")
+
+    try:
+        save_outfit(user_id, name, item_ids)
+        print(f"\nOutfit '{name}' saved with {len(item_ids)} items!")
+    except Exception as e:
+        print(f"Error saving outfit: {e}")
+
+def wear_outfit(user_id):
+    print("\n=== Wear an Outfit ===")
+
+    outfit = select_outfit(user_id, "Enter outfit number to wear")
+    if outfit is None:
+        return
+
+    while True:
+        date_str = input("\nEnter wear date (dd/mm/yyyy) or press Enter for today: ")
+        if not date_str:
+            wear_date = datetime.now().date()
+            break
+        try:
+            wear_date = datetime.strptime(date_str, '%d/%m/%Y').date()
+            break
+        except ValueError:
+            print("Invalid date format. Please use dd/mm/yyyy")
+
+    # Every member is logged in one multi-row INSERT and transaction
+    try:
+        logged = insert_wear_entries(user_id, fetch_outfit_item_ids(outfit[0]), [wear_date])
+        print(f"\n{logged} wears logged for '{outfit[1]}' on {wear_date}!")
+    except Exception as e:
+        print(f"Error logging wears: {e}")
+
+def delete_outfit(user_id):
+    print("\n=== Delete an Outfit ===")
+
+    outfit = select_outfit(user_id, "Enter outfit number to delete")
+    if outfit is None:
+        return
+
+    confirm = input(f"\nAre you sure you want to delete '{outfit[1]}'? Its wear logs are kept. (y/n): ")
+    if confirm.lower() == 'y':
+        # Members first, then the outfit (see database.transaction())
+        with transaction():
+            db.execute("DELETE FROM Outfit_Items WHERE outfit_id = ?", [outfit[0]])
+        with transaction():
+            db.execute("DELETE FROM Outfits WHERE outfit_id = ?", [outfit[0]])
+        print("\nOutfit deleted successfully!")
+    else:
+        print("\nOperation cancelled.")
+
+def outfit_menu(user_id):
+    print("\nOutfits:")
+    print("0. Back to Main Menu")
+    print("1. View saved outfits")
+    print("2. Create an outfit")
+    print("3. Wear an outfit")
+    print("4. Delete an outfit")
+
+    choice = input("\nEnter your choice: ")
+
+    if choice == '0':
+        return
+    elif choice == '1':
+        view_outfits(user_id)
+    elif choice == '2':
+        create_outfit(user_id)
+    elif choice == '3':
+        wear_outfit(user_id)
+    elif choice == '4':
+        delete_outfit(user_id)
+    else:
+        print("Invalid choice.")
@@ -0,0 +1,95 @@
+from datetime import datetime
+
+# Rows shown per screen by the paged listings
+PAGE_SIZE = 20
+
+def browse(fetch_page, render_page, key_of, can_jump=False, select_prompt=None,
+           select_many=False, empty_message="No entries found."):
+    # Interactive pager over keyset-paginated results. Only one page of rows is
+    # held at a time, so memory and time-to-first-page don't grow with history.
+    #
+    # fetch_page(direction, key) returns up to PAGE_SIZE + 1 rows:
+    #   'first' - the first page (key is None)
+    #   'next'  - rows after key, in display order
+    #   'prev'  - rows before key, nearest first (the pager reverses them)
+    #   'date'  - rows on or before the date in key, in display order
+    # render_page(rows) prints one page numbered from 1; key_of(row) returns
+    # the row's sort key. With select_prompt, entering a row number returns
+    # that row; otherwise browse() returns None when the user leaves. With
+    # select_many as well, row numbers (e.g. "1, 4, 7") are added to a
+    # selection that can span pages, and 'f' returns the selected rows.
+    rows = fetch_page('first', None)
+    page = rows[:PAGE_SIZE]
+    if not page:
+        print(empty_message)
+        return None
+    has_next = len(rows) > PAGE_SIZE
+    has_prev = False
+    selected = {}
+
+    while True:
+        render_page(page)
+
+        options = []
+        if has_next:
+            options.append("n = next page")
+        if has_prev:
+            options.append("p = previous page")
+        if can_jump:
+            options.append("d = jump to date")
+        if selected:
+            options.append(f"f = finish ({len(selected)} selected)")
+        options.append("0 = back")
+        prompt = ", ".join(options)
+        if select_prompt:
+            prompt = f"{select_prompt}, or {prompt}"
+
+        choice = input(f"\n{prompt}: ").strip().lower()
+
+        if choice in ('0', 'q'):
+            return None
+        elif choice == 'n' and has_next:
+            rows = fetch_page('next', key_of(page[-1]))
+            page = rows[:PAGE_SIZE]
+            has_next = len(rows) > PAGE_SIZE
+            has_prev = True
+        elif choice == 'p' and has_prev:
+            rows = fetch_page('prev', key_of(page[0]))
+            if not rows:
+                print("Already at the first page.")
+                has_prev = False
+                continue
+            page = rows[:PAGE_SIZE][::-1]
+            has_prev = len(rows) > PAGE_SIZE
+            has_next = True
+        elif choice == 'd' and can_jump:
+            date_str = input("Enter date (dd/mm/yyyy): ")
+            try:
+                jump_date = datetime.strptime(date_str, '%d/%m/%Y').date()
+            except ValueError:
+                print("Invalid date format. Please use dd/mm/yyyy")
+                continue
+            rows = fetch_page('date', jump_date)
+            if not rows:
+                print("No entries on or before that date.")
+                continue
+            page = rows[:PAGE_SIZE]
+            has_next = len(rows) > PAGE_SIZE
+            has_prev = True
+        elif choice == 'f' and selected:
+            return list(selected.values())
+        elif select_many and select_prompt:
+            try:
+                choices = {int(c) for c in choice.split(',') if c.strip()}
+            except ValueError:
+                choices = set()
+            if not choices or not all(1 <= c <= len(page) for c in choices):
+                print("Invalid choice. Please try again.")
+                continue
+            for c in sorted(choices):
+                selected[key_of(page[c - 1])] = page[c - 1]
+            print(f"{len(selected)} selected.")
+        elif select_prompt and choice.isdigit() and 1 <= int(choice) <= len(page):
+            return page[int(choice) - 1]
+        else:
+            print("Invalid choice. Please try again.")
@@ -0,0 +1,102 @@
+import argparse
+import os
+import shutil
+import sys
+import time
+
+# Splits a shared wardrobe.db into the sharded layout: a catalog database
+# holding Users, plus one database per user under a shard directory. The
+# source file is only read, never changed.
+#
+#   python split_database.py wardrobe.db --catalog catalog.db --shard-dir shards
+#   WARDROBE_DB=catalog.db WARDROBE_SHARD_DIR=shards python main.py
+
+# Per-user tables copied into each shard, parents before children. The
+# Monthly_Spend, Item_Wear_Stats and Wear_Rollups rollups are rebuilt from
+# the copied rows. Archived wear logs are copied from the source's archive
+# to the catalog's (see database.wear_archive_path).
+SHARDED_TABLES = ['Categories', 'Colors', 'Sizes', 'Brands', 'Clothing_Items', 'Wear_Logs',
+                  'Archived_Wear_Stats', 'Outfits', 'Outfit_Items']
+
+def copy_user(db, user_id, source_archive):
+    from database import reseed_id_sequences, transaction, use_user_database, wear_archive_path
+    from item_management import update_monthly_spend
+    from wear_entry_management import rebuild_wear_rollups, refresh_item_wear_stats
+
+    # Before the shard's Wear_History view is built, so it includes them
+    partition = f"user_id={user_id}"
+    if (os.path.isdir(os.path.join(source_archive, partition))
+            and source_archive != wear_archive_path()):
+        shutil.copytree(os.path.join(source_archive, partition),
+                        os.path.join(wear_archive_path(), partition), dirs_exist_ok=True)
+
+    # Creates the shard with its schema and the user's Users row
+    use_user_database(user_id)
+    # Sources from before a table was added simply don't have it
+    present = {row[0] for row in db.execute(
+        "SELECT table_name FROM duckdb_tables() WHERE database_name = 'source'").fetchall()}
+    counts = {table: 0 for table in SHARDED_TABLES}
+    with transaction():
+        for table in SHARDED_TABLES:
+            if table not in present:
+                continue
+            counts[table] = db.execute(f"""
+                INSERT INTO {table} BY NAME
+                SELECT * FROM source.main.{table} WHERE user_id = ?
+            """, [user_id]).fetchone()[0]
+        reseed_id_sequences()
+
+        item_ids = [row[0] for row in db.execute(
+            "SELECT item_id FROM Clothing_Items").fetchall()]
+        update_monthly_spend(item_ids, 1)
+        refresh_item_wear_stats(item_ids)
+        rebuild_wear_rollups()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Split a shared wardrobe database into per-user shards")
+    parser.add_argument('source', help="existing shared database")
+    parser.add_argument('--catalog', required=True, help="catalog database to create (must not exist)")
+    parser.add_argument('--shard-dir', required=True, help="directory for the per-user databases")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.source):
+        parser.error(f"{args.source} does not exist")
+    if os.path.exists(args.catalog):
+        parser.error(f"{args.catalog} already exists; choose a new file")
+    if os.path.isdir(args.shard_dir) and os.listdir(args.shard_dir):
+        parser.error(f"{args.shard_dir} is not empty")
+
+    from database import (db, create_tables, reseed_id_sequences, transaction, use_catalog,
+                          wear_archive_path)
+    db.configure(path=args.catalog, shard_dir=args.shard_dir)
+    create_tables()
+
+    start = time.perf_counter()
+    try:
+        escaped = args.source.replace("'", "''")
+        db.execute(f"ATTACH '{escaped}' AS source (READ_ONLY)")
+        with transaction():
+            db.execute("INSERT INTO Users BY NAME SELECT * FROM source.main.Users")
+            reseed_id_sequences()
+
+        user_ids = [row[0] for row in db.execute(
+            "SELECT user_id FROM Users ORDER BY user_id").fetchall()]
+        for user_id in user_ids:
+            counts = copy_user(db, user_id, wear_archive_path(args.source))
+            use_catalog()
+            print(f"User {user_id}: {counts['Clothing_Items']} items, "
+                  f"{counts['Wear_Logs']} wear logs")
+    except Exception as e:
+        print(f"Error splitting database: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(f"\nSplit {len(user_ids)} users into {args.shard_dir} in "
+          f"{time.perf_counter() - start:.1f}s; catalog is {args.catalog}")
+    print(f"Run with WARDROBE_DB={args.catalog} WARDROBE_SHARD_DIR={args.shard_dir}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
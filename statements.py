@@ -0,0 +1,173 @@
+from database import db
+
+# Named, parameterized SQL for the queries the menus run over and over.
+# Each statement is parsed once per process and then executed with bound
+# parameters, so menu actions skip re-parsing the large joins and no call
+# site assembles SQL from strings. Use run('items_by_brand', [user_id, brand_id]).
+#
+# DuckDB's Python API can't bind parameters to EXECUTE of a PREPAREd
+# statement, so the reusable unit is the parsed statement; the optimizer
+# still plans each call with its actual parameter values.
+
+STATEMENTS = {}
+
+# Parsed duckdb.Statement per name, filled on first use
+_parsed = {}
+
+def register(name, sql):
+    if name in STATEMENTS:
+        raise ValueError(f"Statement '{name}' is already registered")
+    STATEMENTS[name] = sql
+
+def run(name, parameters=None):
+    statement = _parsed.get(name)
+    if statement is None:
+        parsed = db.connection.extract_statements(STATEMENTS[name])
+        if len(parsed) != 1:
+            raise ValueError(f"Statement '{name}' must contain exactly one SQL statement")
+        statement = _parsed[name] = parsed[0]
+    return db.execute(statement, parameters, tag=f"statement:{name}")
+
+# Item dimensions by short name: (lookup table, id column, alias in
+# ITEM_JOIN). The one place the app maps dimensions to tables; menus, the
+# service layer, the dimension cache and the importers all read it.
+DIMENSIONS = {
+    'category': ('Categories', 'category_id', 'c'),
+    'color': ('Colors', 'color_id', 'co'),
+    'size': ('Sizes', 'size_id', 's'),
+    'brand': ('Brands', 'brand_id', 'b'),
+}
+
+ITEM_JOIN = """
+    JOIN Categories c ON i.category_id = c.category_id
+    JOIN Colors co ON i.color_id = co.color_id
+    JOIN Sizes s ON i.size_id = s.size_id
+    JOIN Brands b ON i.brand_id = b.brand_id
+"""
+
+# Lookup values for the dimension cache: dimension_values_<table>
+for _table, _id_col, _ in DIMENSIONS.values():
+    register(f"dimension_values_{_table.lower()}", f"""
+        SELECT {_id_col}, name FROM {_table}
+        WHERE user_id = ?
+        ORDER BY {_id_col}
+    """)
+
+# Keyset pages of all items ordered by (category_id, name, item_id):
+# item_page_first / item_page_next / item_page_prev
+_ITEM_PAGE = """
+    SELECT i.item_id, i.name, c.name as category, co.name as color,
+           s.name as size, b.name as brand,
+           i.purchase_date, CASE
+               WHEN i.price IS NULL OR i.price = 0 THEN NULL
+               ELSE i.price
+           END as price, c.category_id
+    FROM Clothing_Items i
+    {join}
+    WHERE i.user_id = ? {condition}
+    ORDER BY c.category_id {order}, i.name {order}, i.item_id {order}
+    LIMIT ?
+"""
+for _direction, _condition, _order in [
+        ('first', "", "ASC"),
+        ('next', "AND (c.category_id, i.name, i.item_id) > (?, ?, ?)", "ASC"),
+        ('prev', "AND (c.category_id, i.name, i.item_id) < (?, ?, ?)", "DESC")]:
+    register(f"item_page_{_direction}",
+             _ITEM_PAGE.format(join=ITEM_JOIN, condition=_condition, order=_order))
+
+# Items to remove by filter, in item page order: items_matching_<dimension>
+# (with an optional purchase date cutoff, NULL for any date) and
+# items_bought_before
+_ITEM_MATCH = """
+    SELECT i.item_id, i.name, c.name as category, co.name as color,
+           s.name as size, b.name as brand, i.purchase_date, i.price
+    FROM Clothing_Items i
+    {join}
+    WHERE i.user_id = ? AND {condition}
+    ORDER BY c.category_id, i.name, i.item_id
+"""
+for _dimension, (_table, _id_col, _) in DIMENSIONS.items():
+    register(f"items_matching_{_dimension}",
+             _ITEM_MATCH.format(join=ITEM_JOIN,
+                                condition=f"i.{_id_col} = ? AND (CAST(? AS DATE) IS NULL "
+                                          "OR i.purchase_date < CAST(? AS DATE))"))
+register("items_bought_before",
+         _ITEM_MATCH.format(join=ITEM_JOIN, condition="i.purchase_date < CAST(? AS DATE)"))
+
+# Wear log reads below go through Wear_History so archived logs are included
+
+# Keyset pages of wear logs ordered by (wear_date, wear_id) descending:
+# wear_log_page_first / _next / _prev / _date. Date bounds are repeated as
+# year bounds so only the matching archive partitions are read.
+_WEAR_LOG_PAGE = """
+    SELECT w.wear_id, w.wear_date, i.name as item_name, c.name as category,
+           co.name as color, s.name as size, b.name as brand
+    FROM Wear_History w
+    JOIN Clothing_Items i ON w.item_id = i.item_id
+    {join}
+    WHERE w.user_id = ? {condition}
+    ORDER BY w.wear_date {order}, w.wear_id {order}
+    LIMIT ?
+"""
+for _direction, _condition, _order in [
+        ('first', "", "DESC"),
+        ('next', "AND w.year <= year(CAST(? AS DATE)) AND w.wear_date <= ? "
+                 "AND (w.wear_date < ? OR w.wear_id < ?)", "DESC"),
+        ('prev', "AND w.year >= year(CAST(? AS DATE)) AND w.wear_date >= ? "
+                 "AND (w.wear_date > ? OR w.wear_id > ?)", "ASC"),
+        ('date', "AND w.year <= year(CAST(? AS DATE)) AND w.wear_date <= ?", "DESC")]:
+    register(f"wear_log_page_{_direction}",
+             _WEAR_LOG_PAGE.format(join=ITEM_JOIN, condition=_condition, order=_order))
+
+# Item search: items_by_<dimension>, items_by_purchase_date, items_by_purchase_range
+_ITEM_SEARCH = """
+    SELECT i.name, c.name as category, co.name as color,
+           s.name as size, b.name as brand, i.purchase_date, i.price
+    FROM Clothing_Items i
+    {join}
+    WHERE i.user_id = ? AND {condition}
+    ORDER BY i.name
+"""
+for _dimension, (_table, _id_col, _) in DIMENSIONS.items():
+    register(f"items_by_{_dimension}",
+             _ITEM_SEARCH.format(join=ITEM_JOIN, condition=f"i.{_id_col} = ?"))
+register("items_by_purchase_date",
+         _ITEM_SEARCH.format(join=ITEM_JOIN, condition="i.purchase_date = CAST(? AS DATE)"))
+register("items_by_purchase_range",
+         _ITEM_SEARCH.format(join=ITEM_JOIN,
+                             condition="i.purchase_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)"))
+
+# Wear log search: wear_logs_by_<dimension>, wear_logs_by_date_range
+_WEAR_LOG_SEARCH = """
+    SELECT w.wear_date, i.name, c.name as category,
+           co.name as color, s.name as size, b.name as brand
+    FROM Wear_History w
+    JOIN Clothing_Items i ON w.item_id = i.item_id
+    {join}
+    WHERE w.user_id = ? AND {condition}
+    ORDER BY w.wear_date DESC
+"""
+for _dimension, (_table, _id_col, _) in DIMENSIONS.items():
+    register(f"wear_logs_by_{_dimension}",
+             _WEAR_LOG_SEARCH.format(join=ITEM_JOIN, condition=f"i.{_id_col} = ?"))
+register("wear_logs_by_date_range",
+         _WEAR_LOG_SEARCH.format(join=ITEM_JOIN,
+                                 condition="w.year BETWEEN year(CAST(? AS DATE)) AND year(CAST(? AS DATE)) "
+                                           "AND w.wear_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)"))
+
+register("worn_items", f"""
+    SELECT DISTINCT i.item_id, i.name, c.name as category,
+           co.name as color, s.name as size, b.name as brand
+    FROM Clothing_Items i
+    JOIN Wear_History l ON i.item_id = l.item_id
+    {ITEM_JOIN}
+    WHERE i.user_id = ?
+    ORDER BY i.name
+""")
+
+register("wear_dates_by_item", """
+    SELECT wear_date
+    FROM Wear_History
+    WHERE item_id = ? AND user_id = ?
+    ORDER BY wear_date DESC
+""")
@@ -1,14 +1,20 @@
-from database import db
+from database import db, next_id, query_stats, print_query_stats, use_user_database, use_catalog
+from dimension_cache import load_dimensions, clear_dimensions, dimension_cache_stats
 import re
 from datetime import datetime
 
-from item_management import view_all_items, add_clothing_item, remove_clothing_item, search_filter_items
+from item_management import (view_all_items, add_clothing_item, remove_clothing_item, search_filter_items,
+                             import_clothing_items)
 from wear_entry_management import (
     view_wear_history, 
     add_wear_entry, 
     remove_wear_entry,
-    search_filter_wear_entry
+    search_filter_wear_entry,
+    add_batch_wear_entries,
+    import_wear_logs,
+    rebuild_wear_stats
 )
+from outfit_management import outfit_menu
 from analytics_management import wear_count_analytics, wardrobe_composition_analytics, investment_analytics
 
 def register_user():
@@ -43,14 +49,14 @@ def register_user():
         print("Password too short. Please try again.")
     
     try:
-        last_user = db.execute("SELECT MAX(user_id) FROM Users").fetchone()[0]
-        new_user_id = 1 if last_user is None else last_user + 1
-        
-        db.execute("""
+        new_user_id = db.execute(f"""
             INSERT INTO Users (user_id, name, email, password)
-            VALUES (?, ?, ?, ?)
-        """, (new_user_id, name, email, password))
+            VALUES ({next_id('Users')}, ?, ?, ?)
+            RETURNING user_id
+        """, (name, email, password)).fetchone()[0]
         
+        # In the sharded layout this creates the user's own database
+        use_user_database(new_user_id)
         print("\nRegistration successful! Please log in to continue.")
         return new_user_id
         
@@ -71,6 +77,7 @@ def login_user():
         """, (email, password)).fetchone()
         
         if user:
+            use_user_database(user[0])
             print(f"\nWelcome back!")
             return user[0]
         else:
@@ -91,10 +98,8 @@ def setup_wardrobe(user_id):
             categories.append(category)
     
     for category in categories:
-        last_id = db.execute("SELECT MAX(category_id) FROM Categories").fetchone()[0]
-        new_id = 1 if last_id is None else last_id + 1
-        db.execute("INSERT INTO Categories (category_id, user_id, name) VALUES (?, ?, ?)", 
-                  (new_id, user_id, category))
+        db.execute(f"INSERT INTO Categories (category_id, user_id, name) VALUES ({next_id('Categories')}, ?, ?)", 
+                  (user_id, category))
     
     print("\nWhat are the colors that you usually wear?")
     print("(Please add at least 3 colors)")
@@ -106,10 +111,8 @@ def setup_wardrobe(user_id):
             colors.append(color)
     
     for color in colors:
-        last_id = db.execute("SELECT MAX(color_id) FROM Colors").fetchone()[0]
-        new_id = 1 if last_id is None else last_id + 1
-        db.execute("INSERT INTO Colors (color_id, user_id, name) VALUES (?, ?, ?)", 
-                  (new_id, user_id, color))
+        db.execute(f"INSERT INTO Colors (color_id, user_id, name) VALUES ({next_id('Colors')}, ?, ?)", 
+                  (user_id, color))
     
     print("\nWhat sizes do you usually wear?")
     print("(Please add at least 2 sizes)")
@@ -121,10 +124,8 @@ def setup_wardrobe(user_id):
             sizes.append(size)
     
     for size in sizes:
-        last_id = db.execute("SELECT MAX(size_id) FROM Sizes").fetchone()[0]
-        new_id = 1 if last_id is None else last_id + 1
-        db.execute("INSERT INTO Sizes (size_id, user_id, name) VALUES (?, ?, ?)", 
-                  (new_id, user_id, size))
+        db.execute(f"INSERT INTO Sizes (size_id, user_id, name) VALUES ({next_id('Sizes')}, ?, ?)", 
+                  (user_id, size))
     
     print("\nWhat brands do you usually buy?")
     print("(Please add at least 3 brands)")
@@ -136,34 +137,57 @@ def setup_wardrobe(user_id):
             brands.append(brand)
     
     for brand in brands:
-        last_id = db.execute("SELECT MAX(brand_id) FROM Brands").fetchone()[0]
-        new_id = 1 if last_id is None else last_id + 1
-        db.execute("INSERT INTO Brands (brand_id, user_id, name) VALUES (?, ?, ?)", 
-                  (new_id, user_id, brand))
+        db.execute(f"INSERT INTO Brands (brand_id, user_id, name) VALUES ({next_id('Brands')}, ?, ?)", 
+                  (user_id, brand))
     
     print("\nWardrobe setup completed successfully!")
 
+def show_query_stats():
+    print("\n=== Query Statistics ===")
+    if not query_stats.enabled:
+        print("Query statistics are turned off (WARDROBE_QUERY_STATS=off).")
+        return
+    show_plans = (query_stats.explain_threshold_ms is not None
+                  and input("Show captured query plans? (y/n): ").lower() == 'y')
+    print_query_stats(show_plans=show_plans)
+    
+    cache = dimension_cache_stats()
+    print(f"\nDimension cache: {cache['hits']} hits, {cache['misses']} misses")
+    
+    if input("\nReset query statistics? (y/n): ").lower() == 'y':
+        query_stats.reset()
+        print("Query statistics reset.")
+
 def main_menu(user_id):
+    # Lookup tables are served from memory for the rest of the session
+    load_dimensions(user_id)
+    
     while True:
         print("\n=== Main Menu ===")
         
         print("\nClothing Menu:")
         print("1. View All Clothing Items")
         print("2. Add a Clothing Item")
-        print("3. Remove a Clothing Item")
+        print("3. Remove Clothing Items")
         print("4. Search/Filter Items")
+        print("5. Import Clothing Items from File")
         
         print("\nWear Log Menu:")
-        print("5. View Wear History")
-        print("6. Add Wear Entry")
-        print("7. Remove Wear Entry")
-        print("8. Search/Filter Wear Logs")
+        print("6. View Wear History")
+        print("7. Add Wear Entry")
+        print("8. Remove Wear Entry")
+        print("9. Search/Filter Wear Logs")
+        print("10. Log Wears in Batch")
+        print("11. Import Wear Logs from File")
+        print("12. Outfits")
         
         print("\nAnalytics Menu:")
-        print("9. Wear Count Analytics")
-        print("10. Wardrobe Composition Analytics")
-        print("11. Investment Analytics")
-        print("12. Back to Main Menu")
+        print("13. Wear Count Analytics")
+        print("14. Wardrobe Composition Analytics")
+        print("15. Investment Analytics")
+        print("16. Rebuild Wear Statistics")
+        print("17. Query Statistics")
+        print("18. Back to Main Menu")
         
         choice = input("\nEnter your choice: ")
         
@@ -177,20 +201,34 @@ def main_menu(user_id):
             elif choice == '4':
                 search_filter_items(user_id)
             elif choice == '5':
-                view_wear_history(user_id)
+                import_clothing_items(user_id)
             elif choice == '6':
-                add_wear_entry(user_id)
+                view_wear_history(user_id)
             elif choice == '7':
-                remove_wear_entry(user_id)
+                add_wear_entry(user_id)
             elif choice == '8':
-                search_filter_wear_entry(user_id)
+                remove_wear_entry(user_id)
             elif choice == '9':
-                wear_count_analytics(db, user_id)
+                search_filter_wear_entry(user_id)
             elif choice == '10':
-                wardrobe_composition_analytics(db, user_id)
+                add_batch_wear_entries(user_id)
             elif choice == '11':
-                investment_analytics(db, user_id)
+                import_wear_logs(user_id)
             elif choice == '12':
+                outfit_menu(user_id)
+            elif choice == '13':
+                wear_count_analytics(db, user_id)
+            elif choice == '14':
+                wardrobe_composition_analytics(db, user_id)
+            elif choice == '15':
+                investment_analytics(db, user_id)
+            elif choice == '16':
+                rebuild_wear_stats(user_id)
+            elif choice == '17':
+                show_query_stats()
+            elif choice == '18':
+                clear_dimensions(user_id)
+                use_catalog()
                 break
             else:
                 print("Invalid choice. Please try again.")
@@ -0,0 +1,191 @@
+import argparse
+import os
+import sys
+
+from statements import DIMENSIONS
+
+# Non-interactive entry point for scripts and batch jobs, e.g.
+#
+#   python wardrobe_cli.py --user-id 1 items list --brand Nike
+#   python wardrobe_cli.py --user-id 1 wear add --item-id 3 --item-id 5 --date 2024-05-01
+#   python wardrobe_cli.py --user-id 1 report cpw --by brand
+#   python wardrobe_cli.py --user-id 1 --format csv report cpw --by brand --value Nike
+#
+# Each command imports only what it needs, so nothing here pulls in the menus
+# or matplotlib.
+
+def print_rows(rows, fmt):
+    if fmt == 'json':
+        import json
+        from wardrobe_service import json_default
+        print(json.dumps(rows, default=json_default, indent=2))
+        return
+
+    if not rows:
+        if fmt == 'table':
+            print("No results.")
+        return
+    columns = list(rows[0].keys())
+
+    if fmt == 'csv':
+        import csv
+        writer = csv.writer(sys.stdout)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(["" if row[c] is None else row[c] for c in columns])
+        return
+
+    cells = [["N/A" if row[c] is None else str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in cells)) for i, c in enumerate(columns)]
+    header = " | ".join(f"{c:<{w}}" for c, w in zip(columns, widths))
+    print(header)
+    print("-" * len(header))
+    for r in cells:
+        print(" | ".join(f"{v:<{w}}" for v, w in zip(r, widths)))
+
+def items_list(args):
+    from wardrobe_service import list_items
+    return list_items(args.user_id, category=args.category, color=args.color, size=args.size,
+                      brand=args.brand, purchased_from=args.purchased_from,
+                      purchased_to=args.purchased_to)
+
+def items_import(args):
+    from item_management import bulk_import_items
+    imported, rejected_total, rejected = bulk_import_items(args.user_id, args.path)
+    for row_num, name, reason in rejected:
+        print(f"Rejected row {row_num} ({name}): {reason}", file=sys.stderr)
+    return [{'imported': imported, 'rejected': rejected_total}]
+
+def wear_list(args):
+    from wardrobe_service import list_wear_logs
+    return list_wear_logs(args.user_id, item_id=args.item_id, category=args.category,
+                          color=args.color, size=args.size, brand=args.brand,
+                          start=args.start, end=args.end, limit=args.limit)
+
+def wear_add(args):
+    from datetime import date
+    from wardrobe_service import add_wears
+    return [add_wears(args.user_id, args.item_id, args.date or [date.today()])]
+
+def wear_import(args):
+    from wear_entry_management import bulk_import_wear_logs
+    imported, rejected_total, rejected = bulk_import_wear_logs(args.user_id, args.path)
+    for row_num, item_name, raw_date, reason in rejected:
+        print(f"Rejected row {row_num} ({item_name}, {raw_date}): {reason}", file=sys.stderr)
+    return [{'imported': imported, 'rejected': rejected_total}]
+
+def report_wear_counts(args):
+    from wardrobe_service import wear_counts
+    return wear_counts(args.user_id, dimension=args.by, value=args.value)
+
+def report_composition(args):
+    from wardrobe_service import wardrobe_composition
+    return wardrobe_composition(args.user_id, args.by)
+
+def report_cpw(args):
+    from wardrobe_service import cost_per_wear
+    return cost_per_wear(args.user_id, dimension=args.by, value=args.value)
+
+def report_monthly(args):
+    from wardrobe_service import monthly_expenses
+    return monthly_expenses(args.user_id, args.year)
+
+def report_daily(args):
+    from wardrobe_service import daily_expenses
+    # One row per purchased item; days without purchases are left out
+    return [{'day': day['day'], 'day_total': day['total'], **item}
+            for day in daily_expenses(args.user_id, args.year, args.month)
+            for item in day['items']]
+
+def add_dimension_filters(parser):
+    for name in DIMENSIONS:
+        parser.add_argument(f'--{name}', help=f"only rows with this {name} name")
+
+def build_parser():
+    from datetime import date
+
+    parser = argparse.ArgumentParser(prog='wardrobe', description="Smart Wardrobe Tracker commands")
+    parser.add_argument('--user-id', type=int, default=os.environ.get('WARDROBE_USER_ID'),
+                        help="user to act as (default: $WARDROBE_USER_ID)")
+    parser.add_argument('--format', choices=['table', 'csv', 'json'], default='table')
+    commands = parser.add_subparsers(dest='group', required=True)
+
+    items = commands.add_parser('items').add_subparsers(dest='command', required=True)
+    p = items.add_parser('list', help="list clothing items")
+    add_dimension_filters(p)
+    p.add_argument('--purchased-from', type=date.fromisoformat)
+    p.add_argument('--purchased-to', type=date.fromisoformat)
+    p.set_defaults(handler=items_list)
+
+    p = items.add_parser('import', help="import clothing items from a CSV or JSON file")
+    p.add_argument('path')
+    p.set_defaults(handler=items_import)
+
+    wear = commands.add_parser('wear').add_subparsers(dest='command', required=True)
+    p = wear.add_parser('list', help="list wear logs, newest first")
+    p.add_argument('--item-id', type=int)
+    add_dimension_filters(p)
+    p.add_argument('--start', type=date.fromisoformat)
+    p.add_argument('--end', type=date.fromisoformat)
+    p.add_argument('--limit', type=int)
+    p.set_defaults(handler=wear_list)
+
+    p = wear.add_parser('add', help="log items as worn on one or more dates")
+    p.add_argument('--item-id', type=int, action='append', required=True)
+    p.add_argument('--date', type=date.fromisoformat, action='append',
+                   help="yyyy-mm-dd, repeatable (default: today)")
+    p.set_defaults(handler=wear_add)
+
+    p = wear.add_parser('import', help="import wear logs from a CSV or Parquet file")
+    p.add_argument('path')
+    p.set_defaults(handler=wear_import)
+
+    report = commands.add_parser('report').add_subparsers(dest='command', required=True)
+    p = report.add_parser('wear-counts', help="wear count per item, or per dimension value with --by")
+    p.add_argument('--by', choices=list(DIMENSIONS), help="group by this dimension")
+    p.add_argument('--value', help="only items with this value of --by, e.g. --by brand --value Nike")
+    p.set_defaults(handler=report_wear_counts)
+
+    p = report.add_parser('composition', help="item count per dimension value")
+    p.add_argument('--by', choices=list(DIMENSIONS), required=True)
+    p.set_defaults(handler=report_composition)
+
+    p = report.add_parser('cpw', help="cost per wear per item, or per dimension value with --by")
+    p.add_argument('--by', choices=list(DIMENSIONS), help="group by this dimension")
+    p.add_argument('--value', help="only items with this value of --by, e.g. --by brand --value Nike")
+    p.set_defaults(handler=report_cpw)
+
+    p = report.add_parser('monthly', help="spend per month of a year")
+    p.add_argument('--year', type=int, default=date.today().year)
+    p.set_defaults(handler=report_monthly)
+
+    p = report.add_parser('daily', help="purchases per day of a month")
+    p.add_argument('--year', type=int, default=date.today().year)
+    p.add_argument('--month', type=int, default=date.today().month)
+    p.set_defaults(handler=report_daily)
+
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.user_id is None:
+        parser.error("--user-id (or WARDROBE_USER_ID) is required")
+    args.user_id = int(args.user_id)
+    if args.handler in (report_wear_counts, report_cpw) and args.value is not None and args.by is None:
+        parser.error("--value needs --by")
+
+    from database import create_tables, use_user_database
+    # Quietly: a migration report would end up in the command's output
+    create_tables(verbose=False)
+    try:
+        use_user_database(args.user_id)
+        rows = args.handler(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print_rows(rows, args.format)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+from database import db
+from datetime import date, datetime
+from decimal import Decimal
+import calendar
+
+from statements import DIMENSIONS, ITEM_JOIN
+from wear_entry_management import insert_wear_entries
+
+# Data-only versions of the menu screens: every function takes plain
+# arguments, runs its query and returns lists/dicts without prompting or
+# printing, so the HTTP server and scripts can reuse them.
+
+def json_default(value):
+    # json.dumps(..., default=json_default) for dates and DECIMAL prices
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _rows(cursor):
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+def _dimension(name):
+    if name not in DIMENSIONS:
+        raise ValueError(f"Unknown dimension '{name}'. Use one of: {', '.join(DIMENSIONS)}")
+    return DIMENSIONS[name]
+
+def _dimension_filters(filters):
+    # Equality filters on dimension names, e.g. {'brand': 'Nike'}
+    clauses, params = [], []
+    for name, value in filters.items():
+        if value is not None:
+            alias = _dimension(name)[2]
+            clauses.append(f"{alias}.name = ?")
+            params.append(value)
+    return clauses, params
+
+def _date(value):
+    # A date argument as a date; ISO strings (from the API or CLI) are parsed
+    # here so a bad one is a ValueError, not a database conversion error
+    return value if isinstance(value, date) else date.fromisoformat(value)
+
+def _report_filter(dimension, value):
+    # The optional dimension filter of a per-item report; a value needs its
+    # dimension (a dimension alone groups the report instead)
+    if dimension is None:
+        if value is not None:
+            raise ValueError("value needs a dimension")
+        return [], []
+    return _dimension_filters({dimension: value})
+
+def list_items(user_id, category=None, color=None, size=None, brand=None,
+               purchased_from=None, purchased_to=None):
+    clauses, params = _dimension_filters(
+        {'category': category, 'color': color, 'size': size, 'brand': brand})
+    if purchased_from is not None:
+        clauses.append("i.purchase_date >= ?")
+        params.append(_date(purchased_from))
+    if purchased_to is not None:
+        clauses.append("i.purchase_date <= ?")
+        params.append(_date(purchased_to))
+    where = "".join(f" AND {clause}" for clause in clauses)
+
+    return _rows(db.execute(f"""
+        SELECT i.item_id, i.name, c.name as category, co.name as color,
+               s.name as size, b.name as brand, i.purchase_date, i.price
+        FROM Clothing_Items i
+        {ITEM_JOIN}
+        WHERE i.user_id = ?{where}
+        ORDER BY c.category_id, i.name
+    """, [user_id] + params))
+
+def list_wear_logs(user_id, item_id=None, category=None, color=None, size=None,
+                   brand=None, start=None, end=None, limit=None):
+    clauses, params = _dimension_filters(
+        {'category': category, 'color': color, 'size': size, 'brand': brand})
+    if item_id is not None:
+        clauses.append("w.item_id = ?")
+        params.append(item_id)
+    # Date bounds also bound the year, so only those archive partitions are read
+    if start is not None:
+        start = _date(start)
+        clauses.append("w.year >= year(CAST(? AS DATE)) AND w.wear_date >= ?")
+        params.extend([start, start])
+    if end is not None:
+        end = _date(end)
+        clauses.append("w.year <= year(CAST(? AS DATE)) AND w.wear_date <= ?")
+        params.extend([end, end])
+    where = "".join(f" AND {clause}" for clause in clauses)
+    limit_clause = ""
+    if limit is not None:
+        if int(limit) < 0:
+            raise ValueError("limit cannot be negative")
+        limit_clause = "LIMIT ?"
+        params.append(int(limit))
+
+    return _rows(db.execute(f"""
+        SELECT w.wear_id, w.wear_date, i.item_id, i.name, c.name as category,
+               co.name as color, s.name as size, b.name as brand
+        FROM Wear_History w
+        JOIN Clothing_Items i ON w.item_id = i.item_id
+        {ITEM_JOIN}
+        WHERE w.user_id = ?{where}
+        ORDER BY w.wear_date DESC, w.wear_id DESC
+        {limit_clause}
+    """, [user_id] + params))
+
+def add_wears(user_id, item_ids, dates):
+    # Log every item on every date in one transaction; returns rows written
+    if not isinstance(item_ids, (list, tuple)) or not isinstance(dates, (list, tuple)):
+        raise ValueError("item_ids and dates must be lists")
+    if not item_ids or not dates:
+        raise ValueError("item_ids and dates must both be non-empty")
+    wear_dates = [_date(d) for d in dates]
+    return {'logged': insert_wear_entries(user_id, [int(i) for i in item_ids], wear_dates)}
+
+def wear_counts(user_id, dimension=None, value=None):
+    # Per item, or per value of dimension if it is given without a value
+    if dimension is not None and value is None:
+        _, id_col, alias = _dimension(dimension)
+        return _rows(db.execute(f"""
+            SELECT {alias}.name as {dimension}, COUNT(*) as item_count,
+                   SUM(COALESCE(st.wear_count, 0)) as wear_count
+            FROM Clothing_Items i
+            {ITEM_JOIN}
+            LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+            WHERE i.user_id = ?
+            GROUP BY {alias}.{id_col}, {alias}.name
+            ORDER BY wear_count DESC, {dimension}
+        """, [user_id]))
+
+    clauses, params = _report_filter(dimension, value)
+    where = "".join(f" AND {clause}" for clause in clauses)
+
+    return _rows(db.execute(f"""
+        SELECT i.item_id, i.name, c.name as category, co.name as color,
+               s.name as size, b.name as brand, i.price,
+               COALESCE(st.wear_count, 0) as wear_count
+        FROM Clothing_Items i
+        {ITEM_JOIN}
+        LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+        WHERE i.user_id = ?{where}
+        ORDER BY wear_count DESC, i.name
+    """, [user_id] + params))
+
+def wardrobe_composition(user_id, dimension):
+    table, id_col, _ = _dimension(dimension)
+    return _rows(db.execute(f"""
+        SELECT d.name, COUNT(*) as item_count,
+               ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 1) as percentage
+        FROM Clothing_Items i
+        JOIN {table} d ON i.{id_col} = d.{id_col}
+        WHERE i.user_id = ?
+        GROUP BY d.{id_col}, d.name
+        ORDER BY item_count DESC, d.name
+    """, [user_id]))
+
+def cost_per_wear(user_id, dimension=None, value=None):
+    # Per item, or per value of dimension if it is given without a value
+    # (total price over total wears). Never worn rows have a NULL
+    # cost_per_wear and sort last.
+    if dimension is not None and value is None:
+        _, id_col, alias = _dimension(dimension)
+        return _rows(db.execute(f"""
+            SELECT {alias}.name as {dimension}, COUNT(*) as item_count,
+                   COALESCE(SUM(i.price), 0) as price,
+                   SUM(COALESCE(st.wear_count, 0)) as wear_count,
+                   CASE WHEN SUM(COALESCE(st.wear_count, 0)) > 0
+                        THEN CAST(COALESCE(SUM(i.price), 0) / SUM(COALESCE(st.wear_count, 0))
+                                  AS DECIMAL(10,2)) END as cost_per_wear
+            FROM Clothing_Items i
+            {ITEM_JOIN}
+            LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+            WHERE i.user_id = ?
+            GROUP BY {alias}.{id_col}, {alias}.name
+            ORDER BY cost_per_wear ASC NULLS LAST, price
+        """, [user_id]))
+
+    clauses, params = _report_filter(dimension, value)
+    where = "".join(f" AND {clause}" for clause in clauses)
+
+    return _rows(db.execute(f"""
+        SELECT i.item_id, i.name, c.name as category, co.name as color,
+               s.name as size, b.name as brand, COALESCE(i.price, 0) as price,
+               COALESCE(st.wear_count, 0) as wear_count,
+               CASE WHEN st.wear_count > 0 THEN COALESCE(st.cost_per_wear, 0) END as cost_per_wear,
+               i.purchase_date
+        FROM Clothing_Items i
+        {ITEM_JOIN}
+        LEFT JOIN Item_Wear_Stats st ON i.item_id = st.item_id
+        WHERE i.user_id = ?{where}
+        ORDER BY cost_per_wear ASC NULLS LAST, price
+    """, [user_id] + params))
+
+def monthly_expenses(user_id, year):
+    year = int(year)
+    totals = dict(db.execute("""
+        SELECT month, total
+        FROM Monthly_Spend
+        WHERE user_id = ? AND month >= ? AND month < ?
+    """, [user_id, date(year, 1, 1), date(year + 1, 1, 1)]).fetchall())
+    return [{'month': m, 'total': totals.get(date(year, m, 1), 0)} for m in range(1, 13)]
+
+def daily_expenses(user_id, year, month):
+    year, month = int(year), int(month)
+    _, num_days = calendar.monthrange(year, month)
+    month_start = date(year, month, 1)
+    month_end = date(year + month // 12, month % 12 + 1, 1)
+    items = _rows(db.execute("""
+        SELECT i.purchase_date, i.item_id, i.name, co.name as color, b.name as brand, i.price
+        FROM Clothing_Items i
+        LEFT JOIN Colors co ON i.color_id = co.color_id
+        LEFT JOIN Brands b ON i.brand_id = b.brand_id
+        WHERE i.user_id = ? AND i.purchase_date >= ? AND i.purchase_date < ?
+        ORDER BY i.purchase_date
+    """, [user_id, month_start, month_end]))
+
+    days = [{'day': d, 'total': 0, 'items': []} for d in range(1, num_days + 1)]
+    for item in items:
+        day = days[item['purchase_date'].day - 1]
+        day['total'] += item['price'] or 0
+        day['items'].append(item)
+    return days
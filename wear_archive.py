@@ -0,0 +1,118 @@
+import argparse
+import glob
+import os
+import sys
+import uuid
+from datetime import date, timedelta
+
+# Moves old wear logs out of the Wear_Logs table into Parquet files
+# partitioned by user and year, e.g.
+#
+#   python wear_archive.py --older-than-days 365
+#   python wear_archive.py --before 2024-01-01 --user-id 3
+#
+# Archived logs stay visible through the Wear_History view and keep counting
+# towards Item_Wear_Stats via Archived_Wear_Stats, but they are read-only:
+# they can no longer be removed from the app.
+
+def archive_wear_logs(db, cutoff, user_id=None):
+    # Archive the current database's logs dated before cutoff; returns the
+    # number of logs moved
+    from database import create_wear_history_view, transaction, wear_archive_path
+
+    condition = "wear_date < CAST(? AS DATE)"
+    parameters = [str(cutoff)]
+    if user_id is not None:
+        condition += " AND user_id = ?"
+        parameters.append(user_id)
+
+    path = wear_archive_path()
+    os.makedirs(path, exist_ok=True)
+    # Files written by this run carry the token, so they can be removed if
+    # the transaction rolls back (COPY output is not transactional)
+    token = uuid.uuid4().hex
+    try:
+        with transaction():
+            moved = db.execute(f"""
+                SELECT COUNT(*) FROM Wear_Logs WHERE {condition}
+            """, parameters).fetchone()[0]
+            if moved == 0:
+                return 0
+
+            escaped = path.replace("'", "''")
+            db.execute(f"""
+                COPY (
+                    SELECT wear_id, user_id, item_id, wear_date, year(wear_date) AS year
+                    FROM Wear_Logs
+                    WHERE {condition}
+                ) TO '{escaped}'
+                (FORMAT PARQUET, PARTITION_BY (user_id, year), APPEND,
+                 FILENAME_PATTERN 'batch_{token}_{{uuid}}')
+            """, parameters)
+
+            db.execute(f"""
+                INSERT INTO Archived_Wear_Stats (item_id, user_id, wear_count, first_worn, last_worn)
+                SELECT item_id, user_id, COUNT(*), MIN(wear_date), MAX(wear_date)
+                FROM Wear_Logs
+                WHERE {condition}
+                GROUP BY item_id, user_id
+                ON CONFLICT (item_id) DO UPDATE SET
+                    wear_count = Archived_Wear_Stats.wear_count + excluded.wear_count,
+                    first_worn = least(Archived_Wear_Stats.first_worn, excluded.first_worn),
+                    last_worn = greatest(Archived_Wear_Stats.last_worn, excluded.last_worn)
+            """, parameters)
+
+            # Item_Wear_Stats is unchanged: the same logs are now counted
+            # through Archived_Wear_Stats instead of Wear_Logs
+            db.execute(f"DELETE FROM Wear_Logs WHERE {condition}", parameters)
+    except Exception:
+        for name in glob.glob(os.path.join(path, '*', '*', f"batch_{token}_*.parquet")):
+            os.remove(name)
+        raise
+
+    create_wear_history_view()
+    return moved
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive old wear logs to Parquet")
+    cutoff = parser.add_mutually_exclusive_group()
+    cutoff.add_argument('--before', type=date.fromisoformat,
+                        help="archive logs dated before this day (YYYY-MM-DD)")
+    cutoff.add_argument('--older-than-days', type=int, default=365,
+                        help="archive logs older than this many days (default 365)")
+    parser.add_argument('--user-id', type=int, help="only archive this user's logs")
+    args = parser.parse_args()
+
+    if args.before is None and args.older_than_days < 1:
+        parser.error("--older-than-days must be at least 1")
+    before = args.before or date.today() - timedelta(days=args.older_than_days)
+
+    from database import db, create_tables, use_catalog, use_user_database, wear_archive_path
+    create_tables()
+
+    try:
+        if db.shard_dir:
+            # Each user's logs live in their own database
+            if args.user_id is not None:
+                user_ids = [args.user_id]
+            else:
+                user_ids = [row[0] for row in db.execute(
+                    "SELECT user_id FROM Users ORDER BY user_id").fetchall()]
+            moved = 0
+            for user_id in user_ids:
+                use_user_database(user_id)
+                moved += archive_wear_logs(db, before, user_id)
+                use_catalog()
+        else:
+            moved = archive_wear_logs(db, before, args.user_id)
+    except Exception as e:
+        print(f"Error archiving wear logs: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(f"Archived {moved} wear logs dated before {before} to {wear_archive_path()}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,40 +1,45 @@
-from database import db
-from datetime import datetime
+from database import db, next_id, transaction, wear_rollup_upsert
+from datetime import datetime, timedelta
+from dimension_cache import get_dimension
+from pager import browse, PAGE_SIZE
+from statements import DIMENSIONS, run
 
-def view_wear_history(user_id):
-    print("\n=== Wear History ===")
-    
-    logs = db.execute("""
-        SELECT w.wear_date, i.name as item_name, c.name as category, 
-               co.name as color, s.name as size, b.name as brand
-        FROM Wear_Logs w
-        JOIN Clothing_Items i ON w.item_id = i.item_id
-        JOIN Categories c ON i.category_id = c.category_id
-        JOIN Colors co ON i.color_id = co.color_id
-        JOIN Sizes s ON i.size_id = s.size_id
-        JOIN Brands b ON i.brand_id = b.brand_id
-        WHERE w.user_id = ?
-        ORDER BY w.wear_date DESC
-    """, [user_id]).fetchall()
-    
-    if not logs:
-        print("No wear history found.")
-        return
-    
+# Rejected import rows printed before the report is truncated
+IMPORT_REJECTS_SHOWN = 20
+
+def fetch_wear_log_page(user_id, direction, key):
+    # One keyset page of wear logs ordered by (wear_date, wear_id) descending;
+    # see pager.browse for the meaning of direction and key
+    params = []
+    if direction in ('next', 'prev'):
+        params = [key[0], key[0], key[0], key[1]]
+    elif direction == 'date':
+        params = [key, key]
+    return run(f"wear_log_page_{direction}",
+               [user_id] + params + [PAGE_SIZE + 1]).fetchmany(PAGE_SIZE + 1)
+
+def print_wear_log_page(logs):
     print(f"\n{'#':<3} | {'Date':<10} | {'Name':<12} | {'Category':<9} | {'Color':<7} | {'Size':<4} | {'Brand':<9}")
     print("-" * 75)
     
     for i, log in enumerate(logs, 1):
-        date = str(log[0])
-        name = (log[1][:10] + '..') if len(log[1]) > 12 else log[1]
-        category = log[2][:9]
-        color = log[3][:7]
-        size = log[4][:4]
-        brand = log[5][:9]
+        date = str(log[1])
+        name = (log[2][:10] + '..') if len(log[2]) > 12 else log[2]
+        category = log[3][:9]
+        color = log[4][:7]
+        size = log[5][:4]
+        brand = log[6][:9]
         
         print("{:<3} | {:<10} | {:<12} | {:<9} | {:<7} | {:<4} | {:<9}".format(
             i, date, name, category, color, size, brand))
 
+def view_wear_history(user_id):
+    print("\n=== Wear History ===")
+    
+    browse(lambda direction, key: fetch_wear_log_page(user_id, direction, key),
+           print_wear_log_page, lambda log: (log[1], log[0]), can_jump=True,
+           empty_message="No wear history found.")
+
 def add_wear_entry(user_id):
     print("\n=== Log Item Wear ===")
     
@@ -84,72 +89,360 @@ def add_wear_entry(user_id):
             print("Invalid date format. Please use dd/mm/yyyy")
     
     try:
-        last_id = db.execute("SELECT MAX(wear_id) FROM Wear_Logs").fetchone()[0]
-        wear_id = 1 if last_id is None else last_id + 1
-        
-        db.execute("""
-            INSERT INTO Wear_Logs (wear_id, user_id, item_id, wear_date)
-            VALUES (?, ?, ?, ?)
-        """, (wear_id, user_id, item_id, wear_date))
+        with transaction():
+            wear_id = db.execute(f"""
+                INSERT INTO Wear_Logs (wear_id, user_id, item_id, wear_date)
+                VALUES ({next_id('Wear_Logs')}, ?, ?, ?)
+                RETURNING wear_id
+            """, (user_id, item_id, wear_date)).fetchone()[0]
+            refresh_item_wear_stats([item_id])
+            update_wear_rollups([wear_id], 1)
         
         print(f"\nWear logged successfully for {items[choice-1][1]} on {wear_date}!")
         
     except Exception as e:
         print(f"Error logging wear: {e}")
 
-def remove_wear_entry(user_id):
-    print("\n=== Remove Wear Log Entry ===")
+def add_batch_wear_entries(user_id):
+    print("\n=== Log Wears in Batch ===")
     
-    logs = db.execute("""
-        SELECT l.wear_id, l.wear_date, i.name as item_name, c.name as category, 
-               co.name as color, s.name as size, b.name as brand
-        FROM Wear_Logs l
-        JOIN Clothing_Items i ON l.item_id = i.item_id
+    items = db.execute("""
+        SELECT i.item_id, i.name, c.name as category
+        FROM Clothing_Items i
         JOIN Categories c ON i.category_id = c.category_id
-        JOIN Colors co ON i.color_id = co.color_id
-        JOIN Sizes s ON i.size_id = s.size_id
-        JOIN Brands b ON i.brand_id = b.brand_id
-        WHERE l.user_id = ?
-        ORDER BY l.wear_date DESC
+        WHERE i.user_id = ?
+        ORDER BY c.name, i.name
     """, [user_id]).fetchall()
     
-    if not logs:
-        print("No wear logs found.")
+    if not items:
+        print("No items found in your wardrobe.")
         return
     
-    print("\nSelect log to remove:")
+    print("\nSelect items:")
     print("0. Back to Main Menu")
+    for i, item in enumerate(items, 1):
+        print(f"{i}. {item[1]} ({item[2]})")
     
-    print(f"\n{'#':<3} | {'Date':<10} | {'Name':<12} | {'Category':<9} | {'Color':<7} | {'Size':<4} | {'Brand':<9}")
-    print("-" * 75)
-    
-    for i, log in enumerate(logs, 1):
-        date = str(log[1])
-        name = (log[2][:10] + '..') if len(log[2]) > 12 else log[2]
-        category = log[3][:9]
-        color = log[4][:7]
-        size = log[5][:4]
-        brand = log[6][:9]
-        
-        print("{:<3} | {:<10} | {:<12} | {:<9} | {:<7} | {:<4} | {:<9}".format(
-            i, date, name, category, color, size, brand))
-    
+    # Get item selection, e.g. "1, 4, 7"
     while True:
+        choice = input("\nEnter item numbers separated by commas: ").strip()
+        if choice == '0':
+            return
         try:
-            choice = int(input("\nEnter log number: "))
-            if choice == 0:
-                return
-            if 1 <= choice <= len(logs):
-                selected_log = logs[choice-1]
+            choices = sorted({int(c) for c in choice.split(',') if c.strip()})
+            if choices and all(1 <= c <= len(items) for c in choices):
+                item_ids = [items[c-1][0] for c in choices]
                 break
         except ValueError:
             pass
         print("Invalid choice. Please try again.")
     
+    print("\nLog these items for:")
+    print("1. A single date")
+    print("2. Every day in a date range")
+    print("3. Every weekday in a date range")
+    
+    while True:
+        date_choice = input("Enter choice: ")
+        if date_choice in ['1', '2', '3']:
+            break
+        print("Invalid choice. Please try again.")
+    
+    if date_choice == '1':
+        while True:
+            date_str = input("\nEnter wear date (dd/mm/yyyy) or press Enter for today: ")
+            if not date_str:
+                wear_dates = [datetime.now().date()]
+                break
+            try:
+                wear_dates = [datetime.strptime(date_str, '%d/%m/%Y').date()]
+                break
+            except ValueError:
+                print("Invalid date format. Please use dd/mm/yyyy")
+    else:
+        while True:
+            try:
+                start = datetime.strptime(input("\nEnter start date (dd/mm/yyyy): "), '%d/%m/%Y').date()
+                end = datetime.strptime(input("Enter end date (dd/mm/yyyy): "), '%d/%m/%Y').date()
+                if start <= end:
+                    break
+                print("Start date must not be after end date.")
+            except ValueError:
+                print("Invalid date format. Please use dd/mm/yyyy")
+        
+        wear_dates = [start + timedelta(days=d) for d in range((end - start).days + 1)]
+        if date_choice == '3':
+            wear_dates = [d for d in wear_dates if d.weekday() < 5]
+    
+    total = len(item_ids) * len(wear_dates)
+    if total == 0:
+        print("\nNo dates to log in that range.")
+        return
+    
+    confirm = input(f"\nLog {total} wears ({len(item_ids)} items x {len(wear_dates)} dates)? (y/n): ")
+    if confirm.lower() != 'y':
+        print("\nOperation cancelled.")
+        return
+    
+    try:
+        logged = insert_wear_entries(user_id, item_ids, wear_dates)
+        print(f"\n{logged} wears logged successfully!")
+    except Exception as e:
+        print(f"Error logging wears: {e}")
+
+def insert_wear_entries(user_id, item_ids, wear_dates):
+    # Log every item on every date with one multi-row INSERT; items that
+    # don't belong to the user are skipped. Returns the number of rows written.
+    rows = """
+        FROM Clothing_Items i
+        CROSS JOIN unnest(CAST(? AS DATE[])) AS d(wear_date)
+        WHERE i.user_id = ? AND i.item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+    """
+    params = [list(wear_dates), user_id, list(item_ids)]
+    with transaction():
+        logged = db.execute(f"""
+            INSERT INTO Wear_Logs (wear_id, user_id, item_id, wear_date)
+            SELECT {next_id('Wear_Logs')}, i.user_id, i.item_id, d.wear_date
+            {rows}
+        """, params).fetchone()[0]
+        refresh_item_wear_stats(item_ids)
+        # Rollup deltas come from the same item x date set, not the new ids
+        db.execute(wear_rollup_upsert(f"SELECT i.item_id, d.wear_date, 1 {rows}"), params)
+    return logged
+
+def refresh_item_wear_stats(item_ids):
+    # Recompute Item_Wear_Stats rows for just these items from their hot logs
+    # (an index lookup per item) plus their archived totals. Call in the
+    # transaction that changed the logs.
+    db.execute("""
+        INSERT INTO Item_Wear_Stats (item_id, user_id, wear_count, first_worn, last_worn, cost_per_wear)
+        SELECT i.item_id, i.user_id, COUNT(w.wear_id) + COALESCE(a.wear_count, 0),
+               least(MIN(w.wear_date), a.first_worn), greatest(MAX(w.wear_date), a.last_worn),
+               CASE WHEN COUNT(w.wear_id) + COALESCE(a.wear_count, 0) > 0
+                    THEN i.price / (COUNT(w.wear_id) + COALESCE(a.wear_count, 0)) END
+        FROM Clothing_Items i
+        LEFT JOIN Wear_Logs w ON i.item_id = w.item_id
+        LEFT JOIN Archived_Wear_Stats a ON i.item_id = a.item_id
+        WHERE i.item_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+        GROUP BY i.item_id, i.user_id, i.price, a.wear_count, a.first_worn, a.last_worn
+        ON CONFLICT (item_id) DO UPDATE SET
+            wear_count = excluded.wear_count,
+            first_worn = excluded.first_worn,
+            last_worn = excluded.last_worn,
+            cost_per_wear = excluded.cost_per_wear
+    """, [list(item_ids)])
+
+def update_wear_rollups(wear_ids, sign):
+    # Add (sign=1) or subtract (sign=-1) these logs' wears in Wear_Rollups.
+    # Call in the transaction that inserts the logs, or before the DELETE.
+    # Meant for a handful of ids; bulk writers pass their own delta query to
+    # wear_rollup_upsert instead.
+    db.execute(wear_rollup_upsert("""
+        SELECT item_id, wear_date, ? FROM Wear_Logs
+        WHERE wear_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+    """), [sign, list(wear_ids)])
+
+def remove_item_wear_rollups(item_ids):
+    # Take removed items (and the archived wears still counted for them) out
+    # of Wear_Rollups
+    db.execute("""
+        DELETE FROM Wear_Rollups
+        WHERE dimension = 'item' AND member_id IN (SELECT unnest(CAST(? AS INTEGER[])))
+    """, [list(item_ids)])
+
+def rebuild_wear_rollups():
+    # Recompute Wear_Rollups from the full history, e.g. after rows were
+    # copied in with plain INSERTs
+    db.execute("DELETE FROM Wear_Rollups")
+    db.execute(wear_rollup_upsert("SELECT item_id, wear_date, 1 FROM Wear_History"))
+
+def rebuild_item_wear_stats(user_id):
+    # Recompute every item's stats from the raw logs and current price,
+    # report the rows that had drifted and replace them. Returns the number
+    # of corrected items.
+    with transaction():
+        drifted = db.execute("""
+            WITH counts AS (
+                SELECT i.item_id, i.price, COUNT(w.wear_id) + COALESCE(a.wear_count, 0) AS wear_count,
+                       least(MIN(w.wear_date), a.first_worn) AS first_worn,
+                       greatest(MAX(w.wear_date), a.last_worn) AS last_worn
+                FROM Clothing_Items i
+                LEFT JOIN Wear_Logs w ON i.item_id = w.item_id
+                LEFT JOIN Archived_Wear_Stats a ON i.item_id = a.item_id
+                WHERE i.user_id = ?
+                GROUP BY i.item_id, i.price, a.wear_count, a.first_worn, a.last_worn
+            ),
+            -- Rounded as the DECIMAL(10,2) column stores it
+            fresh AS (
+                SELECT item_id, wear_count, first_worn, last_worn,
+                       CASE WHEN wear_count > 0
+                            THEN CAST(price / wear_count AS DECIMAL(10,2)) END AS cost_per_wear
+                FROM counts
+            )
+            SELECT f.item_id
+            FROM fresh f
+            LEFT JOIN Item_Wear_Stats st ON f.item_id = st.item_id
+            WHERE st.item_id IS NULL
+               OR st.wear_count <> f.wear_count
+               OR st.first_worn IS DISTINCT FROM f.first_worn
+               OR st.last_worn IS DISTINCT FROM f.last_worn
+               OR st.cost_per_wear IS DISTINCT FROM f.cost_per_wear
+        """, [user_id]).fetchall()
+        
+        db.execute("""
+            DELETE FROM Item_Wear_Stats
+            WHERE user_id = ?
+              AND item_id NOT IN (SELECT item_id FROM Clothing_Items WHERE user_id = ?)
+        """, [user_id, user_id])
+        refresh_item_wear_stats([row[0] for row in drifted])
+    return len(drifted)
+
+def rebuild_wear_stats(user_id):
+    print("\n=== Rebuild Wear Statistics ===")
+    try:
+        corrected = rebuild_item_wear_stats(user_id)
+    except Exception as e:
+        print(f"Error rebuilding wear statistics: {e}")
+        return
+    
+    if corrected:
+        print(f"\n{corrected} items were out of date and have been corrected.")
+    else:
+        print("\nWear statistics match the wear logs.")
+
+def import_wear_logs(user_id):
+    print("\n=== Import Wear Logs ===")
+    print("The file needs an 'item' column (item name) and a 'date' column")
+    print("(yyyy-mm-dd or dd/mm/yyyy). CSV and Parquet files are supported.")
+    
+    path = input("\nEnter file path (press Enter to go back): ").strip()
+    if not path:
+        return
+    
+    try:
+        imported, rejected_total, rejected = bulk_import_wear_logs(user_id, path)
+    except Exception as e:
+        print(f"Error importing wear logs: {e}")
+        return
+    
+    print(f"\nImported {imported} wear logs.")
+    if not rejected_total:
+        return
+    
+    print(f"Rejected {rejected_total} rows:")
+    print(f"\n{'Row':<8} | {'Item':<20} | {'Date':<12} | {'Reason':<20}")
+    print("-" * 68)
+    for row_num, item_name, raw_date, reason in rejected:
+        item_name = str(item_name) if item_name is not None else "N/A"
+        raw_date = str(raw_date) if raw_date is not None else "N/A"
+        if len(item_name) > 20:
+            item_name = item_name[:18] + ".."
+        print(f"{row_num:<8} | {item_name:<20} | {raw_date[:12]:<12} | {reason:<20}")
+    if rejected_total > len(rejected):
+        print(f"... and {rejected_total - len(rejected)} more")
+
+def bulk_import_wear_logs(user_id, path):
+    # Stage the whole file with DuckDB's native reader, resolve item names with
+    # one join and insert every valid row in a single transaction.
+    # Returns (imported_count, rejected_count, first rejected rows as
+    # (row_num, item, date, reason))
+    if path.lower().endswith('.parquet'):
+        source = "read_parquet(?)"
+    else:
+        source = "read_csv(?, header = true, all_varchar = true)"
+    
+    columns = {row[0].lower(): row[0] for row in db.execute(
+        f"DESCRIBE SELECT * FROM {source}", [path]).fetchall()}
+    missing = [c for c in ['item', 'date'] if c not in columns]
+    if missing:
+        raise ValueError(f"File is missing column(s): {', '.join(missing)}")
+    item_col, date_col = ('"' + columns[c].replace('"', '""') + '"' for c in ['item', 'date'])
+    
+    with transaction():
+        db.execute(f"""
+            CREATE OR REPLACE TEMP TABLE wear_import AS
+            WITH raw AS (
+                SELECT row_number() OVER () AS row_num,
+                       trim(CAST({item_col} AS VARCHAR)) AS item_name,
+                       CAST({date_col} AS VARCHAR) AS raw_date
+                FROM {source}
+            ),
+            user_items AS (
+                SELECT lower(name) AS item_key, MIN(item_id) AS item_id, COUNT(*) AS matches
+                FROM Clothing_Items
+                WHERE user_id = ?
+                GROUP BY lower(name)
+            )
+            SELECT r.row_num, r.item_name, r.raw_date,
+                   COALESCE(TRY_CAST(r.raw_date AS DATE),
+                            CAST(try_strptime(r.raw_date, '%d/%m/%Y') AS DATE)) AS wear_date,
+                   u.item_id, u.matches
+            FROM raw r
+            LEFT JOIN user_items u ON lower(r.item_name) = u.item_key
+        """, [path, user_id])
+        
+        imported = db.execute(f"""
+            INSERT INTO Wear_Logs (wear_id, user_id, item_id, wear_date)
+            SELECT {next_id('Wear_Logs')}, ?, item_id, wear_date
+            FROM wear_import
+            WHERE matches = 1 AND wear_date IS NOT NULL
+        """, [user_id]).fetchone()[0]
+        # Rollup deltas straight from the staging table, so no wear ids
+        # travel back through Python
+        db.execute(wear_rollup_upsert("""
+            SELECT item_id, wear_date, 1 FROM wear_import
+            WHERE matches = 1 AND wear_date IS NOT NULL
+        """))
+        
+        touched = db.execute("""
+            SELECT DISTINCT item_id FROM wear_import
+            WHERE matches = 1 AND wear_date IS NOT NULL
+        """).fetchall()
+        refresh_item_wear_stats([row[0] for row in touched])
+        
+        rejected = db.execute("""
+            SELECT row_num, item_name, raw_date,
+                   CASE
+                       WHEN item_id IS NULL THEN 'Unknown item'
+                       WHEN matches > 1 THEN 'Ambiguous item name'
+                       ELSE 'Invalid date'
+                   END AS reason
+            FROM wear_import
+            WHERE item_id IS NULL OR matches > 1 OR wear_date IS NULL
+            ORDER BY row_num
+            LIMIT ?
+        """, [IMPORT_REJECTS_SHOWN]).fetchall()
+        rejected_total = db.execute("""
+            SELECT COUNT(*) FROM wear_import
+            WHERE item_id IS NULL OR matches > 1 OR wear_date IS NULL
+        """).fetchone()[0]
+        
+        db.execute("DROP TABLE wear_import")
+    
+    return imported, rejected_total, rejected
+
+def remove_wear_entry(user_id):
+    print("\n=== Remove Wear Log Entry ===")
+    
+    selected_log = browse(lambda direction, key: fetch_wear_log_page(user_id, direction, key),
+                          print_wear_log_page, lambda log: (log[1], log[0]),
+                          can_jump=True, select_prompt="Enter log number to remove",
+                          empty_message="No wear logs found.")
+    if selected_log is None:
+        return
+    
     confirm = input(f"\nAre you sure you want to remove this wear log? (y/n): ")
     if confirm.lower() == 'y':
-        db.execute("DELETE FROM Wear_Logs WHERE wear_id = ?", [selected_log[0]])
-        print("\nWear log removed successfully!")
+        with transaction():
+            update_wear_rollups([selected_log[0]], -1)
+            deleted = db.execute("DELETE FROM Wear_Logs WHERE wear_id = ? RETURNING item_id",
+                                 [selected_log[0]]).fetchone()
+            if deleted:
+                refresh_item_wear_stats([deleted[0]])
+        if deleted:
+            print("\nWear log removed successfully!")
+        else:
+            print("\nThat wear log has been archived and can no longer be removed.")
     else:
         print("\nOperation cancelled.")
 
@@ -158,11 +451,12 @@ def search_filter_wear_entry(user_id):
     print("Filter by:")
     print("0. Back to Main Menu")
     print("1. Item Name")
-    print("2. Category")
-    print("3. Color")
-    print("4. Size")
-    print("5. Brand")
-    print("6. Wear Date Range")
+    # The dimensions are options 2..len(DIMENSIONS) + 1
+    dimensions = list(DIMENSIONS)
+    for i, dimension in enumerate(dimensions, 2):
+        print(f"{i}. {dimension.capitalize()}")
+    date_range_choice = str(len(dimensions) + 2)
+    print(f"{date_range_choice}. Wear Date Range")
     
     choice = input("Enter choice: ")
     
@@ -171,18 +465,7 @@ def search_filter_wear_entry(user_id):
 
     if choice == '1':
         # Fetch items with full details for the selection table
-        items = db.execute("""
-            SELECT DISTINCT i.item_id, i.name, c.name as category, 
-                   co.name as color, s.name as size, b.name as brand
-            FROM Clothing_Items i
-            JOIN Wear_Logs l ON i.item_id = l.item_id
-            JOIN Categories c ON i.category_id = c.category_id
-            JOIN Colors co ON i.color_id = co.color_id
-            JOIN Sizes s ON i.size_id = s.size_id
-            JOIN Brands b ON i.brand_id = b.brand_id
-            WHERE i.user_id = ?
-            ORDER BY i.name
-        """, [user_id]).fetchall()
+        items = run("worn_items", [user_id]).fetchall()
         
         print("\nSelect item:")
         print("0. Back to Main Menu")
@@ -213,12 +496,7 @@ def search_filter_wear_entry(user_id):
             print("Invalid choice. Please try again.")
         
         # Fetch only dates for the selected item
-        dates = db.execute("""
-            SELECT wear_date
-            FROM Wear_Logs
-            WHERE item_id = ? AND user_id = ?
-            ORDER BY wear_date DESC
-        """, (item_id, user_id)).fetchall()
+        dates = run("wear_dates_by_item", [item_id, user_id]).fetchall()
         
         if not dates:
             print("\nNo wear logs found for this item.")
@@ -231,7 +509,7 @@ def search_filter_wear_entry(user_id):
     # Logic for other filters (Date Range, Category, Color, etc.)
     logs = []
     
-    if choice == '6':
+    if choice == date_range_choice:
         while True:
             try:
                 start_date = input("Enter start date (dd/mm/yyyy): ")
@@ -244,58 +522,27 @@ def search_filter_wear_entry(user_id):
             except ValueError:
                 print("Invalid date format. Please use dd/mm/yyyy")
         
-        logs = db.execute("""
-            SELECT w.wear_date, i.name, c.name as category, 
-                   co.name as color, s.name as size, b.name as brand
-            FROM Wear_Logs w
-            JOIN Clothing_Items i ON w.item_id = i.item_id
-            JOIN Categories c ON i.category_id = c.category_id
-            JOIN Colors co ON i.color_id = co.color_id
-            JOIN Sizes s ON i.size_id = s.size_id
-            JOIN Brands b ON i.brand_id = b.brand_id
-            WHERE w.user_id = ? AND w.wear_date BETWEEN CAST(? AS DATE) AND CAST(? AS DATE)
-            ORDER BY w.wear_date DESC
-        """, (user_id, start, end)).fetchall()
+        logs = run("wear_logs_by_date_range", [user_id, start, end, start, end]).fetchall()
 
-    elif choice in ["2", "3", "4", "5"]:
-        tables = {
-            "2": ("Categories", "category"),
-            "3": ("Colors", "color"),
-            "4": ("Sizes", "size"),
-            "5": ("Brands", "brand")
-        }
-        
-        table_name, field_name = tables[choice]
-        options = db.execute(f"SELECT * FROM {table_name} WHERE user_id = ?", 
-                           [user_id]).fetchall()
+    elif choice.isdigit() and 2 <= int(choice) <= len(dimensions) + 1:
+        field_name = dimensions[int(choice) - 2]
+        options = get_dimension(user_id, DIMENSIONS[field_name][0])
         
         print(f"\nSelect {field_name}:")
         for i, option in enumerate(options, 1):
-            print(f"{i}. {option[2]}")
+            print(f"{i}. {option[1]}")
         
         while True:
             try:
                 filter_choice = int(input("Enter number: "))
                 if 1 <= filter_choice <= len(options):
                     filter_id = options[filter_choice-1][0]
-                    id_field = f"{field_name}_id"
                     break
             except ValueError:
                 pass
             print("Invalid choice. Please try again.")
             
-        logs = db.execute(f"""
-            SELECT w.wear_date, i.name, c.name as category, 
-                   co.name as color, s.name as size, b.name as brand
-            FROM Wear_Logs w
-            JOIN Clothing_Items i ON w.item_id = i.item_id
-            JOIN Categories c ON i.category_id = c.category_id
-            JOIN Colors co ON i.color_id = co.color_id
-            JOIN Sizes s ON i.size_id = s.size_id
-            JOIN Brands b ON i.brand_id = b.brand_id
-            WHERE w.user_id = ? AND i.{id_field} = ?
-            ORDER BY w.wear_date DESC
-        """, (user_id, filter_id)).fetchall()
+        logs = run(f"wear_logs_by_{field_name}", [user_id, filter_id]).fetchall()
     
     if not logs:
         print("\nNo matching wear logs found.")